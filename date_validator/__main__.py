@@ -0,0 +1,260 @@
+"""
+    File that contains the command line interface to validate the dates in a
+    file, or the standard input, one date per line.
+
+    Usage:
+    __________
+
+    python -m date_validator [-h] [--ampm] [--cache CACHE]
+                             [--encoding ENCODING]
+                             [--engine {codegen,matcher,regex,stream}]
+                             [--invalid INVALID] [--numbers] [--valid VALID]
+                             dformat [input]
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+import argparse
+import codecs
+import sys
+import time
+
+from typing import Optional
+
+# User defined.
+import date_validator.errors.errors_general as eg
+import date_validator.validation.validation_cache as vca
+import date_validator.validation.validation_codegen as vc
+import date_validator.validation.validation_date as dv
+import date_validator.validation.validation_regex as vr
+import date_validator.validation.validation_stream as vs
+
+# ##############################################################################
+# Constants
+# ##############################################################################
+
+# The number of bytes read from, or written to, the files at once.
+BUFFER_SIZE = 1 << 20
+
+# The classes that can validate the dates.
+ENGINES = {
+    "codegen": vc.GeneratedMatcher,
+    "matcher": dv.FormatMatcher,
+    "regex": vr.RegexMatcher,
+    "stream": vs.StreamMatcher,
+}
+
+# ##############################################################################
+# Functions
+# ##############################################################################
+
+# ------------------------------------------------------------------------------
+# Get Functions
+# ------------------------------------------------------------------------------
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """
+        Gets the parser of the command line arguments.
+
+        :return: The parser of the command line arguments.
+    """
+
+    # Auxiliary variables.
+    parser = argparse.ArgumentParser(
+        prog="python -m date_validator",
+        description=(
+            "Validates the dates in a file, one date per line, against a date "
+            "format. The throughput is printed to the standard error."
+        ),
+    )
+
+    # Add the arguments.
+    parser.add_argument(
+        "dformat", help="the format in which the dates should be given."
+    )
+    parser.add_argument(
+        "input", nargs="?", default="-",
+        help="the file with the dates; the standard input, if not given or -."
+    )
+    parser.add_argument(
+        "--ampm", action="store_true",
+        help="the time is given in 12-hr format."
+    )
+    parser.add_argument(
+        "--cache", type=int, default=0,
+        help="the number of recently seen dates whose results are cached; "
+             "no cache, if not given or 0."
+    )
+    parser.add_argument(
+        "--encoding", default="utf-8",
+        help="the encoding of the file; utf-8 by default, in which case the "
+             "lines are validated as bytes, without being decoded."
+    )
+    parser.add_argument(
+        "--engine", choices=sorted(ENGINES), default="matcher",
+        help="the engine that validates the dates; matcher by default."
+    )
+    parser.add_argument(
+        "--invalid", default=None,
+        help="the file where the invalid lines are written; - for the "
+             "standard output. Discarded, if not given. The same file as the "
+             "valid lines is shared with them."
+    )
+    parser.add_argument(
+        "--numbers", action="store_true",
+        help="write the line numbers, starting at 1, instead of the lines."
+    )
+    parser.add_argument(
+        "--valid", default="-",
+        help="the file where the valid lines are written; the standard "
+             "output, if not given or -."
+    )
+
+    return parser
+
+
+# ------------------------------------------------------------------------------
+# Main Functions
+# ------------------------------------------------------------------------------
+
+
+def main(argv: Optional[list] = None) -> int:
+    """
+        Validates the dates in the requested file, one date per line, and
+        writes the valid and invalid lines, or line numbers, to the requested
+        files.
+
+        :param argv: The command line arguments; the ones given to the
+         program, if None.
+
+        :return: The exit status; 0, if the program finished, 2, if the date
+         format, or the encoding, is not valid, or a file cannot be opened.
+    """
+
+    # //////////////////////////////////////////////////////////////////////////
+    # Auxiliary Functions
+    # //////////////////////////////////////////////////////////////////////////
+
+    def open_0(path_0: Optional[str], mode_0: str):
+        """
+            Opens the given file, in binary mode, with a large buffer.
+
+            :param path_0: The path to the file; - for the standard input or
+             output; None, if no file must be opened.
+
+            :param mode_0: The mode in which the file is opened, 'rb' or 'wb'.
+
+            :return: The opened file; None, if no file must be opened.
+        """
+
+        # No file must be opened.
+        if path_0 is None:
+            return None
+
+        # The standard input or output.
+        if path_0 == "-":
+            stream_0 = sys.stdin if mode_0 == "rb" else sys.stdout
+            return open(stream_0.fileno(), mode_0, BUFFER_SIZE, closefd=False)
+
+        return open(path_0, mode_0, BUFFER_SIZE)
+
+    # //////////////////////////////////////////////////////////////////////////
+    # Implementation
+    # //////////////////////////////////////////////////////////////////////////
+
+    # Auxiliary variables.
+    arguments = get_parser().parse_intermixed_args(argv)
+    streams = []
+    nbytes = 0
+    nlines = 0
+    nvalid = 0
+
+    try:
+        # Get the engine.
+        engine = ENGINES[arguments.engine]
+        if arguments.cache > 0:
+            validate = vca.CachedMatcher(
+                arguments.dformat, arguments.ampm, engine, arguments.cache
+            ).validate
+        else:
+            validate = engine(arguments.dformat, arguments.ampm).validate
+
+        # The UTF-8 lines are validated as bytes, without being decoded.
+        encoding = codecs.lookup(arguments.encoding).name
+        encoding = None if encoding == "utf-8" else encoding
+
+        # Open the files; the valid and invalid lines share the file, if it
+        # is the same one.
+        source = open_0(arguments.input, "rb")
+        streams.append(source)
+
+        valid = open_0(arguments.valid, "wb")
+        streams.append(valid)
+
+        if arguments.invalid == arguments.valid:
+            invalid = valid
+        else:
+            invalid = open_0(arguments.invalid, "wb")
+            streams.append(invalid)
+
+    except (eg.LazyMessageError, LookupError, OSError, ValueError) as error:
+        for stream in streams:
+            if stream is not None:
+                stream.close()
+
+        print(str(error).strip(), file=sys.stderr)
+        return 2
+
+    outputs = (invalid, valid)
+
+    # Validate each line.
+    start = time.perf_counter()
+    try:
+        for nlines, line in enumerate(source, start=1):
+            nbytes += len(line)
+
+            # Validate the date.
+            date = line.rstrip(b"\r\n")
+            if encoding is not None:
+                date = date.decode(encoding, "replace")
+
+            result = validate(date)
+            nvalid += result
+
+            # Write the line, or line number.
+            output = outputs[result]
+            if output is not None:
+                if arguments.numbers:
+                    output.write(b"%d\n" % nlines)
+                elif line.endswith(b"\n"):
+                    output.write(line)
+                else:
+                    output.write(line + b"\n")
+
+    finally:
+        for stream in streams:
+            if stream is not None:
+                stream.close()
+
+    # Print the throughput.
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    print(
+        f"{nlines} lines, {nvalid} valid, {nlines - nvalid} invalid, in "
+        f"{elapsed:.3f} s: {nlines / elapsed:,.0f} lines/s, "
+        f"{nbytes / elapsed / 1e6:,.2f} MB/s.",
+        file=sys.stderr
+    )
+
+    return 0
+
+# ##############################################################################
+# Main Program
+# ##############################################################################
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,467 @@
+"""
+    File that contains the memory benchmarks of the engines that validate the
+    dates, measured with tracemalloc; the peak memory of validating many
+    dates, the memory of holding many validator objects and the memory of the
+    intermediate objects of DateValidator. The results are given in bytes per
+    item, can be written as JSON, and compared against the results of a
+    previous run.
+
+    Usage:
+    __________
+
+    python -m date_validator.benchmarks.benchmarks_memory [-h]
+                             [--baseline BASELINE] [--count COUNT]
+                             [--engines ENGINE [ENGINE ...]]
+                             [--output OUTPUT] [--seed SEED]
+                             [--tolerance TOLERANCE]
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+import argparse
+import gc
+import json
+import platform
+import sys
+import tracemalloc
+
+from typing import Callable, Optional
+
+# User defined.
+import date_validator.benchmarks.benchmarks_throughput as bt
+import date_validator.testing.testing_corpus as tc
+import date_validator.validation.validation_date as dv
+import date_validator.validation.validation_format as vf
+import date_validator.validation.validation_general as vg
+import date_validator.validation.validation_tokens as vt
+
+# ##############################################################################
+# Constants
+# ##############################################################################
+
+# The default number of dates validated, and of objects held, by each
+# benchmark.
+COUNT = 1000000
+
+# The rate of invalid dates.
+INVALID_RATE = 0.1
+
+# The default relative increase of the bytes per item, against the baseline,
+# that is a regression; one byte per item is always allowed.
+TOLERANCE = 0.10
+
+# The fields that identify a benchmark.
+KEYS = ("scenario", "format", "ampm", "name")
+
+# The objects whose memory is measured by holding many of them.
+OBJECTS = (
+    "DateValidator", "FormatValidator", "FormatMatcher", "field dictionary",
+    "field strings"
+)
+
+# The objects that are slow to build, and the number of them that are held;
+# their memory per object doesn't depend on the number of objects.
+SAMPLED = ("FormatValidator", "field dictionary", "field strings")
+SAMPLE = 10000
+
+# ##############################################################################
+# Functions
+# ##############################################################################
+
+# ------------------------------------------------------------------------------
+# Benchmark Functions
+# ------------------------------------------------------------------------------
+
+
+def compare(
+    results: dict, baseline: dict, tolerance: float = TOLERANCE
+) -> list:
+    """
+        Compares the results of a run against the results of a previous run.
+
+        :param results: The results of the run, as given by run_all.
+
+        :param baseline: The results of the previous run, as given by run_all.
+
+        :param tolerance: The relative increase of the bytes per item that is
+         a regression, e.g., 0.1 for 10 %; one byte per item is always
+         allowed.
+
+        :return: The list with a dictionary per benchmark found in both runs;
+         the benchmark keys, the bytes per item of both runs and the boolean
+         flag that indicates if it is a regression.
+    """
+
+    # Auxiliary variables.
+    comparison = []
+    previous = {get_key(result): result for result in baseline["results"]}
+
+    # Compare each benchmark.
+    for result in results["results"]:
+        key = get_key(result)
+        if key not in previous:
+            continue
+
+        limit = previous[key]["bytes_per_item"] * (1 + tolerance) + 1
+        comparison.append({
+            **{name: result[name] for name in KEYS},
+            "baseline": previous[key]["bytes_per_item"],
+            "bytes_per_item": result["bytes_per_item"],
+            "regression": result["bytes_per_item"] > limit,
+        })
+
+    return comparison
+
+
+def measure_held(build: Callable, items: list) -> dict:
+    """
+        Measures the memory of holding the objects built from the given
+        items; the memory of the items themselves is not included.
+
+        :param build: The function that builds an object from an item.
+
+        :param items: The list with the items.
+
+        :return: The dictionary with the total bytes and the bytes per object.
+    """
+
+    # Auxiliary variables.
+    held = [None] * len(items)
+
+    # Build and hold the objects.
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        for i, item in enumerate(items):
+            held[i] = build(item)
+
+        total = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "bytes": total,
+        "bytes_per_item": round(total / max(len(items), 1), 2),
+    }
+
+
+def measure_run(run: Callable, dates: list) -> dict:
+    """
+        Measures the peak memory of validating the dates, and the memory that
+        is kept afterwards, besides the result; the memory of the dates
+        themselves is not included.
+
+        :param run: The function that validates the list of dates.
+
+        :param dates: The list with the dates.
+
+        :return: The dictionary with the peak bytes, the peak bytes per date
+         and the bytes kept after the run.
+    """
+
+    # Validate the dates.
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        run(dates)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "bytes": peak - start,
+        "bytes_per_item": round((peak - start) / max(len(dates), 1), 2),
+        "retained": current - start,
+    }
+
+
+def run_all(
+    count: int = COUNT, engines: tuple = bt.ENGINES, seed: int = 0
+) -> dict:
+    """
+        Runs every benchmark; every engine validating the dates of every
+        representative date format, and every object held, for every
+        representative date format.
+
+        :param count: The number of dates validated, and of objects held, by
+         each benchmark; up to SAMPLE, for the objects in SAMPLED.
+
+        :param engines: The names of the engines to be measured.
+
+        :param seed: The seed of the generated dates.
+
+        :return: The dictionary with the environment and the list of results;
+         the engines that don't support a date format are left out.
+    """
+
+    # Auxiliary variables.
+    results = []
+
+    # Run each benchmark.
+    for dformat, ampm in bt.FORMATS:
+        dates = tc.get_dates(dformat, ampm, count, INVALID_RATE, seed)
+        common = {"format": dformat, "ampm": ampm}
+
+        # Validate the dates.
+        for engine in engines:
+            try:
+                run = bt.get_runner(dformat, ampm, engine)
+            except (ImportError, ValueError):
+                continue
+
+            results.append({
+                "scenario": "validate", **common, "name": engine,
+                **measure_run(run, dates)
+            })
+
+        # Hold the objects.
+        for name in OBJECTS:
+            items = dates[:SAMPLE] if name in SAMPLED else dates
+            results.append({
+                "scenario": "hold", **common, "name": name,
+                **measure_held(get_builder(dformat, ampm, name), items)
+            })
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "count": count,
+        "seed": seed,
+        "results": results,
+    }
+
+# ------------------------------------------------------------------------------
+# Get Functions
+# ------------------------------------------------------------------------------
+
+
+def get_builder(dformat: str, ampm: bool, name: str) -> Callable:
+    """
+        Gets the function that builds one of the objects in OBJECTS from a
+        date.
+
+        :param dformat: The date format.
+
+        :param ampm: The boolean flag that indicates if the time is given in
+         12-hr or 24-hr format.
+
+        :param name: The name of the object, one of OBJECTS.
+
+        :raise ValueError: If the object doesn't exist.
+
+        :return: The function that takes a date, and returns the object.
+    """
+
+    # //////////////////////////////////////////////////////////////////////////
+    # Auxiliary Functions
+    # //////////////////////////////////////////////////////////////////////////
+
+    def build_validator_0(date_0: str) -> dv.DateValidator:
+        """
+            Gets a date validator of the date.
+        """
+        return dv.DateValidator(date_0, dformat, ampm)
+
+    def build_format_0(date_0: str) -> vf.FormatValidator:
+        """
+            Gets a format validator of the date format.
+        """
+        return vf.FormatValidator(dformat, ampm)
+
+    def build_dictionary_0(date_0: str) -> dict:
+        """
+            Gets the field dictionary DateValidator builds for the date, with
+            the strings of the fields.
+        """
+
+        # Split the date into the spans of its fields.
+        spans_0 = vt.split(plan, date_0)
+
+        # The separators, or the length of the fields, are different.
+        if spans_0.__class__ is not tuple:
+            return None
+
+        # The same dictionary as DateValidator.reason, with every field.
+        dictionary_0 = dict.fromkeys(vg.FIELD_INDEX, "")
+        for field_0 in plan.fields:
+            start_0, end_0 = spans_0[vg.FIELD_INDEX[field_0]]
+            dictionary_0[field_0] = date_0[start_0:end_0]
+
+        return dictionary_0
+
+    def build_matcher_0(date_0: str) -> dv.FormatMatcher:
+        """
+            Gets a format matcher of the date format.
+        """
+        return dv.FormatMatcher(dformat, ampm)
+
+    def build_strings_0(date_0: str) -> tuple:
+        """
+            Gets the tuple with the strings of the fields DateValidator
+            extracts from the date.
+        """
+
+        # The fields are extracted, but only their strings are held.
+        dictionary_0 = build_dictionary_0(date_0)
+        if dictionary_0 is None:
+            return None
+
+        return tuple(value for value in dictionary_0.values() if value)
+
+    # //////////////////////////////////////////////////////////////////////////
+    # Implementation
+    # //////////////////////////////////////////////////////////////////////////
+
+    # Auxiliary variables.
+    plan = vf.FormatValidator.compile(dformat, ampm)
+
+    # Get the builder.
+    if name == "DateValidator":
+        return build_validator_0
+
+    if name == "FormatValidator":
+        return build_format_0
+
+    if name == "FormatMatcher":
+        return build_matcher_0
+
+    if name == "field dictionary":
+        return build_dictionary_0
+
+    if name == "field strings":
+        return build_strings_0
+
+    raise ValueError(f"The object '{name}' doesn't exist.")
+
+
+def get_key(result: dict) -> tuple:
+    """
+        Gets the fields that identify a benchmark.
+
+        :param result: The result of the benchmark.
+
+        :return: The tuple with the scenario, the date format, the 12-hr
+         format flag and the name of the engine, or object.
+    """
+    return tuple(result[name] for name in KEYS)
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """
+        Gets the parser of the command line arguments.
+
+        :return: The parser of the command line arguments.
+    """
+
+    # Auxiliary variables.
+    parser = argparse.ArgumentParser(
+        prog="python -m date_validator.benchmarks.benchmarks_memory",
+        description=(
+            "Measures the memory of the engines that validate the dates, and "
+            "of the validator objects, over representative date formats."
+        ),
+    )
+
+    # Add the arguments.
+    parser.add_argument(
+        "--baseline", default=None,
+        help="the JSON file with the results of a previous run to compare "
+             "against; the exit status is 1, if there is a regression."
+    )
+    parser.add_argument(
+        "--count", type=int, default=COUNT,
+        help=f"the number of dates validated, and of objects held, by each "
+             f"benchmark; {COUNT} by default."
+    )
+    parser.add_argument(
+        "--engines", nargs="+", choices=bt.ENGINES, default=list(bt.ENGINES),
+        metavar="ENGINE",
+        help=f"the engines to be measured, from {', '.join(bt.ENGINES)}; all "
+             f"of them by default."
+    )
+    parser.add_argument(
+        "--output", default=None,
+        help="the file where the results are written as JSON."
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="the seed of the generated dates; 0 by default."
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=TOLERANCE,
+        help=f"the relative increase of the bytes per item, against the "
+             f"baseline, that is a regression; {TOLERANCE} by default."
+    )
+
+    return parser
+
+# ------------------------------------------------------------------------------
+# Main Functions
+# ------------------------------------------------------------------------------
+
+
+def main(argv: Optional[list] = None) -> int:
+    """
+        Runs the benchmarks, prints a table with the results and, optionally,
+        writes them as JSON and compares them against a baseline.
+
+        :param argv: The command line arguments; the ones given to the
+         program, if None.
+
+        :return: The exit status; 0, if there are no regressions, 1,
+         otherwise.
+    """
+
+    # Auxiliary variables.
+    arguments = get_parser().parse_args(argv)
+
+    # Run the benchmarks.
+    results = run_all(arguments.count, tuple(arguments.engines), arguments.seed)
+
+    # Print the results.
+    print(f"{'scenario':<10}{'format':<24}{'ampm':>6}{'name':>18}"
+          f"{'bytes':>16}{'bytes/item':>12}")
+    for result in results["results"]:
+        print(
+            f"{result['scenario']:<10}{result['format']:<24}"
+            f"{str(result['ampm']):>6}{result['name']:>18}"
+            f"{result['bytes']:>16,}{result['bytes_per_item']:>12,.2f}"
+        )
+
+    # Write the results.
+    if arguments.output is not None:
+        with open(arguments.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    # Compare against the baseline.
+    if arguments.baseline is None:
+        return 0
+
+    with open(arguments.baseline) as file:
+        comparison = compare(results, json.load(file), arguments.tolerance)
+
+    print(f"\n{'scenario':<10}{'format':<24}{'ampm':>6}{'name':>18}"
+          f"{'baseline':>12}{'bytes/item':>12}")
+    for result in comparison:
+        print(
+            f"{result['scenario']:<10}{result['format']:<24}"
+            f"{str(result['ampm']):>6}{result['name']:>18}"
+            f"{result['baseline']:>12,.2f}{result['bytes_per_item']:>12,.2f}"
+            f"{'  REGRESSION' if result['regression'] else ''}"
+        )
+
+    return int(any(result["regression"] for result in comparison))
+
+# ##############################################################################
+# Main Program
+# ##############################################################################
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,449 @@
+"""
+    File that contains the throughput benchmarks of the engines that validate
+    the dates; each engine is timed over representative date formats, with
+    different rates of invalid dates. The results are given in nanoseconds per
+    date and dates per second, can be written as JSON, and compared against
+    the results of a previous run.
+
+    Usage:
+    __________
+
+    python -m date_validator.benchmarks.benchmarks_throughput [-h]
+                             [--baseline BASELINE] [--count COUNT]
+                             [--engines ENGINE [ENGINE ...]]
+                             [--output OUTPUT] [--repeat REPEAT]
+                             [--seed SEED] [--tolerance TOLERANCE]
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+import argparse
+import json
+import platform
+import sys
+import time
+
+from typing import Callable, Optional
+
+# User defined.
+import date_validator.testing.testing_corpus as tc
+import date_validator.validation.validation_cache as vca
+import date_validator.validation.validation_codegen as vc
+import date_validator.validation.validation_date as dv
+import date_validator.validation.validation_regex as vr
+import date_validator.validation.validation_stream as vs
+import date_validator.validation.validation_vectorized as vv
+
+# ##############################################################################
+# Constants
+# ##############################################################################
+
+# The representative date formats; compact, separated, day of year based and
+# in 12-hr format.
+FORMATS = (
+    ("YYYYMMDDhhmmsst", False),
+    ("YYYY-MMM-DD;hh:mm:ss:t", False),
+    ("YYYYDDDhhmmss", False),
+    ("hhmmssii", True),
+)
+
+# The rates of invalid dates.
+INVALID_RATES = (0.0, 0.1, 0.5)
+
+# The default number of dates, and of runs, of each benchmark; the fastest
+# run is kept.
+COUNT = 100000
+REPEAT = 5
+
+# The default relative slowdown, against the baseline, that is a regression.
+TOLERANCE = 0.10
+
+# The fields that identify a benchmark.
+KEYS = ("format", "ampm", "invalid", "engine")
+
+# The classes that validate one date at a time, after compiling the date
+# format.
+MATCHERS = {
+    "codegen": vc.GeneratedMatcher,
+    "matcher": dv.FormatMatcher,
+    "regex": vr.RegexMatcher,
+    "stream": vs.StreamMatcher,
+}
+
+# The names of the engines; the matchers, the reference DateValidator, built
+# once per date, validate_many, CachedMatcher, with an empty cache on each
+# run, and the NumPy based VectorizedMatcher.
+ENGINES = ("validator", "many", "cached", "vectorized", *sorted(MATCHERS))
+
+# ##############################################################################
+# Functions
+# ##############################################################################
+
+# ------------------------------------------------------------------------------
+# Benchmark Functions
+# ------------------------------------------------------------------------------
+
+
+def benchmark(
+    dformat: str, ampm: bool, engine: str, dates: list, repeat: int = REPEAT
+) -> Optional[dict]:
+    """
+        Times an engine over the given dates.
+
+        :param dformat: The date format.
+
+        :param ampm: The boolean flag that indicates if the time is given in
+         12-hr or 24-hr format.
+
+        :param engine: The name of the engine, one of ENGINES.
+
+        :param dates: The list with the dates to be validated.
+
+        :param repeat: The number of times the dates are validated; the
+         fastest run is kept.
+
+        :return: None, if the engine doesn't support the date format.
+         Otherwise, the dictionary with the number of valid dates, the
+         nanoseconds per date and the dates per second.
+    """
+
+    # Get the engine.
+    try:
+        run = get_runner(dformat, ampm, engine)
+    except (ImportError, ValueError):
+        return None
+
+    # Time the runs.
+    best = None
+    valid = 0
+    for _ in range(max(int(repeat), 1)):
+        start = time.perf_counter_ns()
+        valid = run(dates)
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    # Get the statistics.
+    ns_per_op = max(best, 1) / max(len(dates), 1)
+
+    return {
+        "valid": valid,
+        "ns_per_op": round(ns_per_op, 1),
+        "items_per_s": round(1e9 / ns_per_op, 1),
+    }
+
+
+def compare(
+    results: dict, baseline: dict, tolerance: float = TOLERANCE
+) -> list:
+    """
+        Compares the results of a run against the results of a previous run.
+
+        :param results: The results of the run, as given by run_all.
+
+        :param baseline: The results of the previous run, as given by run_all.
+
+        :param tolerance: The relative slowdown that is a regression, e.g.,
+         0.1 for 10 %.
+
+        :return: The list with a dictionary per benchmark found in both runs;
+         the benchmark keys, the ratio of the nanoseconds per date of the run
+         over the ones of the previous run, and the boolean flag that
+         indicates if it is a regression.
+    """
+
+    # Auxiliary variables.
+    comparison = []
+    previous = {get_key(result): result for result in baseline["results"]}
+
+    # Compare each benchmark.
+    for result in results["results"]:
+        key = get_key(result)
+        if key not in previous:
+            continue
+
+        ratio = result["ns_per_op"] / max(previous[key]["ns_per_op"], 1e-9)
+        comparison.append({
+            **{name: result[name] for name in KEYS},
+            "ratio": round(ratio, 3),
+            "regression": ratio > 1 + tolerance,
+        })
+
+    return comparison
+
+
+def run_all(
+    count: int = COUNT, repeat: int = REPEAT, engines: tuple = ENGINES,
+    seed: int = 0
+) -> dict:
+    """
+        Runs every benchmark; every engine, over every representative date
+        format and rate of invalid dates.
+
+        :param count: The number of dates of each benchmark.
+
+        :param repeat: The number of times the dates are validated; the
+         fastest run is kept.
+
+        :param engines: The names of the engines to be timed.
+
+        :param seed: The seed of the generated dates.
+
+        :return: The dictionary with the environment and the list of results;
+         the engines that don't support a date format are left out.
+    """
+
+    # Auxiliary variables.
+    results = []
+
+    # Run each benchmark.
+    for dformat, ampm in FORMATS:
+        for invalid in INVALID_RATES:
+            dates = tc.get_dates(dformat, ampm, count, invalid, seed)
+
+            for engine in engines:
+                result = benchmark(dformat, ampm, engine, dates, repeat)
+                if result is None:
+                    continue
+
+                results.append({
+                    "format": dformat, "ampm": ampm, "invalid": invalid,
+                    "engine": engine, **result
+                })
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "count": count,
+        "repeat": repeat,
+        "seed": seed,
+        "results": results,
+    }
+
+# ------------------------------------------------------------------------------
+# Get Functions
+# ------------------------------------------------------------------------------
+
+
+def get_key(result: dict) -> tuple:
+    """
+        Gets the fields that identify a benchmark.
+
+        :param result: The result of the benchmark.
+
+        :return: The tuple with the date format, the 12-hr format flag, the
+         rate of invalid dates and the engine.
+    """
+    return tuple(result[name] for name in KEYS)
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """
+        Gets the parser of the command line arguments.
+
+        :return: The parser of the command line arguments.
+    """
+
+    # Auxiliary variables.
+    parser = argparse.ArgumentParser(
+        prog="python -m date_validator.benchmarks.benchmarks_throughput",
+        description=(
+            "Times the engines that validate the dates over representative "
+            "date formats and rates of invalid dates."
+        ),
+    )
+
+    # Add the arguments.
+    parser.add_argument(
+        "--baseline", default=None,
+        help="the JSON file with the results of a previous run to compare "
+             "against; the exit status is 1, if there is a regression."
+    )
+    parser.add_argument(
+        "--count", type=int, default=COUNT,
+        help=f"the number of dates of each benchmark; {COUNT} by default."
+    )
+    parser.add_argument(
+        "--engines", nargs="+", choices=ENGINES, default=list(ENGINES),
+        metavar="ENGINE",
+        help=f"the engines to be timed, from {', '.join(ENGINES)}; all of "
+             f"them by default."
+    )
+    parser.add_argument(
+        "--output", default=None,
+        help="the file where the results are written as JSON."
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=REPEAT,
+        help=f"the number of runs of each benchmark, the fastest one is "
+             f"kept; {REPEAT} by default."
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="the seed of the generated dates; 0 by default."
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=TOLERANCE,
+        help=f"the relative slowdown, against the baseline, that is a "
+             f"regression; {TOLERANCE} by default."
+    )
+
+    return parser
+
+
+def get_runner(dformat: str, ampm: bool, engine: str) -> Callable:
+    """
+        Gets the function that validates a list of dates with the given
+        engine; the date format is compiled beforehand, except for the
+        reference DateValidator, which is built once per date.
+
+        :param dformat: The date format.
+
+        :param ampm: The boolean flag that indicates if the time is given in
+         12-hr or 24-hr format.
+
+        :param engine: The name of the engine, one of ENGINES.
+
+        :raise ImportError: If the engine needs a package that is not
+         installed.
+
+        :raise ValueError: If the engine doesn't support the date format.
+
+        :return: The function that takes the list of dates, and returns the
+         number of valid dates.
+    """
+
+    # //////////////////////////////////////////////////////////////////////////
+    # Auxiliary Functions
+    # //////////////////////////////////////////////////////////////////////////
+
+    def run_cached_0(dates_0: list) -> int:
+        """
+            Validates the dates with a cached matcher, starting with an empty
+            cache, so that every run is timed in the same way.
+        """
+        matcher.cache_clear()
+        return sum(map(matcher.validate, dates_0))
+
+    def run_matcher_0(dates_0: list) -> int:
+        """
+            Validates the dates with a matcher.
+        """
+        return sum(map(validate, dates_0))
+
+    def run_many_0(dates_0: list) -> int:
+        """
+            Validates the dates with validate_many.
+        """
+        return sum(dv.validate_many(dates_0, dformat, ampm))
+
+    def run_validator_0(dates_0: list) -> int:
+        """
+            Validates the dates with a DateValidator per date.
+        """
+        return sum(dv.DateValidator(d_0, dformat, ampm)() for d_0 in dates_0)
+
+    def run_vectorized_0(dates_0: list) -> int:
+        """
+            Validates the dates as a NumPy array.
+        """
+        return int(matcher.validate(dates_0).sum())
+
+    # //////////////////////////////////////////////////////////////////////////
+    # Implementation
+    # //////////////////////////////////////////////////////////////////////////
+
+    # Engines that don't compile the date format.
+    if engine == "many":
+        return run_many_0
+
+    if engine == "validator":
+        return run_validator_0
+
+    # Engines that compile the date format.
+    if engine == "cached":
+        matcher = vca.CachedMatcher(dformat, ampm)
+        return run_cached_0
+
+    if engine == "vectorized":
+        matcher = vv.VectorizedMatcher(dformat, ampm)
+        return run_vectorized_0
+
+    if engine not in MATCHERS:
+        raise ValueError(f"The engine '{engine}' doesn't exist.")
+
+    validate = MATCHERS[engine](dformat, ampm).validate
+
+    return run_matcher_0
+
+# ------------------------------------------------------------------------------
+# Main Functions
+# ------------------------------------------------------------------------------
+
+
+def main(argv: Optional[list] = None) -> int:
+    """
+        Runs the benchmarks, prints a table with the results and, optionally,
+        writes them as JSON and compares them against a baseline.
+
+        :param argv: The command line arguments; the ones given to the
+         program, if None.
+
+        :return: The exit status; 0, if there are no regressions, 1,
+         otherwise.
+    """
+
+    # Auxiliary variables.
+    arguments = get_parser().parse_args(argv)
+
+    # Run the benchmarks.
+    results = run_all(
+        arguments.count, arguments.repeat, tuple(arguments.engines),
+        arguments.seed
+    )
+
+    # Print the results.
+    print(f"{'format':<24}{'ampm':>6}{'invalid':>9}{'engine':>12}"
+          f"{'ns/op':>12}{'items/s':>14}")
+    for result in results["results"]:
+        print(
+            f"{result['format']:<24}{str(result['ampm']):>6}"
+            f"{result['invalid']:>9.2f}{result['engine']:>12}"
+            f"{result['ns_per_op']:>12,.1f}{result['items_per_s']:>14,.0f}"
+        )
+
+    # Write the results.
+    if arguments.output is not None:
+        with open(arguments.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    # Compare against the baseline.
+    if arguments.baseline is None:
+        return 0
+
+    with open(arguments.baseline) as file:
+        comparison = compare(results, json.load(file), arguments.tolerance)
+
+    print(f"\n{'format':<24}{'ampm':>6}{'invalid':>9}{'engine':>12}"
+          f"{'ratio':>9}")
+    for result in comparison:
+        print(
+            f"{result['format']:<24}{str(result['ampm']):>6}"
+            f"{result['invalid']:>9.2f}{result['engine']:>12}"
+            f"{result['ratio']:>9.3f}"
+            f"{'  REGRESSION' if result['regression'] else ''}"
+        )
+
+    return int(any(result["regression"] for result in comparison))
+
+
+# ##############################################################################
+# Main Program
+# ##############################################################################
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,12 +6,15 @@
 # Imports
 # ##############################################################################
 
+# User defined.
+import date_validator.errors.errors_general as eg
+
 # ##############################################################################
 # Classes
 # ##############################################################################
 
 
-class DateFormatError(Exception):
+class DateFormatError(eg.LazyMessageError):
     """
         Class that contains the constructor for the exception when the date
         format is wrong.
@@ -19,6 +22,11 @@ class DateFormatError(Exception):
         Parameters:
         __________
 
+        - self.dformat: The requested date format.
+
+        - self.ampm: True, if the time being checked is in 12-hr format.
+          False, otherwise.
+
         - _MESSAGE: The standard message to be displayed. Will be customized
           further if parameters are passed to the constructor.
     """
@@ -36,12 +44,16 @@ class DateFormatError(Exception):
             The method that builds the exception.
 
             :param dformat: The requested date format.
+
+            :param ampm: True, if the time being checked is in 12-hr format.
+             False, otherwise.
         """
 
-        # Customize the message.
-        message = DateFormatError._customize(dformat, ampm)
+        super(DateFormatError, self).__init__()
 
-        super(DateFormatError, self).__init__(message)
+        # Store the date format and the 12-hr format flag.
+        self.dformat = dformat
+        self.ampm = ampm
 
     # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
     # Private Interface
@@ -57,6 +69,18 @@ class DateFormatError(Exception):
     # Methods
     # ##########################################################################
 
+    # --------------------------------------------------------------------------
+    # Render Methods
+    # --------------------------------------------------------------------------
+
+    def _render(self) -> str:
+        """
+            The method that renders the message.
+
+            :return: The message of the exception.
+        """
+        return DateFormatError._customize(self.dformat, self.ampm)
+
     # --------------------------------------------------------------------------
     # Customize Methods
     # --------------------------------------------------------------------------
@@ -5,14 +5,14 @@
 # ##############################################################################
 
 # User defined.
-import date_validator.utilities.utilities_strings as us
+import date_validator.errors.errors_general as eg
 
 # ##############################################################################
 # Classes
 # ##############################################################################
 
 
-class AmPmFormatError(Exception):
+class AmPmFormatError(eg.LazyMessageError):
     """
         Class that contains the constructor for the exception when the date
         format contains the am/pm flag, but no hour is given.
@@ -53,11 +53,10 @@ class AmPmFormatError(Exception):
         """
             The method that builds the exception.
         """
-        message = "\n" + us.to_length(self.base_message)
-        super(AmPmFormatError, self).__init__(message)
+        super(AmPmFormatError, self).__init__()
 
 
-class DayFormatError(Exception):
+class DayFormatError(eg.LazyMessageError):
     """
         Class that contains the constructor for the exception when the date
         format contains a day in the 'DD' format and a month is NOT given.
@@ -99,11 +98,10 @@ class DayFormatError(Exception):
         """
             The method that builds the exception.
         """
-        message = "\n" + us.to_length(self.base_message)
-        super(DayFormatError, self).__init__(message)
+        super(DayFormatError, self).__init__()
 
 
-class EmptyFormatError(Exception):
+class EmptyFormatError(eg.LazyMessageError):
     """
         Class that contains the constructor for the exception when the date
         format is empty.
@@ -157,15 +155,12 @@ class EmptyFormatError(Exception):
              in the date format.
         """
 
+        super(EmptyFormatError, self).__init__()
+
         # Store the valid fields and the current date format.
         self.fields = fields
         self.dformat = dformat
 
-        # Customize the message.
-        message = "\n" + us.to_length(self._customize())
-
-        super(EmptyFormatError, self).__init__(message)
-
     # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
     # Private Interface
     # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -205,7 +200,7 @@ class EmptyFormatError(Exception):
         return self.base_message + message
 
 
-class FieldFormatError(Exception):
+class FieldFormatError(eg.LazyMessageError):
     """
         Class that contains the constructor for the exception when the given
         date field format is wrong.
@@ -215,6 +210,10 @@ class FieldFormatError(Exception):
 
         - self.field: The name of the field with the error.
 
+        - self.field_format: The requested field format string.
+
+        - self.formats: The valid formats for the field.
+
         Properties:
         __________
 
@@ -255,13 +254,12 @@ class FieldFormatError(Exception):
              year.
         """
 
-        # Store the field name here.
-        self.field = field
-
-        # Customize the message.
-        message = "\n" + us.to_length(self._customize(field_format, formats))
+        super(FieldFormatError, self).__init__()
 
-        super(FieldFormatError, self).__init__(message)
+        # Store the field name, and formats, here.
+        self.field = field
+        self.field_format = field_format
+        self.formats = formats
 
     # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
     # Private Interface
@@ -275,19 +273,14 @@ class FieldFormatError(Exception):
     # Customize Methods
     # --------------------------------------------------------------------------
 
-    def _customize(self, field_format: str, formats: tuple) -> str:
+    def _customize(self) -> str:
         """
             The method that further customizes the message.
 
-            :param field_format: The requested field format string.
-
-            :param formats: The tuple that contains the valid formats for the
-             field.
-
             :return: The message with more information.
         """
 
-        fmts = list(map(lambda x: f"'{x}'", formats))
+        fmts = list(map(lambda x: f"'{x}'", self.formats))
 
         # Customize the message.
         if len(fmts) > 1:
@@ -298,8 +291,8 @@ class FieldFormatError(Exception):
             fmts = f"{fmts[0]}"
 
         message = (
-            f" The requested {self.field} format, '{field_format}', is not "
-            f"valid. The only available "
+            f" The requested {self.field} format, '{self.field_format}', is "
+            f"not valid. The only available "
             f"{'formats' if length > 1 else 'format'} for the "
             f"{self.field} field {'are' if length > 1 else 'is'} {fmts}."
         )
@@ -307,7 +300,7 @@ class FieldFormatError(Exception):
         return self.base_message + message
 
 
-class HourFormatError(Exception):
+class HourFormatError(eg.LazyMessageError):
     """
         Class that contains the constructor for the exception when the date
         format contains an hour, a year and/or a month, but not a day 'DD'
@@ -350,11 +343,10 @@ class HourFormatError(Exception):
         """
             The method that builds the exception.
         """
-        message = "\n" + us.to_length(self.base_message)
-        super(HourFormatError, self).__init__(message)
+        super(HourFormatError, self).__init__()
 
 
-class MinutesFormatError(Exception):
+class MinutesFormatError(eg.LazyMessageError):
     """
         Class that contains the constructor for the exception when the date
         format contains a minute field, a year, a month and/or a day, but
@@ -397,11 +389,10 @@ class MinutesFormatError(Exception):
         """
             The method that builds the exception.
         """
-        message = "\n" + us.to_length(self.base_message)
-        super(MinutesFormatError, self).__init__(message)
+        super(MinutesFormatError, self).__init__()
 
 
-class RepeatedFieldsError(Exception):
+class RepeatedFieldsError(eg.LazyMessageError):
     """
         Class that contains the constructor for the exception when there is one,
         or more, repeated fields.
@@ -446,14 +437,11 @@ class RepeatedFieldsError(Exception):
             :param fields: The requested fields.
         """
 
+        super(RepeatedFieldsError, self).__init__()
+
         # Store the field name here.
         self.fields = fields
 
-        # Customize the message.
-        message = "\n" + us.to_length(self._customize())
-
-        super(RepeatedFieldsError, self).__init__(message)
-
     # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
     # Private Interface
     # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -517,7 +505,7 @@ class RepeatedFieldsError(Exception):
         return indexes
 
 
-class SecondsFormatError(Exception):
+class SecondsFormatError(eg.LazyMessageError):
     """
         Class that contains the constructor for the exception when the date
         format contains a minute field, a year, a month, a day and/or an hour,
@@ -561,11 +549,10 @@ class SecondsFormatError(Exception):
         """
             The method that builds the exception.
         """
-        message = "\n" + us.to_length(self.base_message)
-        super(SecondsFormatError, self).__init__(message)
+        super(SecondsFormatError, self).__init__()
 
 
-class TenthsFormatError(Exception):
+class TenthsFormatError(eg.LazyMessageError):
     """
         Class that contains the constructor for the exception when the date
         format contains a minute field, a year, a month, a day, hours and/or
@@ -609,5 +596,4 @@ class TenthsFormatError(Exception):
         """
             The method that builds the exception.
         """
-        message = "\n" + us.to_length(self.base_message)
-        super(TenthsFormatError, self).__init__(message)
+        super(TenthsFormatError, self).__init__()
@@ -0,0 +1,134 @@
+"""
+    File that contains the base class of the date validator custom exceptions.
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# User defined.
+import date_validator.utilities.utilities_strings as us
+
+# ##############################################################################
+# Classes
+# ##############################################################################
+
+
+class LazyMessageError(Exception):
+    """
+        Class that contains the base of the exceptions whose message is
+        rendered lazily; the message is rendered the first time it is read,
+        with str() or args, and kept. The subclasses store their structured
+        attributes in the constructor, and customize the message in
+        _customize, or _render, from them.
+
+        The exceptions that are caught and discarded never render their
+        message.
+    """
+
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+    # Public Interface
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+    # ##########################################################################
+    # Properties
+    # ##########################################################################
+
+    @property
+    def args(self) -> tuple:
+        """
+            Returns the arguments of the exception, rendering the message if
+            it has not been rendered yet.
+
+            :return: The tuple with the message of the exception.
+        """
+        self.__render()
+        return Exception.args.__get__(self)
+
+    @args.setter
+    def args(self, args: tuple) -> None:
+        """
+            Sets the arguments of the exception; the message is no longer
+            rendered.
+
+            :param args: The new arguments of the exception.
+        """
+        Exception.args.__set__(self, args)
+        self.__rendered = True
+
+    # ##########################################################################
+    # Constructor
+    # ##########################################################################
+
+    def __init__(self):
+        """
+            The method that builds the exception, without its message.
+        """
+
+        # The arguments given to the subclass are not the message.
+        super(LazyMessageError, self).__init__()
+
+        self.__rendered = False
+
+    def __repr__(self) -> str:
+        """
+            The representation of the exception, with its message.
+
+            :return: The representation of the exception.
+        """
+        self.__render()
+        return Exception.__repr__(self)
+
+    def __str__(self) -> str:
+        """
+            The message of the exception.
+
+            :return: The message of the exception.
+        """
+        self.__render()
+        return Exception.__str__(self)
+
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+    # Private Interface
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+    # ##########################################################################
+    # Methods
+    # ##########################################################################
+
+    # --------------------------------------------------------------------------
+    # Render Methods
+    # --------------------------------------------------------------------------
+
+    def __render(self) -> None:
+        """
+            Renders the message, only the first time it is requested.
+        """
+
+        # The message is already rendered.
+        if self.__dict__.get("_LazyMessageError__rendered", True):
+            return
+
+        self.args = (self._render(),)
+
+    def _render(self) -> str:
+        """
+            The method that renders the message; the customized message, set
+            to the maximum line length.
+
+            :return: The message of the exception.
+        """
+        return "\n" + us.to_length(self._customize())
+
+    # --------------------------------------------------------------------------
+    # Customize Methods
+    # --------------------------------------------------------------------------
+
+    def _customize(self) -> str:
+        """
+            The method that customizes the message; the base message, unless
+            overridden by the subclasses.
+
+            :return: The customized message.
+        """
+        return self.base_message
@@ -0,0 +1,607 @@
+"""
+    File that contains the generator of synthetic dates, for load testing;
+    deterministic streams of dates in any date format, that mix valid dates
+    with edge cases and invalid dates at controlled rates.
+
+    Usage:
+    __________
+
+    python -m date_validator.testing.testing_corpus [-h] [--ampm]
+                             [--rate KIND=RATE [KIND=RATE ...]] [--seed SEED]
+                             dformat count [output]
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+import argparse
+import bisect
+import itertools
+import random
+import sys
+
+from typing import Any, Iterator, Optional
+
+# User defined.
+import date_validator.errors.errors_general as eg
+import date_validator.utilities.utilities_calendar as uc
+import date_validator.validation.validation_format as vf
+import date_validator.validation.validation_general as vg
+
+# ##############################################################################
+# Constants
+# ##############################################################################
+
+# The kinds of dates, besides the valid ones; the leap days and the edge days
+# of the year, which can be valid or not, and the dates that are meant to be
+# invalid, with a bad separator, an out of range hour or truncated.
+KINDS = ("leap_day", "day_of_year", "separator", "hour", "truncated")
+INVALID_KINDS = ("separator", "hour", "truncated")
+
+# The default rate of each kind of date; the rest of the dates are valid.
+RATES = {kind: 0.05 for kind in KINDS}
+
+# The number of dates written to a file at once.
+CHUNK_SIZE = 65536
+
+# The characters that replace the separators.
+BAD_SEPARATORS = "#/.x0"
+
+# ##############################################################################
+# Classes
+# ##############################################################################
+
+
+class CorpusGenerator:
+    """
+        Class that generates deterministic streams of dates in a single date
+        format; the same seed always gives the same dates. Each date is either
+        valid, or of one of the KINDS, with the requested rate.
+
+        The kinds that don't apply to the date format, e.g., a leap day in a
+        date format without days, give valid dates; the invalid kinds give
+        truncated dates instead.
+    """
+
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+    # Public Interface.
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+    # ##########################################################################
+    # Properties
+    # ##########################################################################
+
+    @property
+    def plan(self) -> vf.FormatPlan:
+        """
+            Returns the compiled plan of the date format.
+
+            :return: The compiled plan of the date format.
+        """
+        return self.__plan
+
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def rates(self) -> dict:
+        """
+            Returns the rate of each kind of date.
+
+            :return: The dictionary with the rate of each kind of date.
+        """
+        return dict(self.__rates)
+
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def seed(self) -> int:
+        """
+            Returns the seed of the random numbers.
+
+            :return: The seed of the random numbers.
+        """
+        return self.__seed
+
+    # ##########################################################################
+    # Constructor
+    # ##########################################################################
+
+    def __init__(
+        self, dformat: Any, ampm: Any, rates: Optional[dict] = None,
+        seed: int = 0
+    ):
+        """
+            Initializes the variables of the corpus generator.
+
+            :param dformat: The string that represents the format in which the
+             dates are given; must be a valid date format.
+
+            :param ampm: The boolean flag that indicates if the time is given
+             in 12-hr or 24-hr format. True, if the time is given in 12-hr
+             format; False, otherwise.
+
+            :param rates: The dictionary with the rate, from 0 to 1, of each
+             kind of date in KINDS; the rest of the dates are valid. RATES,
+             if not given.
+
+            :param seed: The seed of the random numbers.
+
+            :raise ValueError: If a kind doesn't exist, or the rates are not
+             between 0 and 1.
+        """
+
+        # Compile the date format.
+        self.__plan = vf.FormatValidator.compile(
+            str(dformat).strip(), bool(ampm)
+        )
+        self.__seed = int(seed)
+
+        # Validate the rates.
+        self.__rates = dict(RATES if rates is None else rates)
+        for kind, rate in self.__rates.items():
+            if kind not in KINDS:
+                raise ValueError(
+                    f"The kind of date '{kind}' doesn't exist; valid kinds "
+                    f"are: {', '.join(KINDS)}."
+                )
+
+            if not 0 <= rate <= 1:
+                raise ValueError(
+                    f"The rate of the '{kind}' dates must be between 0 and 1."
+                )
+
+        if sum(self.__rates.values()) > 1:
+            raise ValueError("The rates must add up to 1, at most.")
+
+        # The kind of date picked by a random number.
+        kinds = [kind for kind in KINDS if self.__rates.get(kind, 0) > 0]
+        self.__kinds = (*kinds, "valid")
+        self.__cumulative = tuple(
+            itertools.accumulate(self.__rates[kind] for kind in kinds)
+        )
+
+        # The pieces of the date format, and the piece of each field.
+        self.__pieces = []
+        self.__slots = {}
+        start = 0
+        for field in self.__plan.fields:
+            place = self.__plan.dformat.index(field, start)
+            self.__pieces.append(self.__plan.dformat[start:place])
+            self.__slots[field] = len(self.__pieces)
+            self.__pieces.append(field)
+            start = place + len(field)
+
+        self.__pieces.append(self.__plan.dformat[start:])
+
+    def __iter__(self) -> Iterator[str]:
+        """
+            Generates an endless stream of dates.
+
+            :return: The iterator over the dates.
+        """
+        return self.generate()
+
+    # ##########################################################################
+    # Methods
+    # ##########################################################################
+
+    # --------------------------------------------------------------------------
+    # Generate Methods
+    # --------------------------------------------------------------------------
+
+    def generate(self, count: Optional[int] = None) -> Iterator[str]:
+        """
+            Generates the dates lazily; the stream starts over, with the same
+            dates, each time.
+
+            :param count: The number of dates; an endless stream, if None.
+
+            :return: The iterator over the dates.
+        """
+
+        # Auxiliary variables.
+        generator = random.Random(self.__seed)
+        kinds = self.__kinds
+        cumulative = self.__cumulative
+        get_date = self._get_date
+        counter = itertools.repeat(None) if count is None else (
+            itertools.repeat(None, count)
+        )
+
+        # Generate each date.
+        for _ in counter:
+            kind = kinds[bisect.bisect(cumulative, generator.random())]
+            yield get_date(kind, generator)
+
+    # --------------------------------------------------------------------------
+    # Write Methods
+    # --------------------------------------------------------------------------
+
+    def write(self, path: str, count: int, encoding: str = "utf-8") -> int:
+        """
+            Writes the dates to a file, one date per line.
+
+            :param path: The path to the file; - for the standard output.
+
+            :param count: The number of dates.
+
+            :param encoding: The encoding of the file; UTF-8 by default.
+
+            :return: The number of bytes written.
+        """
+
+        # Auxiliary variables.
+        dates = self.generate(count)
+        nbytes = 0
+
+        # Open the file.
+        if path == "-":
+            file = open(sys.stdout.fileno(), "wb", closefd=False)
+        else:
+            file = open(path, "wb")
+
+        # Write the dates in large chunks.
+        with file:
+            while True:
+                chunk = list(itertools.islice(dates, CHUNK_SIZE))
+                if not chunk:
+                    break
+
+                chunk.append("")
+                data = "\n".join(chunk).encode(encoding)
+                nbytes += file.write(data)
+
+        return nbytes
+
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+    # Private Interface.
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+    # ##########################################################################
+    # Methods
+    # ##########################################################################
+
+    # --------------------------------------------------------------------------
+    # Get Methods
+    # --------------------------------------------------------------------------
+
+    def _get_date(self, kind: str, generator: random.Random) -> str:
+        """
+            Gets a date of the given kind.
+
+            :param kind: The kind of date; 'valid', or one of KINDS.
+
+            :param generator: The generator of random numbers.
+
+            :return: The date.
+        """
+
+        # Auxiliary variables.
+        fields = self.__slots
+        values = self._get_values(generator)
+        next_random = generator.random
+
+        # The kinds that don't apply to the date format.
+        if kind == "hour" and "hh" not in fields:
+            kind = "truncated"
+
+        # Change the values of the fields.
+        if kind == "leap_day":
+            self._set_leap_day(values, generator)
+
+        elif kind == "day_of_year":
+            self._set_day_of_year(values, generator)
+
+        elif kind == "hour":
+            if not self.__plan.ampm:
+                hour = 24 + int(next_random() * 76)
+            elif values["ii"] == "m":
+                hour = (0, 1, 11, 13)[int(next_random() * 4)]
+            else:
+                hour = (0, 13, 24, 99)[int(next_random() * 4)]
+
+            values["hh"] = _NUMBERS[2][hour]
+
+        # Put the fields in their place.
+        pieces = self.__pieces[:]
+        for field, slot in fields.items():
+            pieces[slot] = values[field]
+
+        # Change the date.
+        if kind == "separator":
+            return self._get_bad_separator(pieces, generator)
+
+        date = "".join(pieces)
+
+        if kind == "truncated":
+            return date[:int(next_random() * len(date))]
+
+        return date
+
+    def _get_bad_separator(self, pieces: list, generator: random.Random) -> str:
+        """
+            Gets the date with a bad separator; a separator is replaced, or,
+            if there are no separators, a separator is inserted.
+
+            :param pieces: The pieces of the date.
+
+            :param generator: The generator of random numbers.
+
+            :return: The date with the bad separator.
+        """
+
+        # Auxiliary variables.
+        slots = [i for i in range(0, len(pieces), 2) if pieces[i]]
+
+        # Insert a separator between two fields.
+        if not slots:
+            i = 2 * int(generator.random() * (len(pieces) // 2 - 1)) + 2
+            pieces[i] = generator.choice("-:/ ")
+            return "".join(pieces)
+
+        # Replace a separator character with a different one.
+        i = generator.choice(slots)
+        j = int(generator.random() * len(pieces[i]))
+        choices = [c for c in BAD_SEPARATORS if c != pieces[i][j]]
+        piece = pieces[i]
+        pieces[i] = piece[:j] + generator.choice(choices) + piece[j + 1:]
+
+        return "".join(pieces)
+
+    def _get_values(self, generator: random.Random) -> dict:
+        """
+            Gets random valid values of the fields of the date format.
+
+            :param generator: The generator of random numbers.
+
+            :return: The dictionary with the string of each field.
+        """
+
+        # Auxiliary variables.
+        fields = self.__slots
+        next_random = generator.random
+        year = month = None
+        values = {}
+
+        # The date.
+        if "YYYY" in fields:
+            year = 1 + int(next_random() * 9999)
+            values["YYYY"] = _NUMBERS[4][year]
+
+        elif "YY" in fields:
+            year = 1 + int(next_random() * 99)
+            values["YY"] = _NUMBERS[2][year]
+
+        if "MM" in fields or "MMM" in fields:
+            month = 1 + int(next_random() * 12)
+            values["MM"] = _NUMBERS[2][month]
+            values["MMM"] = uc.MONTHS[month - 1]
+
+        if "DD" in fields:
+            days = vg.get_days_in_month(month, year)
+            values["DD"] = _NUMBERS[2][1 + int(next_random() * days)]
+
+        elif "DDD" in fields:
+            first, last = vg.get_days_of_year_range(month, year)
+            day = first + int(next_random() * (last - first))
+            values["DDD"] = _NUMBERS[3][day]
+
+        # The time.
+        if "hh" in fields and self.__plan.ampm:
+            meridiem = ("am", "pm", "m")[int(next_random() * 3)]
+            hour = 12 if meridiem == "m" else 1 + int(next_random() * 12)
+            values["ii"] = meridiem
+            values["hh"] = _NUMBERS[2][hour]
+
+        elif "hh" in fields:
+            values["hh"] = _NUMBERS[2][int(next_random() * 24)]
+
+        if "mm" in fields:
+            values["mm"] = _NUMBERS[2][int(next_random() * 60)]
+
+        if "ss" in fields:
+            values["ss"] = _NUMBERS[2][int(next_random() * 60)]
+
+        if "t" in fields:
+            values["t"] = _NUMBERS[1][int(next_random() * 10)]
+
+        return values
+
+    # --------------------------------------------------------------------------
+    # Set Methods
+    # --------------------------------------------------------------------------
+
+    def _set_day_of_year(self, values: dict, generator: random.Random) -> None:
+        """
+            Sets the day of the year to one of the edge days of the range of
+            the month, or of the year; the first and last days are valid, the
+            days before and after them are not.
+
+            :param values: The dictionary with the string of each field.
+
+            :param generator: The generator of random numbers.
+        """
+
+        # Not a day of the year.
+        if "DDD" not in values:
+            return
+
+        # Auxiliary variables.
+        year = int(values.get("YYYY") or values.get("YY") or 0) or None
+        month = int(values["MM"]) if "MM" in values else None
+
+        # Pick an edge day.
+        first, last = vg.get_days_of_year_range(month, year)
+        day = generator.choice((first - 1, first, last - 1, last))
+        values["DDD"] = _NUMBERS[3][day]
+
+    def _set_leap_day(self, values: dict, generator: random.Random) -> None:
+        """
+            Sets the date to the 29th of February, or to the 60th and 366th
+            days of the year, of a random year; valid in leap years, invalid
+            otherwise.
+
+            :param values: The dictionary with the string of each field.
+
+            :param generator: The generator of random numbers.
+        """
+
+        # Not a day.
+        if "DD" not in values and "DDD" not in values:
+            return
+
+        # The 29th of February.
+        if "MM" in values:
+            values["MM"] = "02"
+            values["MMM"] = uc.MONTHS[1]
+
+        if "DD" in values:
+            values["DD"] = "29"
+
+        elif "MM" in values:
+            values["DDD"] = "060"
+
+        else:
+            values["DDD"] = "366"
+
+# ##############################################################################
+# Functions
+# ##############################################################################
+
+# ------------------------------------------------------------------------------
+# Get Functions
+# ------------------------------------------------------------------------------
+
+
+def get_dates(
+    dformat: Any, ampm: Any, count: int, invalid: float = 0.0, seed: int = 0
+) -> list:
+    """
+        Gets the given number of dates, with the given rate of invalid dates,
+        spread evenly among the INVALID_KINDS; the rest of the dates are
+        valid.
+
+        :param dformat: The string that represents the format in which the
+         dates are given; must be a valid date format.
+
+        :param ampm: The boolean flag that indicates if the time is given in
+         12-hr or 24-hr format.
+
+        :param count: The number of dates.
+
+        :param invalid: The rate of invalid dates, from 0 to 1.
+
+        :param seed: The seed of the random numbers.
+
+        :return: The list with the dates.
+    """
+
+    # Auxiliary variables.
+    rates = {kind: invalid / len(INVALID_KINDS) for kind in INVALID_KINDS}
+
+    return list(CorpusGenerator(dformat, ampm, rates, seed).generate(count))
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """
+        Gets the parser of the command line arguments.
+
+        :return: The parser of the command line arguments.
+    """
+
+    # Auxiliary variables.
+    parser = argparse.ArgumentParser(
+        prog="python -m date_validator.testing.testing_corpus",
+        description=(
+            "Writes a deterministic stream of synthetic dates, one date per "
+            "line, mixing valid dates with edge cases and invalid dates."
+        ),
+    )
+
+    # Add the arguments.
+    parser.add_argument(
+        "dformat", help="the format in which the dates are given."
+    )
+    parser.add_argument(
+        "count", type=int, help="the number of dates."
+    )
+    parser.add_argument(
+        "output", nargs="?", default="-",
+        help="the file where the dates are written; the standard output, if "
+             "not given or -."
+    )
+    parser.add_argument(
+        "--ampm", action="store_true",
+        help="the time is given in 12-hr format."
+    )
+    parser.add_argument(
+        "--rate", nargs="+", default=[], metavar="KIND=RATE",
+        help=f"the rate of a kind of date, from {', '.join(KINDS)}; 0.05 for "
+             f"each kind by default, the rest of the dates are valid."
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="the seed of the random numbers; 0 by default."
+    )
+
+    return parser
+
+# ------------------------------------------------------------------------------
+# Main Functions
+# ------------------------------------------------------------------------------
+
+
+def main(argv: Optional[list] = None) -> int:
+    """
+        Writes the requested number of dates to the requested file.
+
+        :param argv: The command line arguments; the ones given to the
+         program, if None.
+
+        :return: The exit status; 0, if the dates were written, 2, if the date
+         format, or the rates, are not valid.
+    """
+
+    # Auxiliary variables.
+    arguments = get_parser().parse_args(argv)
+
+    # Get the generator.
+    try:
+        rates = dict(RATES)
+        for rate in arguments.rate:
+            kind, _, value = rate.partition("=")
+            rates[kind] = float(value)
+
+        corpus = CorpusGenerator(
+            arguments.dformat, arguments.ampm, rates, arguments.seed
+        )
+    except (eg.LazyMessageError, LookupError, OSError, ValueError) as error:
+        print(str(error).strip(), file=sys.stderr)
+        return 2
+
+    # Write the dates.
+    corpus.write(arguments.output, arguments.count)
+
+    return 0
+
+# ------------------------------------------------------------------------------
+# Private Functions
+# ------------------------------------------------------------------------------
+
+
+# The numbers with one to four digits, with leading zeros, indexed by the
+# number of digits and the number.
+_NUMBERS = {
+    width: tuple(f"{number:0{width}d}" for number in range(10 ** width))
+    for width in (1, 2, 3, 4)
+}
+
+# ##############################################################################
+# Main Program
+# ##############################################################################
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,972 @@
+"""
+    File that contains the differential harness between the reference
+    validation and every faster engine; each engine validates the same
+    generated and randomized dates, for every legal combination of fields, and
+    any result that differs from the reference is reported.
+
+    The reference is a frozen copy of the original algorithm of
+    DateValidator._validate_fields, that scans the date three times; to find
+    the separators, to split the date at them and to extract the fields. It
+    shares no tokenizer with the engines, so a bug in the tokenizer shows up
+    as a disagreement.
+
+    Usage:
+    __________
+
+    python -m date_validator.testing.testing_differential [-h] [--ampm]
+                             [--count COUNT] [--dformat DFORMAT]
+                             [--engines ENGINE [ENGINE ...]] [--limit LIMIT]
+                             [--seed SEED]
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+import argparse
+import itertools
+import random
+import sys
+
+from typing import Callable, Iterable, NamedTuple, Optional
+
+# User defined.
+import date_validator.testing.testing_corpus as tc
+import date_validator.validation.validation_cache as vca
+import date_validator.validation.validation_codegen as vc
+import date_validator.validation.validation_date as dv
+import date_validator.validation.validation_format as vf
+import date_validator.validation.validation_general as vg
+import date_validator.validation.validation_regex as vr
+import date_validator.validation.validation_stream as vs
+import date_validator.validation.validation_vectorized as vv
+
+# ##############################################################################
+# Constants
+# ##############################################################################
+
+# The engines compared against the reference; every engine is also given the
+# dates as UTF-8 encoded bytes, under the name of the engine followed by
+# '-bytes', except the vectorized one, if a separator is not a single byte.
+# The engines match the bytes as they are, by design, so the dates with
+# non-ASCII characters other than the separators are not compared then.
+ENGINES = (
+    "matcher", "reason", "many", "regex", "codegen", "stream", "cached",
+    "cached-hits", "vectorized",
+)
+
+# The matchers that validate a single date, keyed on the name of the engine.
+MATCHERS = {
+    "codegen": vc.GeneratedMatcher,
+    "matcher": dv.FormatMatcher,
+    "regex": vr.RegexMatcher,
+}
+
+# The default number of generated dates per date format; each one is
+# followed by a randomized date.
+COUNT = 100
+
+# The default number of disagreements that are printed.
+LIMIT = 20
+
+# The alternatives of each field of the date format, in order; None, if the
+# field is not given.
+FIELDS = (
+    ("YYYY", "YY", None),
+    ("MMM", "MM", None),
+    ("DDD", "DD", None),
+    ("hh", None),
+    ("mm", None),
+    ("ss", None),
+    ("t", None),
+)
+
+# The separators of the date formats; the ASCII ones, and a non-ASCII one.
+SEPARATORS = ("-", ":", " ", "/", ";", "·")
+
+# The characters of the randomized dates, besides the digits, the letters of
+# the months and the separators of the date format; the ones Python's int()
+# accepts around, or as, a number, and a non-ASCII letter.
+NOISE = " +-_٣é"
+
+# ##############################################################################
+# Classes
+# ##############################################################################
+
+
+class Disagreement(NamedTuple):
+    """
+        Immutable result of an engine that differs from the reference.
+
+        Parameters:
+        __________
+
+        - dformat: The date format.
+
+        - ampm: True, if the time is given in 12-hr format. False, otherwise.
+
+        - engine: The name of the engine.
+
+        - date: The date.
+
+        - expected: The result of the reference.
+
+        - found: The result of the engine.
+    """
+
+    dformat: str
+    ampm: bool
+    engine: str
+    date: str
+    expected: bool
+    found: bool
+
+
+class Report(NamedTuple):
+    """
+        Immutable summary of a differential run.
+
+        Parameters:
+        __________
+
+        - formats: The number of date formats.
+
+        - dates: The number of dates validated by the reference.
+
+        - comparisons: The number of results of the engines compared against
+          the reference.
+
+        - disagreements: The tuple with the Disagreement of each result that
+          differs from the reference.
+    """
+
+    formats: int
+    dates: int
+    comparisons: int
+    disagreements: tuple
+
+
+class ReferenceValidator:
+    """
+        Class that validates dates against a single date format with a frozen
+        copy of the original algorithm of DateValidator._validate_fields; the
+        separators are found in a first scan of the date, the date is split
+        at the first occurrence of each separator, dropping the empty
+        segments, in a second scan, and the fields are extracted from each
+        segment, once the 'ii' string has been removed, in a third scan. The
+        fields are then checked in a dictionary, as DateValidator does.
+
+        It must not be optimized, nor share code with the tokenizer of the
+        engines, since it is the oracle they are compared against.
+    """
+
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+    # Public Interface.
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+    # ##########################################################################
+    # Constructor
+    # ##########################################################################
+
+    def __init__(self, dformat: str, ampm: bool):
+        """
+            Initializes the variables of the reference validator.
+
+            :param dformat: The string that represents the format in which the
+             dates should be given; must be a valid date format.
+
+            :param ampm: The boolean flag that indicates if the time is given
+             in 12-hr or 24-hr format. True, if the time is given in 12-hr
+             format; False, otherwise.
+        """
+
+        # Auxiliary variables.
+        formatter = vf.FormatValidator(str(dformat).strip(), bool(ampm))
+
+        # The separators, and the fields delimited by them.
+        self.__ampm = bool(ampm)
+        self.__separators = tuple(formatter.get_separators())
+        self.__segments = list(formatter.get_fields_using_separators())
+
+        # The segment with the 'ii' string, and its index, which is removed.
+        self.__ii = (-1, -1)
+        for i, segment in enumerate(self.__segments if self.__ampm else ()):
+            if "ii" in segment:
+                index = segment.index("ii")
+                self.__segments[i] = segment[:index] + segment[index + 2:]
+                self.__ii = (i, index)
+                break
+
+    # ##########################################################################
+    # Methods
+    # ##########################################################################
+
+    # --------------------------------------------------------------------------
+    # Validate Methods
+    # --------------------------------------------------------------------------
+
+    def validate(self, date: str) -> bool:
+        """
+            Validates the date against the date format.
+
+            :param date: The string that contains the date to be validated.
+
+            :return: True, if the date given is in the date format. False,
+             otherwise.
+        """
+
+        # Auxiliary variables.
+        dictionary = {
+            "YYYY": "", "YY": "", "MMM": "", "MM": "", "DDD": "", "DD": "",
+            "hh": "", "mm": "", "ss": "", "t": "", "ii": ""
+        }
+
+        # Separators are different.
+        if self._get_separators(date) != self.__separators:
+            return False
+
+        # Check the number of fields match.
+        fields = self._get_fields_using_separators(date)
+        if len(fields) != len(self.__segments):
+            return False
+
+        # Get the different fields in the dictionary.
+        if not self._get_fields(fields, dictionary):
+            return False
+
+        # Validate the date.
+        valid = vg.validate_year(dictionary)
+        valid = valid and vg.validate_month(dictionary)
+        valid = valid and vg.validate_day(dictionary)
+
+        # Validate the time.
+        valid = valid and vg.validate_hour(dictionary, self.__ampm)
+        valid = valid and vg.validate_minutes(dictionary)
+        valid = valid and vg.validate_seconds(dictionary)
+        valid = valid and vg.validate_tenths(dictionary)
+
+        return valid
+
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+    # Private Interface.
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+    # ##########################################################################
+    # Methods
+    # ##########################################################################
+
+    # --------------------------------------------------------------------------
+    # Get Methods
+    # --------------------------------------------------------------------------
+
+    def _get_fields(self, fields: list, dictionary: dict) -> bool:
+        """
+            Extracts the 'ii' string, and each field of the segments of the
+            date, into the dictionary.
+
+            :param fields: The segments of the date, delimited by the
+             separators; the 'ii' string is removed from them.
+
+            :param dictionary: The dictionary with the string of each field.
+
+            :return: False, if the fields cannot be extracted due to a
+             mismatch in size. True, otherwise.
+        """
+
+        # Auxiliary variables.
+        segment, index = self.__ii
+
+        # Find the am/pm/m field and remove it.
+        if segment >= 0 and index < len(fields[segment]):
+            width = 1 if fields[segment][index] == "m" else 2
+            dictionary["ii"] = fields[segment][index: index + width]
+            fields[segment] = (
+                fields[segment][:index] + fields[segment][index + width:]
+            )
+
+        # Check ALL the fields have the same length.
+        for entry_0, entry_1 in zip(fields, self.__segments):
+            if len(entry_0) != len(entry_1):
+                return False
+
+            # Go through each character; a field ends where the letter of
+            # the date format changes.
+            string_0 = ""
+            string_1 = ""
+            for i, (char_0, char_1) in enumerate(zip(entry_0, entry_1)):
+                if i > 0 and char_1 != entry_1[i - 1]:
+                    dictionary[string_1] = string_0
+                    string_0 = ""
+                    string_1 = ""
+
+                string_0 += char_0
+                string_1 += char_1
+
+            if string_1 != "":
+                dictionary[string_1] = string_0
+
+        return True
+
+    def _get_fields_using_separators(self, date: str) -> list:
+        """
+            Gets the segments of the date that are delimited by the
+            separators, splitting at the first occurrence of each separator
+            and dropping the empty segments.
+
+            :param date: The date.
+
+            :return: The segments of the date.
+        """
+
+        # Auxiliary variables.
+        cntr = 0
+        fields = []
+        separators = self.__separators
+        string = ""
+
+        # Extract each field.
+        for char in date:
+            # The next separator.
+            if cntr < len(separators) and char == separators[cntr]:
+                if string != "":
+                    fields.append(string)
+
+                string = ""
+                cntr += 1
+                continue
+
+            string += char
+
+        # Append the last string.
+        if string != "":
+            fields.append(string)
+
+        return fields
+
+    def _get_separators(self, date: str) -> tuple:
+        """
+            Gets the separators of the date format found in the date, in
+            order.
+
+            :param date: The date.
+
+            :return: The separators found in the date.
+        """
+
+        # Auxiliary variables.
+        cntr = 0
+        found = []
+        separators = self.__separators
+
+        # Search for each separator.
+        for char in date:
+            if cntr < len(separators) and char == separators[cntr]:
+                found.append(char)
+                cntr += 1
+
+        return tuple(found)
+
+# ##############################################################################
+# Functions
+# ##############################################################################
+
+# ------------------------------------------------------------------------------
+# Compare Functions
+# ------------------------------------------------------------------------------
+
+
+def compare(
+    dformat: str, ampm: bool, dates: list, engines: Iterable = ENGINES
+) -> tuple:
+    """
+        Compares the results of the engines against the reference, over the
+        same dates.
+
+        :param dformat: The date format; must be a valid date format.
+
+        :param ampm: The boolean flag that indicates if the time is given in
+         12-hr or 24-hr format.
+
+        :param dates: The list with the dates.
+
+        :param engines: The names of the engines, from ENGINES; the engines
+         that don't support the date format are skipped.
+
+        :return: The tuple with the number of results compared, and the list
+         with the Disagreement of each result that differs from the
+         reference.
+    """
+
+    # Auxiliary variables.
+    expected = get_expected(dformat, ampm, dates)
+    disagreements = []
+    comparisons = 0
+
+    # Compare each engine.
+    for engine, run in get_engines(dformat, ampm, engines).items():
+        for date, reference, found in zip(dates, expected, run(dates)):
+            # The date is not supported by the engine.
+            if found is None:
+                continue
+
+            comparisons += 1
+            if bool(found) != reference:
+                disagreements.append(Disagreement(
+                    dformat, ampm, engine, date, reference, bool(found)
+                ))
+
+    return comparisons, disagreements
+
+
+def run_all(
+    formats: Optional[Iterable] = None, count: int = COUNT, seed: int = 0,
+    engines: Iterable = ENGINES
+) -> Report:
+    """
+        Compares the engines against the reference, over the generated and
+        randomized dates of each date format.
+
+        :param formats: The (date format, 12-hr format flag) tuples; the ones
+         given by get_formats, if None.
+
+        :param count: The number of generated dates per date format; each one
+         is followed by a randomized date.
+
+        :param seed: The seed of the random numbers.
+
+        :param engines: The names of the engines, from ENGINES.
+
+        :return: The Report of the run.
+    """
+
+    # Auxiliary variables.
+    formats = get_formats(seed) if formats is None else list(formats)
+    engines = tuple(engines)
+    disagreements = []
+    comparisons = dates_count = 0
+
+    # Compare the engines over each date format.
+    for dformat, ampm in formats:
+        dates = get_dates(dformat, ampm, count, seed)
+        compared, found = compare(dformat, ampm, dates, engines)
+
+        dates_count += len(dates)
+        comparisons += compared
+        disagreements.extend(found)
+
+    return Report(
+        len(formats), dates_count, comparisons, tuple(disagreements)
+    )
+
+# ------------------------------------------------------------------------------
+# Get Functions
+# ------------------------------------------------------------------------------
+
+
+def get_dates(dformat: str, ampm: bool, count: int, seed: int = 0) -> list:
+    """
+        Gets the dates of a date format; each generated date, valid or an
+        edge case, is followed by a randomized copy of itself, with
+        characters replaced, inserted or removed, or by a random string, so
+        that the engines that reuse the last date are given near duplicates.
+
+        :param dformat: The date format; must be a valid date format.
+
+        :param ampm: The boolean flag that indicates if the time is given in
+         12-hr or 24-hr format.
+
+        :param count: The number of generated dates.
+
+        :param seed: The seed of the random numbers.
+
+        :return: The list with the dates.
+    """
+
+    # Auxiliary variables.
+    corpus = tc.CorpusGenerator(dformat, ampm, seed=seed)
+    generator = random.Random(f"{seed}:{dformat}:{ampm}")
+    alphabet = _get_alphabet(corpus.plan)
+    size = max(corpus.plan.sizes) + 2
+    dates = []
+
+    # Pair each generated date with a randomized one.
+    for date in corpus.generate(count):
+        dates.append(date)
+
+        if generator.random() < 0.1:
+            length = int(generator.random() * size)
+            dates.append("".join(generator.choices(alphabet, k=length)))
+        else:
+            dates.append(_get_mutated(date, alphabet, generator))
+
+    return dates
+
+
+def get_engines(
+    dformat: str, ampm: bool, engines: Iterable = ENGINES
+) -> dict:
+    """
+        Gets the function of each engine that supports the date format, and
+        of its bytes version.
+
+        :param dformat: The date format; must be a valid date format.
+
+        :param ampm: The boolean flag that indicates if the time is given in
+         12-hr or 24-hr format.
+
+        :param engines: The names of the engines, from ENGINES.
+
+        :raise ValueError: If an engine doesn't exist.
+
+        :return: The dictionary with the function of each engine, keyed on
+         its name; each function takes the list of dates, and returns the
+         list with the result of each one, or None, if the engine doesn't
+         support the date.
+    """
+
+    # //////////////////////////////////////////////////////////////////////////
+    # Auxiliary Functions
+    # //////////////////////////////////////////////////////////////////////////
+
+    def run_cached_0(dates_0: list) -> list:
+        """
+            Validates the dates with a cached matcher, starting with an empty
+            cache; only the repeated dates are found in the cache.
+        """
+        cached.cache_clear()
+        return list(map(cached.validate, dates_0))
+
+    def run_cached_hits_0(dates_0: list) -> list:
+        """
+            Validates the dates with a cached matcher, once they are all in
+            the cache.
+        """
+        run_cached_0(dates_0)
+        return list(map(cached.validate, dates_0))
+
+    def run_many_0(dates_0: list) -> list:
+        """
+            Validates the dates with validate_many.
+        """
+        return list(dv.validate_many(dates_0, dformat, ampm))
+
+    def run_reason_0(dates_0: list) -> list:
+        """
+            Validates the dates with the reasons of a matcher.
+        """
+        return [reason(d_0) == 0 for d_0 in dates_0]
+
+    def run_stream_0(dates_0: list) -> list:
+        """
+            Validates the dates, in order, with a stream matcher that starts
+            without a last valid date.
+        """
+        stream.reset()
+        return list(map(stream.validate, dates_0))
+
+    def run_vectorized_0(dates_0: list) -> list:
+        """
+            Validates the dates as a NumPy array; the dates with characters
+            that Python's int() accepts, but the vectorized matcher rejects
+            by design, are not compared.
+        """
+
+        # An empty list is not an array of strings.
+        if not dates_0:
+            return []
+
+        found_0 = vectorized.validate(dates_0)
+        if isinstance(dates_0[0], bytes):
+            dates_0 = [d_0.decode("utf-8") for d_0 in dates_0]
+
+        return [
+            bool(f_0) if _is_strict(d_0, positions) else None
+            for d_0, f_0 in zip(dates_0, found_0)
+        ]
+
+    # //////////////////////////////////////////////////////////////////////////
+    # Implementation
+    # //////////////////////////////////////////////////////////////////////////
+
+    # Auxiliary variables.
+    plan = vf.FormatValidator.compile(dformat, ampm)
+    separators = "".join(plan.separators)
+    positions = frozenset(plan.positions)
+    functions = {}
+
+    # Get the function of each engine.
+    for engine in engines:
+        try:
+            if engine in MATCHERS:
+                functions[engine] = _get_validate(
+                    MATCHERS[engine](dformat, ampm).validate
+                )
+
+            elif engine == "reason":
+                reason = dv.FormatMatcher(dformat, ampm).reason
+                functions[engine] = run_reason_0
+
+            elif engine == "many":
+                functions[engine] = run_many_0
+
+            elif engine == "stream":
+                stream = vs.StreamMatcher(dformat, ampm)
+                functions[engine] = run_stream_0
+
+            elif engine in ("cached", "cached-hits"):
+                cached = vca.CachedMatcher(dformat, ampm)
+                functions[engine] = (
+                    run_cached_0 if engine == "cached" else run_cached_hits_0
+                )
+
+            elif engine == "vectorized":
+                vectorized = vv.VectorizedMatcher(dformat, ampm)
+                functions[engine] = run_vectorized_0
+
+            else:
+                raise KeyError(engine)
+
+        # The engine doesn't support the date format.
+        except (ImportError, ValueError):
+            continue
+
+        except KeyError:
+            raise ValueError(f"The engine '{engine}' doesn't exist.")
+
+    # The bytes version of each engine.
+    for engine, function in list(functions.items()):
+        if engine == "vectorized" and not separators.isascii():
+            continue
+
+        functions[f"{engine}-bytes"] = _get_binary(function, separators)
+
+    return functions
+
+
+def get_expected(dformat: str, ampm: bool, dates: list) -> list:
+    """
+        Gets the results of the reference; the dates validated by the
+        ReferenceValidator of the date format.
+
+        :param dformat: The date format.
+
+        :param ampm: The boolean flag that indicates if the time is given in
+         12-hr or 24-hr format.
+
+        :param dates: The list with the dates.
+
+        :return: The list with the result of each date.
+    """
+    return list(map(ReferenceValidator(dformat, ampm).validate, dates))
+
+
+def get_formats(seed: int = 0) -> list:
+    """
+        Gets the date formats of every legal combination of fields, in 12-hr
+        and 24-hr format, each one in three layouts; the fields in order with
+        a single separator between them, the fields in order without
+        separators, and the fields shuffled with random separators, of zero
+        to two characters, between and around them.
+
+        :param seed: The seed of the random numbers of the shuffled layout.
+
+        :return: The list with the (date format, 12-hr format flag) tuples.
+    """
+
+    # Auxiliary variables.
+    generator = random.Random(seed)
+    formats = []
+
+    # Each combination of fields.
+    for choice in itertools.product(*FIELDS):
+        for ampm in (False, True):
+            fields = [field for field in choice if field is not None]
+            if ampm and "hh" in fields:
+                fields.insert(fields.index("hh") + 1, "ii")
+
+            # The combination of fields is not legal.
+            dformat = " ".join(fields)
+            if vf.check_format(dformat, ampm).code != vf.FormatCode.VALID:
+                continue
+
+            # The fields in order, with and without separators.
+            formats.append((_join(fields, SEPARATORS), ampm))
+            formats.append(("".join(fields), ampm))
+
+            # The fields shuffled, with random separators.
+            generator.shuffle(fields)
+            sizes = [generator.randint(0, 2) for _ in range(len(fields) + 1)]
+            separators = [
+                "".join(generator.choices(SEPARATORS, k=size))
+                for size in sizes
+            ]
+            formats.append((
+                "".join(itertools.chain(*zip(separators, fields)))
+                + separators[-1], ampm
+            ))
+
+    # Keep only the date formats that compile, once each.
+    return [
+        (dformat, ampm) for dformat, ampm in dict.fromkeys(formats)
+        if vf.check_format(dformat, ampm).code == vf.FormatCode.VALID
+    ]
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """
+        Gets the parser of the command line arguments.
+
+        :return: The parser of the command line arguments.
+    """
+
+    # Auxiliary variables.
+    parser = argparse.ArgumentParser(
+        prog="python -m date_validator.testing.testing_differential",
+        description=(
+            "Compares every engine against the reference validation, over "
+            "generated and randomized dates of every legal date format, and "
+            "reports the dates where they disagree."
+        ),
+    )
+
+    # Add the arguments.
+    parser.add_argument(
+        "--ampm", action="store_true",
+        help="the time of the given date format is in 12-hr format."
+    )
+    parser.add_argument(
+        "--count", type=int, default=COUNT,
+        help=f"the number of generated dates per date format, each one "
+             f"followed by a randomized date; {COUNT} by default."
+    )
+    parser.add_argument(
+        "--dformat", default=None,
+        help="a single date format to be compared; every legal combination "
+             "of fields, if not given."
+    )
+    parser.add_argument(
+        "--engines", nargs="+", choices=ENGINES, default=ENGINES,
+        metavar="ENGINE",
+        help=f"the engines to be compared, from {', '.join(ENGINES)}; all "
+             f"of them by default."
+    )
+    parser.add_argument(
+        "--limit", type=int, default=LIMIT,
+        help=f"the number of disagreements printed; {LIMIT} by default."
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="the seed of the random numbers; 0 by default."
+    )
+
+    return parser
+
+# ------------------------------------------------------------------------------
+# Main Functions
+# ------------------------------------------------------------------------------
+
+
+def main(argv: Optional[list] = None) -> int:
+    """
+        Compares the engines against the reference, and prints the
+        disagreements.
+
+        :param argv: The command line arguments; the ones given to the
+         program, if None.
+
+        :return: The exit status; 0, if every engine agrees with the
+         reference, 1, if they disagree, 2, if the date format is not valid.
+    """
+
+    # Auxiliary variables.
+    arguments = get_parser().parse_args(argv)
+    formats = None
+
+    # Check the date format.
+    if arguments.dformat is not None:
+        check = vf.check_format(arguments.dformat, arguments.ampm)
+        if check.code != vf.FormatCode.VALID:
+            print(
+                f"The date format, '{arguments.dformat}', is not valid: "
+                f"{check.code.name}.", file=sys.stderr
+            )
+            return 2
+
+        formats = [(arguments.dformat.strip(), arguments.ampm)]
+
+    # Compare the engines.
+    report = run_all(
+        formats, arguments.count, arguments.seed, arguments.engines
+    )
+
+    # Print the disagreements.
+    for disagreement in report.disagreements[:max(arguments.limit, 0)]:
+        print(
+            f"{disagreement.engine:<18} {disagreement.dformat!r:<28} "
+            f"{str(disagreement.ampm):<5}  {disagreement.date!r}: expected "
+            f"{disagreement.expected}, found {disagreement.found}"
+        )
+
+    print(
+        f"{report.formats:,} date formats, {report.dates:,} dates, "
+        f"{report.comparisons:,} results compared, "
+        f"{len(report.disagreements):,} disagreements."
+    )
+
+    return 1 if report.disagreements else 0
+
+# ------------------------------------------------------------------------------
+# Private Functions
+# ------------------------------------------------------------------------------
+
+
+def _get_alphabet(plan: vf.FormatPlan) -> str:
+    """
+        Gets the characters of the randomized dates of a date format; the
+        digits, more often than the rest, the letters of the months and of
+        the am/pm/m strings, the separators and the noise characters.
+
+        :param plan: The compiled plan of the date format.
+
+        :return: The string with the characters, repeated by weight.
+    """
+    return (
+        "0123456789" * 4 + "JANFEBDECjanfebSEPamp" + "".join(plan.separators)
+        + NOISE
+    )
+
+
+def _get_binary(function: Callable, separators: str) -> Callable:
+    """
+        Gets the version of an engine that is given the dates as UTF-8
+        encoded bytes.
+
+        :param function: The function of the engine.
+
+        :param separators: The separators of the date format.
+
+        :return: The function that encodes the dates, and validates them; the
+         result is None for the dates with non-ASCII characters other than
+         the separators, whose fields have a different length once encoded.
+    """
+
+    def run_0(dates_0: list) -> list:
+        """
+            Validates the encoded dates.
+        """
+
+        # Validate the dates.
+        found_0 = function([d_0.encode("utf-8") for d_0 in dates_0])
+
+        return [
+            f_0 if all(c.isascii() or c in separators for c in d_0) else None
+            for d_0, f_0 in zip(dates_0, found_0)
+        ]
+
+    return run_0
+
+
+def _get_mutated(date: str, alphabet: str, generator: random.Random) -> str:
+    """
+        Gets a randomized copy of a date; one to three characters are
+        replaced, inserted or removed.
+
+        :param date: The date.
+
+        :param alphabet: The characters that are replaced or inserted.
+
+        :param generator: The generator of random numbers.
+
+        :return: The randomized date.
+    """
+
+    # Auxiliary variables.
+    characters = list(date)
+
+    # Change the characters.
+    for _ in range(generator.randint(1, 3)):
+        action = generator.random()
+        index = int(generator.random() * (len(characters) + 1))
+
+        if action < 0.5 and index < len(characters):
+            characters[index] = generator.choice(alphabet)
+
+        elif action < 0.75 or not characters:
+            characters.insert(index, generator.choice(alphabet))
+
+        else:
+            del characters[min(index, len(characters) - 1)]
+
+    return "".join(characters)
+
+
+def _get_validate(validate: Callable) -> Callable:
+    """
+        Gets the version of an engine that validates a list of dates, one
+        date at a time.
+
+        :param validate: The function that validates a single date.
+
+        :return: The function that validates the list of dates.
+    """
+
+    def run_0(dates_0: list) -> list:
+        """
+            Validates the dates, one at a time.
+        """
+        return list(map(validate, dates_0))
+
+    return run_0
+
+
+def _is_strict(date: str, positions: frozenset) -> bool:
+    """
+        Determines if a date has only the characters the vectorized matcher
+        gives the same result for; ASCII characters, with no spaces, signs or
+        underscores, other than the separators at their fixed positions.
+
+        :param date: The date.
+
+        :param positions: The (index, separator) tuples with the separators
+         found at a fixed index of every valid date.
+
+        :return: True, if the date has only those characters. False,
+         otherwise.
+    """
+    return date.isascii() and all(
+        c not in " +-_" or (i, c) in positions for i, c in enumerate(date)
+    )
+
+
+def _join(fields: list, separators: tuple) -> str:
+    """
+        Joins the fields of a date format, with a single separator between
+        each pair of fields, taken in turn from the given separators; the
+        'ii' string is joined to the hour without a separator.
+
+        :param fields: The fields, in order.
+
+        :param separators: The separators.
+
+        :return: The date format.
+    """
+
+    # Auxiliary variables.
+    pieces = [fields[0]]
+
+    # Join the fields.
+    for i, field in enumerate(fields[1:]):
+        if field != "ii":
+            pieces.append(separators[i % len(separators)])
+        pieces.append(field)
+
+    return "".join(pieces)
+
+# ##############################################################################
+# Main Program
+# ##############################################################################
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""
+    File that contains the calendar tables used to validate the dates; they
+    are built once, when the module is imported, so that the day checks are
+    table lookups.
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+import itertools
+
+from typing import Optional
+
+# ##############################################################################
+# Constants
+# ##############################################################################
+
+# The three-letter months, in upper-case, in the order of the year.
+MONTHS = (
+    "JAN", "FEB", "MAR", "APR", "MAY", "JUN",
+    "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"
+)
+
+# The number of each three-letter month, given as strings and bytes in any
+# combination of upper-case and lower-case letters.
+MONTH_NUMBER = {
+    name: number
+    for number, month in enumerate(MONTHS, start=1)
+    for letters in itertools.product(*zip(month, month.lower()))
+    for name in ("".join(letters), "".join(letters).encode())
+}
+
+# The number of days in each month, indexed by [leap year, month]; the
+# month 0 stands for a missing month, which can have up to 31 days.
+DAYS_IN_MONTH = (
+    (31, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+    (31, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+)
+
+# The first day of the year of each month, indexed by [leap year, month];
+# the cumulative sums of the days in the previous months. The month 0 is the
+# first day of the year, and the month 13 is the first day of the next year.
+FIRST_DAY = tuple(
+    (1, *itertools.accumulate(days[1:], initial=1))
+    for days in DAYS_IN_MONTH
+)
+
+# ##############################################################################
+# Functions
+# ##############################################################################
+
+# ------------------------------------------------------------------------------
+# Is Functions
+# ------------------------------------------------------------------------------
+
+
+def is_leap_year(year: Optional[int] = None) -> bool:
+    """
+        Determines if the given year is a leap year, i.e., if it is divisible
+        by four. If no year is given, the year is assumed to be a leap year.
+
+        :param year: The year; None, if no year is given.
+
+        :return: True, if the year is a leap year. False, otherwise.
+    """
+    return year is None or year % 4 == 0
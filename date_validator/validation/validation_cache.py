@@ -0,0 +1,252 @@
+"""
+    File that contains the classes to validate dates with a bounded cache of
+    the results, for streams where the same dates are repeated many times.
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+import functools
+
+from typing import Any, Optional, Union
+
+# User defined.
+import date_validator.validation.validation_date as dv
+import date_validator.validation.validation_format as vf
+import date_validator.validation.validation_general as vg
+
+# ##############################################################################
+# Constants
+# ##############################################################################
+
+# The default number of dates whose results are kept in the cache.
+CACHE_SIZE = 4096
+
+# ##############################################################################
+# Classes
+# ##############################################################################
+
+
+class CachedMatcher:
+    """
+        Class that validates, and parses, dates against a single date format,
+        keeping the results of the most recently seen dates in a bounded
+        least-recently-used cache; a repeated date is neither tokenized nor
+        range checked again.
+
+        The cache belongs to the matcher, so it is keyed on the compiled date
+        format and the date. It is safe to share the matcher across threads;
+        the cache can be disabled, for dates that are rarely repeated, by
+        setting its size to zero.
+    """
+
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+    # Public Interface.
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+    # ##########################################################################
+    # Properties
+    # ##########################################################################
+
+    @property
+    def ampm(self) -> bool:
+        """
+            Returns the boolean flag that indicates if the date is in am or pm
+             format.
+
+            :return: The boolean flag that indicates if the date is in am or pm
+             format.
+        """
+        return self.__matcher.ampm
+
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def dformat(self) -> str:
+        """
+            Returns the date format.
+
+            :return: The date format the dates are validated against.
+        """
+        return self.__matcher.dformat
+
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def hits(self) -> int:
+        """
+            Returns the number of dates whose result was found in the cache.
+
+            :return: The number of dates whose result was found in the cache.
+        """
+        return self.cache_info().hits
+
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def matcher(self) -> Any:
+        """
+            Returns the matcher that validates the dates not in the cache.
+
+            :return: The matcher that validates the dates not in the cache.
+        """
+        return self.__matcher
+
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def maxsize(self) -> int:
+        """
+            Returns the maximum number of dates kept in the cache.
+
+            :return: The maximum number of dates kept in the cache; zero, if
+             the cache is disabled.
+        """
+        return self.__maxsize
+
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def misses(self) -> int:
+        """
+            Returns the number of dates whose result was not in the cache.
+
+            :return: The number of dates whose result was not in the cache.
+        """
+        return self.cache_info().misses
+
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def plan(self) -> vf.FormatPlan:
+        """
+            Returns the compiled plan of the date format.
+
+            :return: The compiled plan of the date format.
+        """
+        return self.__matcher.plan
+
+    # ##########################################################################
+    # Constructor
+    # ##########################################################################
+
+    def __init__(
+        self, dformat: Any, ampm: Any, engine: type = dv.FormatMatcher,
+        maxsize: int = CACHE_SIZE, max_size: Optional[int] = None
+    ):
+        """
+            Initializes the variables of the cached matcher.
+
+            :param dformat: The string that represents the format in which the
+             dates should be given.
+
+            :param ampm: The boolean flag that indicates if the time is given
+             in 12-hr or 24-hr format. True, if the time is given in 12-hr
+             format; False, otherwise.
+
+            :param engine: The class that parses the dates not in the cache;
+             it must take the date format, the 12-hr format flag and the
+             maximum size, and have a parse method. FormatMatcher by default.
+
+            :param maxsize: The maximum number of dates kept in the cache;
+             zero, or less, to disable the cache.
+
+            :param max_size: The maximum number of characters of a date that
+             is looked at; the longer dates are rejected before being copied,
+             decoded or tokenized. It is never smaller than the size of the
+             longest valid date, which is used if None.
+        """
+
+        # Get the matcher.
+        self.__matcher = engine(dformat, ampm, max_size=max_size)
+        self.__maxsize = max(int(maxsize), 0)
+
+        # The maximum size of the dates.
+        self.__limits = vg.get_limits(self.__matcher.plan.sizes, max_size)
+
+        # Put the cache in front of the matcher; with a size of zero, the
+        # dates are passed straight to the matcher, and only counted.
+        self.__parse = functools.lru_cache(self.__maxsize)(
+            self.__matcher.parse
+        )
+
+    def __call__(self, date: Union[str, bytes]) -> bool:
+        """
+            The boolean value that indicates if the given date is valid, or not.
+
+            :param date: The string, or bytes-like object, that contains the
+             date to be validated.
+
+            :return: True, if the date given is in the date format. False,
+             otherwise.
+        """
+        return self.validate(date)
+
+    # ##########################################################################
+    # Methods
+    # ##########################################################################
+
+    # --------------------------------------------------------------------------
+    # Cache Methods
+    # --------------------------------------------------------------------------
+
+    def cache_clear(self) -> None:
+        """
+            Removes all the dates from the cache and resets the counters.
+        """
+        self.__parse.cache_clear()
+
+    def cache_info(self) -> tuple:
+        """
+            Gets the statistics of the cache.
+
+            :return: The named tuple with the number of hits, misses, the
+             maximum size and the current size of the cache, as given by
+             functools.lru_cache.
+        """
+        return self.__parse.cache_info()
+
+    # --------------------------------------------------------------------------
+    # Parse Methods
+    # --------------------------------------------------------------------------
+
+    def parse(self, date: Union[str, bytes]) -> Optional[vg.ParsedDate]:
+        """
+            Parses the date, validating it in the same pass; the result is
+            taken from the cache, if the date has been seen recently.
+
+            :param date: The string, or bytes-like object, that contains the
+             date to be parsed.
+
+            :return: None, if the date is not valid. Otherwise, the parsed
+             date; the fields that are not in the date format are set to None.
+        """
+
+        # Reject the oversize dates before hashing, or caching, them.
+        if len(date) > self.__limits[isinstance(date, str)]:
+            return None
+
+        # Only the hashable dates can be cached; the subclasses of str and
+        # bytes are turned into them, so they share the same entries.
+        if date.__class__ is not str and date.__class__ is not bytes:
+            date = str(date) if isinstance(date, str) else bytes(date)
+
+        return self.__parse(date)
+
+    # --------------------------------------------------------------------------
+    # Validate Methods
+    # --------------------------------------------------------------------------
+
+    def validate(self, date: Union[str, bytes]) -> bool:
+        """
+            Validates the date against the date format.
+
+            :param date: The string, or bytes-like object, that contains the
+             date to be validated.
+
+            :return: True, if the date given is in the date format. False,
+             otherwise.
+        """
+        return self.parse(date) is not None
@@ -0,0 +1,497 @@
+"""
+    File that contains the functions to generate, and compile, a specialized
+    parsing function for each date format.
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+import functools
+import itertools
+import linecache
+import weakref
+
+from typing import Any, Callable, Optional, Union
+
+# User defined.
+import date_validator.utilities.utilities_calendar as uc
+import date_validator.validation.validation_format as vf
+import date_validator.validation.validation_general as vg
+
+# ##############################################################################
+# Constants
+# ##############################################################################
+
+# The counter of the generated functions, used in their file names.
+_COUNTER = itertools.count()
+
+# ##############################################################################
+# Classes
+# ##############################################################################
+
+
+class GeneratedMatcher:
+    """
+        Class that validates, and parses, dates against a single date format,
+        using a function generated for the date format. The function has the
+        offsets of the fields and the separators hard-coded, and the range
+        checks inlined, so no date format structure is walked for each date.
+
+        Only formats where every field is delimited by exactly one separator
+        are supported, i.e., formats without leading, trailing or consecutive
+        separators. The dates can be given as strings or bytes-like objects;
+        bytes are parsed by a second function, without being decoded, unless
+        the date format has non-ASCII separators.
+    """
+
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+    # Public Interface.
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+    # ##########################################################################
+    # Properties
+    # ##########################################################################
+
+    @property
+    def ampm(self) -> bool:
+        """
+            Returns the boolean flag that indicates if the date is in am or pm
+             format.
+
+            :return: The boolean flag that indicates if the date is in am or pm
+             format.
+        """
+        return self.__plan.ampm
+
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def dformat(self) -> str:
+        """
+            Returns the date format.
+
+            :return: The date format the dates are validated against.
+        """
+        return self.__plan.dformat
+
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def function(self) -> Callable:
+        """
+            Returns the generated function.
+
+            :return: The generated function; it takes the date and returns the
+             same value as the parse method.
+        """
+        return self.__function
+
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def plan(self) -> vf.FormatPlan:
+        """
+            Returns the compiled plan of the date format.
+
+            :return: The compiled plan of the date format.
+        """
+        return self.__plan
+
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def source(self) -> str:
+        """
+            Returns the source code of the generated function.
+
+            :return: The source code of the generated function.
+        """
+        return get_source(self.__plan)
+
+    # ##########################################################################
+    # Constructor
+    # ##########################################################################
+
+    def __init__(
+        self, dformat: Any, ampm: Any, max_size: Optional[int] = None
+    ):
+        """
+            Initializes the variables of the generated matcher.
+
+            :param dformat: The string that represents the format in which the
+             dates should be given.
+
+            :param ampm: The boolean flag that indicates if the time is given
+             in 12-hr or 24-hr format. True, if the time is given in 12-hr
+             format; False, otherwise.
+
+            :param max_size: The maximum number of characters of a date that
+             is looked at; the longer dates are rejected before being copied,
+             decoded or tokenized. It is never smaller than the size of the
+             longest valid date, which is used if None.
+
+            :raise ValueError: If a field in the date format is not delimited
+             by exactly one separator.
+        """
+
+        # Compile the date format.
+        self.__plan = vf.FormatValidator.compile(
+            str(dformat).strip(), bool(ampm)
+        )
+
+        # The maximum size of the dates.
+        self.__limits = vg.get_limits(self.__plan.sizes, max_size)
+
+        # Get the generated functions; the bytes are decoded if no function
+        # can take them.
+        self.__function = get_function(self.__plan)
+        try:
+            self.__binary = get_function(self.__plan, True)
+        except ValueError:
+            self.__binary = None
+
+    def __call__(self, date: Union[str, bytes]) -> bool:
+        """
+            The boolean value that indicates if the given date is valid, or not.
+
+            :param date: The string, or bytes-like object, that contains the
+             date to be validated.
+
+            :return: True, if the date given is in the date format. False,
+             otherwise.
+        """
+        return self.validate(date)
+
+    # ##########################################################################
+    # Methods
+    # ##########################################################################
+
+    # --------------------------------------------------------------------------
+    # Parse Methods
+    # --------------------------------------------------------------------------
+
+    def parse(self, date: Union[str, bytes]) -> Optional[vg.ParsedDate]:
+        """
+            Parses the date, validating it in the same pass.
+
+            :param date: The string, or bytes-like object, that contains the
+             date to be parsed.
+
+            :return: None, if the date is not valid. Otherwise, the parsed
+             date; the fields that are not in the date format are set to None.
+        """
+
+        # The date is given as a string, or a subclass of it.
+        if isinstance(date, str):
+            return self.__function(date)
+
+        return self._parse_bytes(date)
+
+    # --------------------------------------------------------------------------
+    # Validate Methods
+    # --------------------------------------------------------------------------
+
+    def validate(self, date: Union[str, bytes]) -> bool:
+        """
+            Validates the date against the date format.
+
+            :param date: The string, or bytes-like object, that contains the
+             date to be validated.
+
+            :return: True, if the date given is in the date format. False,
+             otherwise.
+        """
+
+        # The date is given as a string, or a subclass of it.
+        if isinstance(date, str):
+            return self.__function(date) is not None
+
+        return self._parse_bytes(date) is not None
+
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+    # Private Interface.
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+    # ##########################################################################
+    # Methods
+    # ##########################################################################
+
+    # --------------------------------------------------------------------------
+    # Parse Methods
+    # --------------------------------------------------------------------------
+
+    def _parse_bytes(self, date: Any) -> Optional[vg.ParsedDate]:
+        """
+            Parses the date given as a bytes-like object.
+
+            :param date: The bytes-like object that contains the date to be
+             parsed.
+
+            :return: The same value as the parse method.
+        """
+
+        # Reject the oversize dates before copying, or decoding, them.
+        if len(date) > self.__limits[0]:
+            return None
+
+        # Turn the bytes-like objects into bytes.
+        if date.__class__ is not bytes:
+            date = bytes(date)
+
+        # No function can take bytes.
+        if self.__binary is None:
+            return self.__function(date.decode("utf-8", "replace"))
+
+        return self.__binary(date)
+
+# ##############################################################################
+# Functions
+# ##############################################################################
+
+# ------------------------------------------------------------------------------
+# Get Functions
+# ------------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=128)
+def get_function(plan: vf.FormatPlan, binary: bool = False) -> Callable:
+    """
+        Gets the function generated for the given date format plan. The
+        functions are kept in a bounded least-recently-used cache, keyed on the
+        plan, and their source code can be inspected with the inspect module.
+
+        :param plan: The compiled plan of the date format.
+
+        :param binary: True, if the function must take the dates as bytes.
+         False, if it must take them as strings.
+
+        :raise ValueError: If a field in the date format is not delimited by
+         exactly one separator or, if the function must take bytes, if a
+         separator is not an ASCII character.
+
+        :return: The function that takes a date and returns the parsed date;
+         None, if the date is not valid.
+    """
+
+    # Get the source code; each function has its own file name, so that its
+    # source code is not replaced by the one of a later function.
+    source = get_source(plan, binary)
+    filename = (
+        f"<generated date parser {next(_COUNTER)} {plan.dformat!r} "
+        f"ampm={plan.ampm} {'bytes' if binary else 'str'}>"
+    )
+
+    # Make the source code available to inspect and the tracebacks.
+    linecache.cache[filename] = (
+        len(source), None, source.splitlines(keepends=True), filename
+    )
+
+    # Compile the function.
+    namespace = {
+        "ParsedDate": vg.ParsedDate,
+        "days_in_month": uc.DAYS_IN_MONTH,
+        "first_day": uc.FIRST_DAY,
+        "is_leap_year": uc.is_leap_year,
+        "month_number": uc.MONTH_NUMBER,
+    }
+    exec(compile(source, filename, "exec"), namespace)
+    function = namespace["parse"]
+
+    # Remove the source code once the function is no longer used, i.e., once
+    # it has been evicted from the cache and no matcher holds it.
+    weakref.finalize(function, linecache.cache.pop, filename, None)
+
+    return function
+
+
+@functools.lru_cache(maxsize=128)
+def get_source(plan: vf.FormatPlan, binary: bool = False) -> str:
+    """
+        Gets the source code of the function generated for the given date
+        format plan.
+
+        DateValidator splits the date at the first occurrence of each
+        separator; hence, every separator must be at its offset, and the
+        fields before it cannot contain it.
+
+        :param plan: The compiled plan of the date format.
+
+        :param binary: True, if the function must take the dates as bytes.
+         False, if it must take them as strings.
+
+        :raise ValueError: If a field in the date format is not delimited by
+         exactly one separator or, if the function must take bytes, if a
+         separator is not an ASCII character.
+
+        :return: The source code of the function.
+    """
+
+    # //////////////////////////////////////////////////////////////////////////
+    # Auxiliary Functions
+    # //////////////////////////////////////////////////////////////////////////
+
+    def at_0(position_0: int) -> str:
+        """
+            Gets the expression of the offset in the date of the given offset
+            in the date format; if the am/pm/m string is the single 'm'
+            character, the offsets after it are shifted by one.
+
+            :param position_0: The offset in the date format.
+
+            :return: The expression of the offset in the date.
+        """
+
+        # The offset is not after the am/pm/m string.
+        if ii_0 < 0 or position_0 < ii_0 + 2:
+            return f"{position_0}"
+
+        return f"{position_0} - s"
+
+    # //////////////////////////////////////////////////////////////////////////
+    # Implementation
+    # //////////////////////////////////////////////////////////////////////////
+
+    # Every field must be delimited by exactly one separator.
+    if len(plan.segments) != len(plan.separators) + 1:
+        raise ValueError(
+            f"A function cannot be generated for the date format, "
+            f"'{plan.dformat}'. Every field must be delimited by exactly one "
+            f"separator."
+        )
+
+    # The bytes are compared byte by byte.
+    if binary and not all(map(str.isascii, plan.separators)):
+        raise ValueError(
+            f"A function that takes bytes cannot be generated for the date "
+            f"format, '{plan.dformat}'. Every separator must be an ASCII "
+            f"character."
+        )
+
+    # Auxiliary variables.
+    names = (
+        "year", "month", "month_name", "day", "day_of_year", "hour", "minute",
+        "second", "tenths", "meridiem"
+    )
+    fields = {}
+    lines = ["def parse(date):"]
+    separators = []
+
+    # Locate the fields and separators in the date format; the offsets are
+    # the same as in a date with a two-letter am/pm string.
+    position = 0
+    for i, segment in enumerate(plan.segments):
+        start = 0
+        for j, char in enumerate(segment):
+            if j == len(segment) - 1 or segment[j + 1] != char:
+                fields[segment[start:j + 1]] = (position + start, position + j)
+                start = j + 1
+
+        # Locate the separator after the segment.
+        if i < len(plan.separators):
+            separators.append(
+                (plan.separators[i], position, position + len(segment))
+            )
+
+        position += len(segment) + 1
+
+    width = position - 1
+    ii_0 = fields["ii"][0] if "ii" in fields else -1
+
+    # Check the length and the separators.
+    noon = b"m" if binary else "m"
+    if ii_0 >= 0:
+        lines.append(f"    s = 1 if date[{ii_0}:{ii_0 + 1}] == {noon!r} else 0")
+        lines.append(f"    if len(date) != {width} - s:")
+    else:
+        lines.append(f"    if len(date) != {width}:")
+    lines.append("        return None")
+
+    for separator, start, end in separators:
+        separator = ord(separator) if binary else separator
+        lines.append(
+            f"    if date[{at_0(end)}] != {separator!r} or "
+            f"{separator!r} in date[{at_0(start)}:{at_0(end)}]:"
+        )
+        lines.append("        return None")
+
+    # Get the numerical value of the fields.
+    lines.append("    try:")
+    for field, (start, end) in fields.items():
+        name = names[vg.FIELD_INDEX[field]]
+        value = f"date[{at_0(start)}:{at_0(end + 1)}]"
+        if field == "ii" and binary:
+            lines.append(
+                f"        meridiem = date[{ii_0}:{ii_0} + 2 - s]"
+                f".decode('latin-1')"
+            )
+        elif field == "ii":
+            lines.append(f"        meridiem = date[{ii_0}:{ii_0} + 2 - s]")
+        elif field == "MMM":
+            lines.append(f"        month = month_number[{value}]")
+        else:
+            lines.append(f"        {name} = int({value})")
+    errors = "(KeyError, ValueError)" if "MMM" in fields else "ValueError"
+    lines.append(f"    except {errors}:")
+    lines.append("        return None")
+
+    # Validate the date; the calendar tables are indexed by the leap year
+    # flag and the month, where the month 0 stands for a missing month.
+    year = "year" if "YYYY" in fields or "YY" in fields else "None"
+    month = "month" if "MM" in fields or "MMM" in fields else "0"
+    leap = "is_leap_year(year)" if year != "None" else (
+        f"{uc.is_leap_year():d}"
+    )
+
+    if year != "None":
+        lines.append("    if year <= 0:")
+        lines.append("        return None")
+
+    if "MM" in fields:
+        lines.append("    if not 1 <= month <= 12:")
+        lines.append("        return None")
+
+    if "DD" in fields:
+        lines.append(f"    if not 1 <= day <= days_in_month[{leap}][{month}]:")
+        lines.append("        return None")
+
+    if "DDD" in fields and month == "0":
+        lines.append(f"    if not 1 <= day_of_year < first_day[{leap}][13]:")
+        lines.append("        return None")
+    elif "DDD" in fields:
+        lines.append(f"    first = first_day[{leap}]")
+        lines.append(
+            "    if not first[month] <= day_of_year < first[month + 1]:"
+        )
+        lines.append("        return None")
+
+    # Validate the time.
+    if "hh" in fields and plan.ampm:
+        lines.append("    if meridiem == 'm':")
+        lines.append("        if hour != 12:")
+        lines.append("            return None")
+        lines.append("    elif meridiem not in ('am', 'pm'):")
+        lines.append("        return None")
+        lines.append("    elif not 1 <= hour <= 12:")
+        lines.append("        return None")
+    elif "hh" in fields:
+        lines.append("    if not 0 <= hour <= 23:")
+        lines.append("        return None")
+
+    for field, maximum in (("mm", 59), ("ss", 59), ("t", 9)):
+        if field in fields:
+            name = names[vg.FIELD_INDEX[field]]
+            lines.append(f"    if not 0 <= {name} <= {maximum}:")
+            lines.append("        return None")
+
+    # Return the parsed fields.
+    values = [
+        name if any(names[vg.FIELD_INDEX[field]] == name for field in fields)
+        else "None"
+        for name in names if name != "month_name"
+    ]
+    values[1] = "None" if month == "0" else month
+    lines.append(f"    return ParsedDate({', '.join(values)})")
+
+    return "\n".join(lines) + "\n"
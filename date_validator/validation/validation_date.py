@@ -7,11 +7,14 @@
 # ##############################################################################
 
 # General.
-from typing import Any
+import functools
+
+from typing import Any, Iterable, Optional, Union
 
 # User defined.
 import date_validator.validation.validation_general as vg
 import date_validator.validation.validation_format as vf
+import date_validator.validation.validation_tokens as vt
 
 # ##############################################################################
 # Classes
@@ -69,8 +72,14 @@ class DateValidator:
         """
             Sets the date to be validated.
 
-            :param date: The string that represents the date to be formatted.
+            :param date: The string that represents the date to be formatted;
+             bytes-like objects are decoded as UTF-8.
         """
+        # Decode the bytes-like objects, instead of getting their
+        # representation.
+        if isinstance(date, (bytes, bytearray, memoryview)):
+            date = bytes(date).decode("utf-8", "replace")
+
         self.__date = str(date)
 
     # ------------------------------------------------------------------------ #
@@ -82,6 +91,13 @@ class DateValidator:
 
             :return: The current stored date format.
         """
+
+        # The format validator is only built when requested.
+        if self.__dformat is None:
+            self.__dformat = vf.FormatValidator(
+                self.plan.dformat, self.plan.ampm
+            )
+
         return self.__dformat
 
     @dformat.setter
@@ -91,7 +107,19 @@ class DateValidator:
 
             :param dformat: The string that represents the date format.
         """
-        self.__dformat = vf.FormatValidator(str(dformat).strip(), self.ampm)
+        self.__plan = self._compile(str(dformat).strip(), self.ampm)
+        self.__dformat = None
+
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def plan(self) -> vf.FormatPlan:
+        """
+            Returns the compiled plan of the date format.
+
+            :return: The compiled plan of the date format.
+        """
+        return self.__plan
 
     # ##########################################################################
     # Constructor
@@ -130,9 +158,78 @@ class DateValidator:
     # ##########################################################################
 
     # --------------------------------------------------------------------------
-    # Get Methods
+    # Parse Methods
+    # --------------------------------------------------------------------------
+
+    def parse(self) -> Optional[vg.ParsedDate]:
+        """
+            Parses the date, validating it in the same pass, with the matcher
+            of the compiled date format.
+
+            :return: None, if the date is not valid. Otherwise, the parsed
+             date; the fields that are not in the date format are set to None.
+        """
+        return get_matcher(self.plan.dformat, self.plan.ampm).parse(self.date)
+
+    # --------------------------------------------------------------------------
+    # Reason Methods
     # --------------------------------------------------------------------------
 
+    def reason(self) -> vg.Reason:
+        """
+            Gets the reason the date is rejected; the first check the date
+            fails, without raising an exception or building a message.
+
+            :return: The reason the date is rejected; vg.Reason.VALID, if the
+             date is valid.
+        """
+
+        # Auxiliary variables.
+        dictionary = {
+            "YYYY": "", "YY": "", "MMM": "", "MM": "", "DDD": "", "DD": "",
+            "hh": "", "mm": "", "ss": "", "t": "", "ii": ""
+        }
+
+        # Split the date into the spans of its fields, in a single pass.
+        spans = self._tokenize(self.plan, self.date)
+
+        # The separators, or the length of the fields, are different.
+        if spans.__class__ is not tuple:
+            return spans
+
+        # Get the different fields in the dictionary.
+        for field in self.plan.fields:
+            start, end = spans[vg.FIELD_INDEX[field]]
+            dictionary[field] = self.date[start:end]
+
+        # Validate the date.
+        if not self._validate_year(dictionary):
+            return vg.Reason.YEAR
+
+        if not self._validate_month(dictionary):
+            return vg.Reason.MONTH
+
+        if not self._validate_day(dictionary):
+            day = dictionary["DDD"] != ""
+            return vg.Reason.DAY_OF_YEAR if day else vg.Reason.DAY
+
+        # Validate the time.
+        if not self._validate_hour(dictionary, self.ampm):
+            meridiem = dictionary["ii"] in ("am", "pm", "m")
+            hour = meridiem or not self.ampm
+            return vg.Reason.HOUR if hour else vg.Reason.MERIDIEM
+
+        if not self._validate_minutes(dictionary):
+            return vg.Reason.MINUTES
+
+        if not self._validate_seconds(dictionary):
+            return vg.Reason.SECONDS
+
+        if not self._validate_tenths(dictionary):
+            return vg.Reason.TENTHS
+
+        return vg.Reason.VALID
+
     # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
     # Private Interface.
     # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -142,283 +239,310 @@ class DateValidator:
     # ##########################################################################
 
     # --------------------------------------------------------------------------
-    # Get Methods
+    # Validate Methods
     # --------------------------------------------------------------------------
 
-    def _get_fields_using_separators(self) -> tuple:
+    def _validate_fields(self) -> bool:
         """
-            Gets the fields that are delimited by the separators.
+            Validates the date against the date format.
 
-            :return: The fields that are delimited by the separators.
+            :return: True, if the date given is in the given format. False,
+             otherwise.
         """
+        return self.reason() == vg.Reason.VALID
 
-        # Auxiliary variables.
-        cntr = 0
-        fields = []
-        length = len(self.date) - 1
-        separators = self.dformat.get_separators()
-        string = ""
+    # ##########################################################################
+    # Stages
+    # ##########################################################################
 
-        # Extract each field.
-        for i, char in enumerate(self.date):
+    # The stages of the validation; validation_profile replaces them with
+    # timed versions while profiling is enabled, so they cost nothing extra
+    # otherwise.
+    _compile = staticmethod(vf.FormatValidator.compile)
+    _tokenize = staticmethod(vt.split)
+    _validate_year = staticmethod(vg.validate_year)
+    _validate_month = staticmethod(vg.validate_month)
+    _validate_day = staticmethod(vg.validate_day)
+    _validate_hour = staticmethod(vg.validate_hour)
+    _validate_minutes = staticmethod(vg.validate_minutes)
+    _validate_seconds = staticmethod(vg.validate_seconds)
+    _validate_tenths = staticmethod(vg.validate_tenths)
+
+
+class FormatMatcher:
+    """
+        Class that validates, and parses, dates against a single date format.
+        The date format is validated and compiled once, when the matcher is
+        built; afterwards, each date only needs to be tokenized and have the
+        ranges of its fields checked.
+
+        The dates can be given as strings or bytes-like objects; bytes are
+        matched against the UTF-8 encoding of the separators, without being
+        decoded.
+    """
 
-            # If the character is not protected.
-            if cntr < len(separators) and char == separators[cntr]:
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+    # Public Interface.
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
-                # Append the string.
-                if string != "":
-                    fields.append(string)
+    # ##########################################################################
+    # Properties
+    # ##########################################################################
 
-                # Look for the next character.
-                string = ""
-                cntr += 1
-                continue
+    @property
+    def ampm(self) -> bool:
+        """
+            Returns the boolean flag that indicates if the date is in am or pm
+             format.
 
-            # Append the character.
-            string += char
+            :return: The boolean flag that indicates if the date is in am or pm
+             format.
+        """
+        return self.__plan.ampm
 
-            # Append the last string.
-            if i == length and string != "":
-                fields.append(string)
+    # ------------------------------------------------------------------------ #
 
-        return tuple(fields)
+    @property
+    def dformat(self) -> str:
+        """
+            Returns the date format.
 
-    def _get_separators(self) -> tuple:
+            :return: The date format the dates are validated against.
         """
-            Gets the fields of the date, just considering the separators
-            in the date format.
+        return self.__plan.dformat
+
+    # ------------------------------------------------------------------------ #
 
-            :return: The fields in the date.
+    @property
+    def plan(self) -> vf.FormatPlan:
         """
+            Returns the compiled plan of the date format.
 
-        # Auxiliary variables.
-        cntr = 0
-        dfields = []
+            :return: The compiled plan of the date format.
+        """
+        return self.__plan
 
-        # Get the separators from the date format.
-        sfields = self.dformat.get_separators()
+    # ##########################################################################
+    # Constructor
+    # ##########################################################################
+
+    def __init__(
+        self, dformat: Any, ampm: Any, max_size: Optional[int] = None
+    ):
+        """
+            Initializes the variables of the format matcher.
+
+            :param dformat: The string that represents the format in which the
+             dates should be given.
+
+            :param ampm: The boolean flag that indicates if the time is given
+             in 12-hr or 24-hr format. True, if the time is given in 12-hr
+             format; False, otherwise.
+
+            :param max_size: The maximum number of characters of a date that
+             is looked at; the longer dates are rejected before being copied,
+             decoded or tokenized. It is never smaller than the size of the
+             longest valid date, which is used if None.
+        """
+
+        # Compile the date format.
+        self.__plan = vf.FormatValidator.compile(
+            str(dformat).strip(), bool(ampm)
+        )
+
+        # Get the tokenizer of the date format and the maximum size of the
+        # dates.
+        self.__split = vt.get_tokenizer(self.__plan).split
+        self.__limits = vg.get_limits(self.__plan.sizes, max_size)
+
+    def __call__(self, date: Union[str, bytes]) -> bool:
+        """
+            The boolean value that indicates if the given date is valid, or not.
+
+            :param date: The string, or bytes-like object, that contains the
+             date to be validated.
+
+            :return: True, if the date given is in the date format. False,
+             otherwise.
+        """
+        return self.validate(date)
+
+    # ##########################################################################
+    # Methods
+    # ##########################################################################
+
+    # --------------------------------------------------------------------------
+    # Parse Methods
+    # --------------------------------------------------------------------------
+
+    def parse(self, date: Union[str, bytes]) -> Optional[vg.ParsedDate]:
+        """
+            Parses the date, validating it in the same pass.
+
+            :param date: The string, or bytes-like object, that contains the
+             date to be parsed.
+
+            :return: None, if the date is not valid. Otherwise, the parsed
+             date; the fields that are not in the date format are set to None.
+        """
+
+        # Reject the oversize dates before copying, or decoding, them.
+        if len(date) > self.__limits[isinstance(date, str)]:
+            return None
+
+        # Turn the subclasses of str, and the bytes-like objects, into
+        # strings and bytes.
+        if date.__class__ is not str and date.__class__ is not bytes:
+            date = str(date) if isinstance(date, str) else bytes(date)
+
+        # Split the date into the spans of its fields.
+        spans = self.__split(date)
+
+        # The date doesn't match the date format.
+        if spans.__class__ is not tuple:
+            return None
 
-        # Search for each character.
-        for i, char in enumerate(self.date):
+        return vg.parse_fields(
+            tuple(date[start:end] for start, end in spans), self.__plan.ampm
+        )
 
-            # If the character matches.
-            if cntr < len(sfields) and char == sfields[cntr]:
-                # Add the character.
-                dfields.append(char)
-                cntr += 1
-                continue
+    # --------------------------------------------------------------------------
+    # Reason Methods
+    # --------------------------------------------------------------------------
+
+    def reason(self, date: Union[str, bytes]) -> vg.Reason:
+        """
+            Gets the reason the date is rejected; the first check the date
+            fails, without raising an exception or building a message.
+
+            :param date: The string, or bytes-like object, that contains the
+             date to be checked.
+
+            :return: The reason the date is rejected; vg.Reason.VALID, if the
+             date is valid.
+        """
+
+        # Reject the oversize dates before copying, or decoding, them.
+        if len(date) > self.__limits[isinstance(date, str)]:
+            return vg.Reason.SIZE
+
+        # Turn the subclasses of str, and the bytes-like objects, into
+        # strings and bytes.
+        if date.__class__ is not str and date.__class__ is not bytes:
+            date = str(date) if isinstance(date, str) else bytes(date)
+
+        # Split the date into the spans of its fields.
+        spans = self.__split(date)
 
-        return tuple(dfields)
+        # The date doesn't match the date format.
+        if spans.__class__ is not tuple:
+            return spans
+
+        return vg.get_reason(
+            tuple(date[start:end] for start, end in spans), self.__plan.ampm
+        )
 
     # --------------------------------------------------------------------------
     # Validate Methods
     # --------------------------------------------------------------------------
 
-    def _validate_fields(self) -> bool:
+    def validate(self, date: Union[str, bytes]) -> bool:
         """
-            Validates that the fields are unique.
+            Validates the date against the date format.
+
+            :param date: The string, or bytes-like object, that contains the
+             date to be validated.
 
-            :raise UniqueFieldsError: If there is a repeated field.
+            :return: True, if the date given is in the date format. False,
+             otherwise.
         """
+        return self.parse(date) is not None
 
-        # //////////////////////////////////////////////////////////////////////
-        # Auxiliary Functions
-        # //////////////////////////////////////////////////////////////////////
+# ##############################################################################
+# Functions
+# ##############################################################################
 
-        # --------------------------- Get Functions -------------------------- #
+# ------------------------------------------------------------------------------
+# Get Functions
+# ------------------------------------------------------------------------------
 
-        def get_ampm_index_0() -> int:
-            """
-                Gets the location of where the am/pm index should be.
-            """
 
-            # No index to return.
-            if not self.ampm:
-                return -1
+@functools.lru_cache(maxsize=128)
+def get_matcher(dformat: str, ampm: bool) -> FormatMatcher:
+    """
+        Gets the matcher of the given date format. The matchers are kept in a
+        bounded least-recently-used cache, keyed on the date format and the
+        12-hr format flag, so the date format is compiled only once.
 
-            # Get the fields only using the separators.
-            fields_0 = self.dformat.get_fields_using_separators()
+        :param dformat: The string that represents the format in which the
+         dates should be given.
 
-            # Get the location of the field.
-            for i_0, field_0 in enumerate(fields_0):
-                if "ii" in field_0:
-                    return i_0
+        :param ampm: The boolean flag that indicates if the time is given in
+         12-hr or 24-hr format. True, if the time is given in 12-hr format;
+         False, otherwise.
 
-            raise ValueError(
-                "The 'ii' field should appear somewhere in the format fields, "
-                f"but this is not happening.\nDate Format Fields: {fields_0}."
-            )
+        :return: The matcher of the date format.
+    """
+    return FormatMatcher(dformat, ampm)
 
+# ------------------------------------------------------------------------------
+# Validate Functions
+# ------------------------------------------------------------------------------
 
-        def get_valid_fields_0() -> bool:
-            """
-                From the tokenized string by the separators, gets the different
-                quantitities to validate.
-
-                :return: False, if the fields cannot be extracted due to a
-                 mismatch in size. True, otherwise.
-            """
-
-            # Get the fields using the separators.
-            date_fields_0 = list(self._get_fields_using_separators())
-            dformat_fields_0 = list(self.dformat.get_fields_using_separators())
-
-            # Get the am/pm/m index and remove it.
-            index_0 = get_ampm_index_0()
-
-            # Find the am/pm/m field and remove it.
-            if index_0 >= 0:
-                # Get the am/pm field index.
-                index_0_1 = dformat_fields_0[index_0].index("ii")
-
-                # Remove the ii entry.
-                str_ini_0 = dformat_fields_0[index_0][:index_0_1]
-                str_end_0 = dformat_fields_0[index_0][index_0_1 + 2:]
-                dformat_fields_0[index_0] = str_ini_0 + str_end_0
-
-                # Get the ii entry.
-                if index_0_1 < len(date_fields_0[index_0]):
-                    # If it indicates noon.
-                    if date_fields_0[index_0][index_0_1] == "m":
-                        ent_0 = date_fields_0[index_0][index_0_1: index_0_1 + 1]
-                        dictionary["ii"] = ent_0
-                        str_ini_0 = date_fields_0[index_0][:index_0_1]
-                        str_end_0 = date_fields_0[index_0][index_0_1 + 1:]
-                        date_fields_0[index_0] = str_ini_0 + str_end_0
-                    else:
-                        ent_0 = date_fields_0[index_0][index_0_1: index_0_1 + 2]
-                        dictionary["ii"] = ent_0
-                        str_ini_0 = date_fields_0[index_0][:index_0_1]
-                        str_end_0 = date_fields_0[index_0][index_0_1 + 2:]
-                        date_fields_0[index_0] = str_ini_0 + str_end_0
-
-            # Check ALL the fields have the same length.
-            for entry_0_0, entry_0_1 in zip(date_fields_0, dformat_fields_0):
-
-                # If fields are not the same length.
-                if len(entry_0_0) != len(entry_0_1):
-                    return False
-
-                # Maximum allowed length.
-                length_0 = len(entry_0_0) - 1
-
-                # Define empty strings.
-                string_0 = ""
-                string_1 = ""
-
-                # Go through each character.
-                for i_0, (char0, char1) in enumerate(zip(entry_0_0, entry_0_1)):
-
-                    # A field has been found.
-                    if i_0 > 0 and char1 != entry_0_1[i_0 - 1]:
-                        dictionary[string_1] = string_0
-                        string_0 = ""
-                        string_1 = ""
-
-                    # Append the characters to the strings.
-                    string_0 += char0
-                    string_1 += char1
-
-                    # Has reached the end.
-                    if i_0 == length_0:
-                        dictionary[string_1] = string_0
-
-            return True
-
-        # ------------------------ Validate Functions ------------------------ #
-
-        def validate_minutes_0() -> bool:
-            """
-                Validates that the minutes are in the proper range, given the
-                format.
-
-                :return: True, if the given minutes are valid. False, otherwise.
-            """
-
-            # No need to validate.
-            if dictionary["mm"] == "":
-                return True
-
-            # Validate the minutes range.
-            try:
-                return 0 <= int(dictionary["mm"]) <= 59
-            except (TypeError, ValueError):
-                return False
-
-        def validate_seconds_0() -> bool:
-            """
-                Validates that the seconds are in the proper range, given the
-                format.
-
-                :return: True, if the given seconds are valid. False, otherwise.
-            """
-
-            # No need to validate.
-            if dictionary["ss"] == "":
-                return True
-
-            # Validate the seconds range.
-            try:
-                return 0 <= int(dictionary["ss"]) <= 59
-            except (TypeError, ValueError):
-                return False
-
-        def validate_tenths_0() -> bool:
-            """
-                Validates that the tenths of seconds are in the proper range,
-                given the format.
-
-                :return: True, if the given tenths of seconds are valid. False,
-                 otherwise.
-            """
-
-            # No need to validate.
-            if dictionary["t"] == "":
-                return True
-
-            # Validate the seconds range.
-            try:
-                return 0 <= int(dictionary["t"]) <= 9
-            except (TypeError, ValueError):
-                return False
-
-        # //////////////////////////////////////////////////////////////////////
-        # Implementation
-        # //////////////////////////////////////////////////////////////////////
 
-        # Auxiliary variables.
-        dictionary = {
-            "YYYY": "", "YY": "", "MMM": "", "MM": "", "DDD": "", "DD": "",
-            "hh": "", "mm": "", "ss": "", "t": "", "ii": ""
-        }
+def validate_many(dates: Iterable, dformat: Any, ampm: Any) -> bytearray:
+    """
+        Validates many dates against the same date format. The date format is
+        compiled only once.
 
-        # Separators are different.
-        if self._get_separators() != self.dformat.get_separators():
-            return False
+        :param dates: The iterable with the strings that contain the dates to
+         be validated.
 
-        # Get the fields that are defined by the separators.
-        fields = self._get_fields_using_separators()
+        :param dformat: The string that represents the format in which the
+         dates should be given.
 
-        # Check the number of fields match.
-        if len(fields) != len(self.dformat.get_fields_using_separators()):
-            return False
+        :param ampm: The boolean flag that indicates if the time is given in
+         12-hr or 24-hr format. True, if the time is given in 12-hr format;
+         False, otherwise.
 
-        # Get the different fields in the dictionary.
-        if not get_valid_fields_0():
-            return False
+        :return: The array with one byte per date, in the same order as the
+         dates; 1, if the date is valid. 0, otherwise.
+    """
+    return bytearray(map(FormatMatcher(dformat, ampm).validate, dates))
 
-        # Validate the date.
-        valid = vg.validate_year(dictionary)
-        valid = valid and vg.validate_month(dictionary)
-        valid = valid and vg.validate_day(dictionary)
+# ------------------------------------------------------------------------------
+# Reason Functions
+# ------------------------------------------------------------------------------
+
+
+def count_reasons(dates: Iterable, dformat: Any, ampm: Any) -> dict:
+    """
+        Counts the reasons many dates are rejected, against the same date
+        format, in a single pass. The date format is compiled only once.
+
+        :param dates: The iterable with the strings, or bytes-like objects,
+         that contain the dates to be checked.
+
+        :param dformat: The string that represents the format in which the
+         dates should be given.
+
+        :param ampm: The boolean flag that indicates if the time is given in
+         12-hr or 24-hr format. True, if the time is given in 12-hr format;
+         False, otherwise.
+
+        :return: The dictionary with the number of dates of each reason,
+         vg.Reason.VALID for the valid dates, keyed on the reason; every
+         reason is included.
+    """
+
+    # Auxiliary variables.
+    counts = [0] * len(vg.Reason)
 
-        # # Validate the time.
-        valid = valid and vg.validate_hour(dictionary)
-        valid = valid and validate_minutes_0()
-        valid = valid and validate_seconds_0()
-        valid = valid and validate_tenths_0()
+    # Count the reasons.
+    for reason in map(FormatMatcher(dformat, ampm).reason, dates):
+        counts[reason] += 1
 
-        return valid
+    return dict(zip(vg.Reason, counts))
 
 # ##############################################################################
 # TO DELETE AFTER VISUAL TESTS.
@@ -0,0 +1,350 @@
+"""
+    File that contains the functions to validate the dates in large files.
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+import codecs
+import concurrent.futures
+import mmap
+import os
+
+from typing import Any, Optional
+
+# User defined.
+import date_validator.validation.validation_date as dv
+import date_validator.validation.validation_vectorized as vv
+
+# ##############################################################################
+# Constants
+# ##############################################################################
+
+# The approximate number of bytes validated by a worker at once.
+CHUNK_SIZE = 1 << 26
+
+# The number of fixed-width records validated at once.
+BLOCK_SIZE = 1 << 16
+
+# ##############################################################################
+# Global Variables
+# ##############################################################################
+
+# The function that validates the dates in each worker process.
+_VALIDATE = None
+
+# ##############################################################################
+# Functions
+# ##############################################################################
+
+# ------------------------------------------------------------------------------
+# Get Functions
+# ------------------------------------------------------------------------------
+
+
+def get_ranges(path: str, size: int = CHUNK_SIZE) -> list:
+    """
+        Splits the file into ranges of approximately the given size, aligned
+        on the new line characters, i.e., each range starts at the beginning
+        of a line and ends after the end of a line.
+
+        :param path: The path to the file.
+
+        :param size: The approximate number of bytes of each range.
+
+        :return: The list of (start, end) tuples with the offsets of each
+         range in the file.
+    """
+
+    # Auxiliary variables.
+    length = os.path.getsize(path)
+    ranges = []
+    start = 0
+
+    # Find the end of each range.
+    with open(path, "rb") as file:
+        while start < length:
+            file.seek(min(start + max(int(size), 1), length))
+            file.readline()
+            end = min(file.tell(), length)
+            ranges.append((start, end))
+            start = end
+
+    return ranges
+
+
+# ------------------------------------------------------------------------------
+# Scan Functions
+# ------------------------------------------------------------------------------
+
+
+def scan_records(
+    path: str, dformat: Any, ampm: Any, stride: int, offset: int = 0,
+    length: Optional[int] = None, block: int = BLOCK_SIZE
+) -> list:
+    """
+        Validates the dates in a file of fixed-width records, where each date
+        is found at the same offset of each record. The file is memory-mapped
+        and walked by stride; an incomplete last record is ignored.
+
+        If NumPy is installed and the date format has a fixed width, with
+        single-byte separators, and the requested length, if any, is that
+        width, the records are validated in place, in blocks, with the
+        VectorizedMatcher, which requires the numerical fields to be ASCII
+        digits; otherwise, each date is validated with the FormatMatcher.
+        The dates in 12-hr format, whose 'ii' string is the single 'm'
+        character, can be padded with trailing spaces or NUL bytes.
+
+        :param path: The path to the file.
+
+        :param dformat: The string that represents the format in which the
+         dates should be given.
+
+        :param ampm: The boolean flag that indicates if the time is given in
+         12-hr or 24-hr format. True, if the time is given in 12-hr format;
+         False, otherwise.
+
+        :param stride: The number of bytes of each record.
+
+        :param offset: The offset of the date within each record; zero by
+         default.
+
+        :param length: The number of bytes of the date; the number of bytes
+         of the date format, encoded as UTF-8, if None.
+
+        :param block: The number of records validated at once.
+
+        :raise ValueError: If the date doesn't fit in the record.
+
+        :return: The list with the indexes, starting at zero, of the records
+         with invalid dates.
+    """
+
+    # Auxiliary variables.
+    invalid = []
+    stride = int(stride)
+    block = max(int(block), 1)
+
+    # Get the engine; the separators of the vectorized matcher must be
+    # single bytes to be found in the records, and its dates must have the
+    # requested length.
+    try:
+        matcher = vv.VectorizedMatcher(dformat, ampm)
+
+    except (ImportError, ValueError):
+        matcher = None
+
+    if matcher is None or not matcher.binary or length not in (
+        None, matcher.width
+    ):
+        matcher = dv.FormatMatcher(dformat, ampm)
+
+    # Get the length of the date, in bytes.
+    if length is None:
+        length = (
+            matcher.width if isinstance(matcher, vv.VectorizedMatcher) else
+            len(matcher.dformat.encode("utf-8"))
+        )
+
+    # The date must fit in the record.
+    if offset < 0 or offset + length > stride:
+        raise ValueError(
+            f"A date of {length} bytes, at offset {offset}, doesn't fit in a "
+            f"record of {stride} bytes."
+        )
+
+    # Nothing to validate.
+    if os.path.getsize(path) < stride:
+        return invalid
+
+    # Walk the records.
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                nrecords = len(view) // stride
+
+                # Validate blocks of records in place.
+                if isinstance(matcher, vv.VectorizedMatcher):
+                    for first in range(0, nrecords, block):
+                        last = min(first + block, nrecords)
+                        mask = matcher.validate_buffer(
+                            view[first * stride: last * stride], stride, offset
+                        )
+                        invalid.extend(
+                            (first + (~mask).nonzero()[0]).tolist()
+                        )
+
+                    return invalid
+
+                # Validate each record; the dates in 12-hr format are
+                # validated again without their padding, if invalid.
+                validate = matcher.validate
+                padded = matcher.ampm
+                for i in range(nrecords):
+                    start = i * stride + offset
+                    with view[start: start + length] as date:
+                        if validate(date):
+                            continue
+
+                        if padded and validate(bytes(date).rstrip(b" \0")):
+                            continue
+
+                    invalid.append(i)
+
+    return invalid
+
+
+# ------------------------------------------------------------------------------
+# Validate Functions
+# ------------------------------------------------------------------------------
+
+
+def validate_file(
+    path: str, dformat: Any, ampm: Any, workers: Optional[int] = None,
+    engine: type = dv.FormatMatcher, encoding: str = "utf-8",
+    chunk_size: int = CHUNK_SIZE
+) -> bytearray:
+    """
+        Validates the dates in a file, one date per line, using several worker
+        processes. The file is split into ranges aligned on the new line
+        characters; the date format is compiled in the current process, to
+        check it, and again by each worker, once, when it starts; then, each
+        worker validates one range at a time.
+
+        :param path: The path to the file.
+
+        :param dformat: The string that represents the format in which the
+         dates should be given.
+
+        :param ampm: The boolean flag that indicates if the time is given in
+         12-hr or 24-hr format. True, if the time is given in 12-hr format;
+         False, otherwise.
+
+        :param workers: The number of worker processes; the number of
+         processors, if None. If one, the file is validated in the current
+         process.
+
+        :param engine: The class that validates the dates; it must take the
+         date format and the 12-hr format flag, and have a validate method.
+         FormatMatcher by default.
+
+        :param encoding: The encoding of the file; utf-8 by default, in which
+         case the lines are validated as bytes, without being decoded. It
+         must be compatible with ASCII, as the lines are split on the new
+         line byte.
+
+        :param chunk_size: The approximate number of bytes validated by a
+         worker at once.
+
+        :raise LookupError: If the encoding doesn't exist.
+
+        :raise ValueError: If the encoding is not compatible with ASCII, e.g.,
+         UTF-16 or UTF-32.
+
+        :return: The array with one byte per line, in the same order as the
+         lines; 1, if the date is valid. 0, otherwise.
+    """
+
+    # The lines are split on the new line byte, before being decoded.
+    if "\n\r0".encode(codecs.lookup(encoding).name) != b"\n\r0":
+        raise ValueError(
+            f"The encoding {encoding!r} is not compatible with ASCII."
+        )
+
+    # Auxiliary variables; the date format is compiled in the current
+    # process, so the format errors are raised the same way, whatever the
+    # number of workers.
+    validate = engine(dformat, ampm).validate
+    ranges = get_ranges(path, chunk_size)
+    results = bytearray()
+    workers = (os.cpu_count() or 1) if workers is None else int(workers)
+
+    # Validate the file in the current process.
+    if workers <= 1 or len(ranges) <= 1:
+        for start, end in ranges:
+            results += _validate_range(path, start, end, encoding, validate)
+        return results
+
+    # Validate the ranges in the worker processes, merging them in order.
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, initializer=_initialize,
+        initargs=(engine, dformat, ampm)
+    ) as executor:
+        futures = [
+            executor.submit(_validate_range, path, start, end, encoding)
+            for start, end in ranges
+        ]
+        for future in futures:
+            results += future.result()
+
+    return results
+
+
+# ------------------------------------------------------------------------------
+# Private Functions
+# ------------------------------------------------------------------------------
+
+
+def _initialize(engine: type, dformat: Any, ampm: Any) -> None:
+    """
+        Compiles the date format in the current worker process.
+
+        :param engine: The class that validates the dates.
+
+        :param dformat: The string that represents the format in which the
+         dates should be given.
+
+        :param ampm: The boolean flag that indicates if the time is given in
+         12-hr or 24-hr format.
+    """
+    global _VALIDATE
+    _VALIDATE = engine(dformat, ampm).validate
+
+
+def _validate_range(
+    path: str, start: int, end: int, encoding: str,
+    validate: Optional[Any] = None
+) -> bytes:
+    """
+        Validates the dates in the given range of the file, one date per line,
+        with the date format compiled in the current process.
+
+        :param path: The path to the file.
+
+        :param start: The offset where the range starts; the beginning of a
+         line.
+
+        :param end: The offset where the range ends; the end of a line, or the
+         end of the file.
+
+        :param encoding: The encoding of the file.
+
+        :param validate: The function that validates each date; the one
+         compiled by the worker process, if None.
+
+        :return: The bytes with one byte per line; 1, if the date is valid. 0,
+         otherwise.
+    """
+
+    # Auxiliary variables.
+    validate = _VALIDATE if validate is None else validate
+
+    # Read the range.
+    with open(path, "rb") as file:
+        file.seek(start)
+        lines = file.read(end - start).split(b"\n")
+
+    # The range ends with a new line character.
+    if lines[-1] == b"":
+        lines.pop()
+
+    # The UTF-8 lines are validated as bytes, without being decoded.
+    if codecs.lookup(encoding).name == "utf-8":
+        return bytes(validate(line.rstrip(b"\r")) for line in lines)
+
+    return bytes(
+        validate(line.rstrip(b"\r").decode(encoding, "replace"))
+        for line in lines
+    )
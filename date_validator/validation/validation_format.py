@@ -7,7 +7,10 @@
 # ##############################################################################
 
 # General.
-from typing import Any
+import enum
+import functools
+
+from typing import Any, Iterable, NamedTuple
 
 # User defined.
 import date_validator.errors.errors_format as ef
@@ -17,6 +20,99 @@ import date_validator.errors.errors_format as ef
 # ##############################################################################
 
 
+class FormatCode(enum.IntEnum):
+    """
+        Enumeration with the result of checking a date format; VALID, if the
+        date format is valid, or the problem found otherwise, one per
+        exception in errors_format.
+    """
+
+    VALID = 0
+    EMPTY = 1
+    REPEATED = 2
+    FIELD = 3
+    AMPM = 4
+    DAY = 5
+    HOUR = 6
+    MINUTES = 7
+    SECONDS = 8
+    TENTHS = 9
+
+
+class FormatCheck(NamedTuple):
+    """
+        Immutable result of checking a date format, without raising an
+        exception or building its message.
+
+        Parameters:
+        __________
+
+        - code: The FormatCode with the result of the check.
+
+        - fields: The fields that cause the problem; the repeated fields, the
+          field that doesn't exist, the missing 'hh' and/or 'ii' fields, or
+          the field that needs a larger field to be validated. Empty, if the
+          date format is valid or has no fields.
+    """
+
+    code: FormatCode
+    fields: tuple
+
+
+class FormatPlan(NamedTuple):
+    """
+        Immutable, hashable and pre-computed representation of a validated
+        date format; everything that is needed to tokenize a date without
+        going through the date format string again.
+
+        Parameters:
+        __________
+
+        - dformat: The validated date format string.
+
+        - ampm: True, if the time is given in 12-hr format. False, otherwise.
+
+        - fields: The fields in the date format, as given by
+          FormatValidator.get_fields.
+
+        - separators: The separators in the date format, as given by
+          FormatValidator.get_separators.
+
+        - segments: The fields delimited by the separators, as given by
+          FormatValidator.get_fields_using_separators.
+
+        - lengths: The length of each segment, once the 'ii' string has been
+          removed from it.
+
+        - spans: The (field, segment, start, end) tuples that locate each
+          field, other than 'ii', within its segment; the start and end
+          indexes are given once the 'ii' string has been removed from the
+          segment.
+
+        - ii: The (segment, index) tuple that locates the 'ii' string; (-1, -1)
+          if the time is not given in 12-hr format.
+
+        - sizes: The set with the number of characters of a valid date; the
+          'ii' string can be the single 'm' character.
+
+        - positions: The (index, separator) tuples with the separators found
+          at a fixed index of every valid date; the indexes after the 'ii'
+          string are negative, i.e., counted from the end of the date. Empty,
+          unless every field is delimited by exactly one separator.
+    """
+
+    dformat: str
+    ampm: bool
+    fields: tuple
+    separators: tuple
+    segments: tuple
+    lengths: tuple
+    spans: tuple
+    ii: tuple
+    sizes: frozenset
+    positions: tuple
+
+
 class FormatValidator:
     """
         Class that contains the functions to validate the date format string.
@@ -84,12 +180,7 @@ class FormatValidator:
             :return: Returns the valid formats that the date can take.
         """
 
-        formats = (
-            'YYYY', 'YY', 'MMM', 'MM', 'DDD', 'DD', 'hh', 'mm', 'ss', 't',
-            'ii',
-        )
-
-        return formats if self.ampm else formats[:-1]
+        return _FORMATS if self.ampm else _FORMATS[:-1]
 
     # ------------------------------------------------------------------------ #
 
@@ -101,11 +192,7 @@ class FormatValidator:
             :return: Returns the protected characters.
         """
 
-        characters = (
-            'Y', 'M', 'D', 'h', 'm', 's', 't', 'i'
-        )
-
-        return characters if self.ampm else characters[:-1]
+        return _PROTECTED if self.ampm else _PROTECTED[:-1]
 
     # ##########################################################################
     # Constructor
@@ -132,44 +219,40 @@ class FormatValidator:
     # ##########################################################################
 
     # --------------------------------------------------------------------------
-    # Get Methods
+    # Compile Methods
     # --------------------------------------------------------------------------
 
-    def get_fields(self) -> tuple:
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def compile(dformat: str, ampm: bool) -> FormatPlan:
         """
-            Gets the fields that are in the date format.
+            Validates the date format and gets its plan. The plans are kept in
+            a bounded least-recently-used cache, keyed on the date format and
+            the 12-hr format flag, so validating a date format that has been
+            seen recently costs a single dictionary lookup.
 
-            :return: The fields that are in the date format.
-        """
-
-        # Auxiliary variables.
-        dformat = self.dformat
-        fields = []
-        length = len(dformat) - 1
-        string = ""
-
-        # Extract each field.
-        for i, char in enumerate(dformat):
+            :param dformat: The string that represents the format in which the
+             date should be given.
 
-            # If the character is not protected.
-            if char not in self.protected:
-                fields.append(string) if string != "" else None
-                string = ""
-                continue
+            :param ampm: The boolean flag that indicates if the time is given
+             in 12-hr or 24-hr format. True, if the time is given in 12-hr
+             format; False, otherwise.
 
-            # Get the field.
-            if i > 0 and char != dformat[i - 1]:
-                fields.append(string) if string != "" else None
-                string = ""
+            :return: The plan of the validated date format.
+        """
+        return FormatValidator(dformat, ampm).get_plan()
 
-            # Append the character.
-            string += char
+    # --------------------------------------------------------------------------
+    # Get Methods
+    # --------------------------------------------------------------------------
 
-            # Append the last string.
-            if i == length and string != "":
-                fields.append(string) if string != "" else None
+    def get_fields(self) -> tuple:
+        """
+            Gets the fields that are in the date format.
 
-        return tuple(fields)
+            :return: The fields that are in the date format.
+        """
+        return _get_fields(self.dformat, self.protected)
 
     def get_fields_using_separators(self) -> tuple:
         """
@@ -202,6 +285,67 @@ class FormatValidator:
 
         return tuple(fields)
 
+    def get_plan(self) -> FormatPlan:
+        """
+            Gets the plan of the date format, i.e., the pre-computed fields,
+            separators, field spans, location of the 'ii' string, sizes of a
+            valid date and fixed separator positions.
+
+            :return: The plan of the date format.
+        """
+
+        # Auxiliary variables.
+        ii = (-1, -1)
+        lengths = []
+        segments = self.get_fields_using_separators()
+        spans = []
+
+        # Locate the fields in each segment.
+        for i, segment in enumerate(segments):
+
+            # Find the am/pm/m field and remove it.
+            if self.ampm and ii == (-1, -1) and "ii" in segment:
+                index = segment.index("ii")
+                ii = (i, index)
+                segment = segment[:index] + segment[index + 2:]
+
+            # Get the span of each field.
+            start = 0
+            for j, char in enumerate(segment):
+                if j > 0 and char != segment[j - 1]:
+                    spans.append((segment[start:j], i, start, j))
+                    start = j
+
+            # Append the last field.
+            if segment != "":
+                spans.append((segment[start:], i, start, len(segment)))
+
+            lengths.append(len(segment))
+
+        # The 'ii' string can be the single 'm' character.
+        size = len(self.dformat)
+        sizes = {size - 1, size} if ii != (-1, -1) else {size}
+
+        # Every separator is at a fixed index, counted from the end of the
+        # date after the 'ii' string, if every field is delimited by exactly
+        # one separator.
+        positions = []
+        separators = self.get_separators()
+        if len(segments) == len(separators) + 1:
+            index = 0
+            for i, separator in enumerate(separators):
+                index += len(segments[i])
+                position = index if ii[0] < 0 or i < ii[0] else index - size
+                positions.append((position, separator))
+                index += 1
+
+        return FormatPlan(
+            dformat=self.dformat, ampm=self.ampm, fields=self.get_fields(),
+            separators=separators, segments=segments,
+            lengths=tuple(lengths), spans=tuple(spans), ii=ii,
+            sizes=frozenset(sizes), positions=tuple(positions)
+        )
+
     def get_separators(self) -> tuple:
         """
             Gets the non-protected characters in the order that they appear.
@@ -236,231 +380,219 @@ class FormatValidator:
 
     def _validate_fields(self) -> None:
         """
-            Validates that the fields are unique.
+            Validates that the fields are unique, exist, and are enough to
+            validate the dates.
 
-            :raise UniqueFieldsError: If there is a repeated field.
-        """
+            :raise EmptyFormatError: If there are no fields.
+
+            :raise RepeatedFieldsError: If there is a repeated field.
 
-        # //////////////////////////////////////////////////////////////////////
-        # Auxiliary Functions
-        # //////////////////////////////////////////////////////////////////////
-
-        def check_ampm_0() -> None:
-            """
-                Checks that, if the 12-hr format is requested, an hour is
-                provided. If the am/pm indicator is given, the hour MUST be
-                present.
-
-                :raise AmPmFormatError: If the given fields are not enough to
-                 determine if the given day is valid.
-            """
-
-            # Check that the am/pm flag is present, also an hour is given.
-            if "ii" not in fields or "hh" not in fields:
-                raise ef.AmPmFormatError()
-
-        def check_day_0() -> None:
-            """
-                Checks that, if the day is given in DD format, a month is
-                present. If the day is given in DDD format, the month must NOT
-                be present.
-
-                :raise DayFormatError: If the given fields are not enough to
-                 determine if the given day is valid.
-            """
-
-            # If the day is not given, no need to validate.
-            if "DDD" not in fields and "DD" not in fields:
-                return
-
-            # Check that a month is given.
-            if "DD" in fields:
-                if not ("MMM" in fields or 'MM' in fields):
-                    raise ef.DayFormatError()
-
-        def check_hour_0() -> None:
-            """
-                Checks that, if the hour is given, no year, month or day is
-                present or, at least, the day is present.
-
-                :raise HourFormatError: If the given fields are not enough to
-                 determine if the given hour is valid.
-            """
-
-            # If no hour is given, no need to validate.
-            if 'hh' not in fields:
-                return
-
-            # If the year, month and day are not given, no need to validate.
-            skip_0 = "YYYY" not in fields and "YY" not in fields
-            skip_0 = skip_0 and "MMM" not in fields and "MM" not in fields
-            skip_0 = skip_0 and "DDD" not in fields and "DD" not in fields
-
-            # No need to validate.
-            if skip_0:
-                return
-
-            # Must contain a day for the time to make sense.
-            if "DDD" not in fields and "DD" not in fields:
-                raise ef.HourFormatError()
-
-        def check_minutes_0() -> None:
-            """
-                Checks that, if the minutes are given, no year, month, day or
-                hour are present or, at least, an hour is present.
-
-                :raise MinutesFormatError: If the given fields are not enough to
-                 determine if the given minutes are valid.
-            """
-
-            # If no minutes are given, no need to validate.
-            if 'mm' not in fields:
-                return
-
-            # If the year, month and day are not given, no need to validate.
-            skip_0 = "YYYY" not in fields and "YY" not in fields
-            skip_0 = skip_0 and "MMM" not in fields and "MM" not in fields
-            skip_0 = skip_0 and "DDD" not in fields and "DD" not in fields
-            skip_0 = skip_0 and "hh" not in fields
-
-            # No need to validate.
-            if skip_0:
-                return
-
-            # Must contain an hour for the time to make sense.
-            if "hh" not in fields:
-                raise ef.MinutesFormatError()
-
-        def check_seconds_0() -> None:
-            """
-                Checks that, if the seconds are given, no year, month, day, hour
-                and/or minutes are given or, at least, the minutes are present.
-
-                :raise SecondsFormatError: If the given fields are not enough to
-                 determine if the given seconds are valid.
-            """
-
-            # If no minutes are given, no need to validate.
-            if 'ss' not in fields:
-                return
-
-            # If the year, month and day are not given, no need to validate.
-            skip_0 = "YYYY" not in fields and "YY" not in fields
-            skip_0 = skip_0 and "MMM" not in fields and "MM" not in fields
-            skip_0 = skip_0 and "DDD" not in fields and "DD" not in fields
-            skip_0 = skip_0 and "hh" not in fields and "mm" not in fields
-
-            # No need to validate.
-            if skip_0:
-                return
-
-            # Must contain an hour for the time to make sense.
-            if "mm" not in fields:
-                raise ef.SecondsFormatError()
-
-        def check_tenths_0() -> None:
-            """
-                Checks that, if the seconds are given, no year, month, day,
-                hour, minutes, and/or seconds are given or, at least, the
-                seconds are present.
-
-                :raise TenthsFormatError: If the given fields are not enough to
-                 determine if the given tenths of second are valid.
-            """
-
-            # If no minutes are given, no need to validate.
-            if 't' not in fields:
-                return
-
-            # If the year, month and day are not given, no need to validate.
-            skip_0 = "YYYY" not in fields and "YY" not in fields
-            skip_0 = skip_0 and "MMM" not in fields and "MM" not in fields
-            skip_0 = skip_0 and "DDD" not in fields and "DD" not in fields
-            skip_0 = skip_0 and "hh" not in fields and "mm" not in fields
-            skip_0 = skip_0 and "ss" not in fields
-
-            # No need to validate.
-            if skip_0:
-                return
-
-            # Must contain an hour for the time to make sense.
-            if "ss" not in fields:
-                raise ef.TenthsFormatError()
-
-        def existing_fields_0() -> None:
-            """
-                Validates that the requested fields exist.
-
-                :raise FieldFortmatError: If there is a field that that doesn't
-                 exist.
-            """
-
-            field_names_0 = {
-                'Y': 'years', 'M': 'months', 'D': 'days', 'h': 'hours',
-                'm': 'minutes', 's': 'seconds', 't': 'tenths of seconds'
-            }
-
-            not_valid_0 = []
-
-            # For each field.
-            for field_0 in fields:
-                # If the fields don't match.
-                if field_0 not in self.formats:
-                    # Get the field name.
-                    field_name_0 = field_names_0[field_0[0]]
-                    for key_0 in self.formats:
-                        not_valid_0.append(key_0) if field_0[0] in key_0 else 0
-
-                    raise ef.FieldFormatError(
-                        field_name_0, field_0, tuple(not_valid_0)
-                    )
-
-        def unique_fields_0() -> None:
-            """
-                Validates that the requested fields are unique and valid.
-
-                :raise UniqueFieldsError: If there is a repeated field.
-            """
-
-            # If the field is empty.
-            if len(fields) == 0:
-                raise ef.EmptyFormatError(self.dformat, self.get_fields())
-
-            # For each field.
-            for i_0, field_0_0 in enumerate(fields):
-                # Compare against other fields.
-                for j_0, field_0_1 in enumerate(fields[i_0 + 1:]):
-                    # Repeated fields shouldn't exist.
-                    if field_0_0[0] == field_0_1[0]:
-                        raise ef.RepeatedFieldsError(fields)
-
-        # //////////////////////////////////////////////////////////////////////
-        # Implementation
-        # //////////////////////////////////////////////////////////////////////
+            :raise FieldFormatError: If there is a field that doesn't exist.
+
+            :raise AmPmFormatError: If the 12-hr format is requested, but no
+             hour or 'ii' string is given.
+
+            :raise DayFormatError, HourFormatError, MinutesFormatError,
+             SecondsFormatError, TenthsFormatError: If a field is given without
+             the fields needed to validate it.
+        """
 
         # Auxiliary variables.
         fields = self.get_fields()
+        errors = {
+            FormatCode.AMPM: ef.AmPmFormatError,
+            FormatCode.DAY: ef.DayFormatError,
+            FormatCode.HOUR: ef.HourFormatError,
+            FormatCode.MINUTES: ef.MinutesFormatError,
+            FormatCode.SECONDS: ef.SecondsFormatError,
+            FormatCode.TENTHS: ef.TenthsFormatError,
+        }
+        field_names = {
+            'Y': 'years', 'M': 'months', 'D': 'days', 'h': 'hours',
+            'm': 'minutes', 's': 'seconds', 't': 'tenths of seconds',
+            'i': 'am/pm/m strings'
+        }
+
+        # Check the fields.
+        code, offending = _check_fields(fields, self.formats, self.ampm)
+
+        if code == FormatCode.EMPTY:
+            raise ef.EmptyFormatError(self.dformat, self.formats)
+
+        if code == FormatCode.REPEATED:
+            raise ef.RepeatedFieldsError(fields)
+
+        if code == FormatCode.FIELD:
+            field = offending[0]
+            raise ef.FieldFormatError(
+                field_names[field[0]], field,
+                tuple(key for key in self.formats if field[0] in key)
+            )
+
+        if code in errors:
+            raise errors[code]()
+
+# ##############################################################################
+# Functions
+# ##############################################################################
+
+# ------------------------------------------------------------------------------
+# Check Functions
+# ------------------------------------------------------------------------------
+
+
+def check_format(dformat: Any, ampm: Any) -> FormatCheck:
+    """
+        Checks the date format in the same way FormatValidator does, but
+        without raising an exception or building its message.
+
+        :param dformat: The string that represents the format in which the
+         dates should be given.
+
+        :param ampm: The boolean flag that indicates if the time is given in
+         12-hr or 24-hr format. True, if the time is given in 12-hr format;
+         False, otherwise.
+
+        :return: The result of the check; its code is FormatCode.VALID, if the
+         date format is valid.
+    """
+
+    # Auxiliary variables.
+    ampm = bool(ampm)
+    formats = _FORMATS if ampm else _FORMATS[:-1]
+    protected = _PROTECTED if ampm else _PROTECTED[:-1]
+
+    # Check the fields.
+    fields = _get_fields(str(dformat).strip(), protected)
+    return FormatCheck(*_check_fields(fields, formats, ampm))
+
 
-        # Validate the fields are unique.
-        unique_fields_0()
+def check_formats(dformats: Iterable, ampm: Any) -> list:
+    """
+        Checks many date formats, in the same way check_format does.
+
+        :param dformats: The iterable with the strings that represent the date
+         formats.
+
+        :param ampm: The boolean flag that indicates if the time is given in
+         12-hr or 24-hr format, for every date format.
+
+        :return: The list with the result of the check of each date format, in
+         the same order.
+    """
+    return [check_format(dformat, ampm) for dformat in dformats]
+
+
+# ------------------------------------------------------------------------------
+# Private Functions
+# ------------------------------------------------------------------------------
+
+# The fields and protected characters of a date format, in 12-hr format; the
+# 'ii' string, and the 'i' character, are the last ones.
+_FORMATS = (
+    'YYYY', 'YY', 'MMM', 'MM', 'DDD', 'DD', 'hh', 'mm', 'ss', 't', 'ii',
+)
+_PROTECTED = ('Y', 'M', 'D', 'h', 'm', 's', 't', 'i')
+
+
+def _check_fields(fields: tuple, formats: tuple, ampm: bool) -> tuple:
+    """
+        Checks that the fields of a date format are unique, exist, and are
+        enough to validate the dates.
+
+        :param fields: The fields in the date format.
+
+        :param formats: The valid formats that the fields can take.
+
+        :param ampm: The boolean flag that indicates if the time is given in
+         12-hr or 24-hr format.
+
+        :return: The tuple with the FormatCode and the fields that cause the
+         problem.
+    """
+
+    # Auxiliary variables.
+    date = {"YYYY", "YY", "MMM", "MM", "DDD", "DD"}.intersection(fields)
+
+    # The date format has no fields.
+    if len(fields) == 0:
+        return FormatCode.EMPTY, ()
+
+    # The fields must be unique.
+    letters = [field[0] for field in fields]
+    if len(set(letters)) != len(letters):
+        return FormatCode.REPEATED, tuple(
+            field for field in fields if letters.count(field[0]) > 1
+        )
+
+    # The fields must exist.
+    for field in fields:
+        if field not in formats:
+            return FormatCode.FIELD, (field,)
+
+    # The am/pm flag needs an hour and the 'ii' string.
+    if ampm and ("ii" not in fields or "hh" not in fields):
+        return FormatCode.AMPM, tuple(
+            field for field in ("hh", "ii") if field not in fields
+        )
+
+    # A day of the month needs a month.
+    if "DD" in fields and not ("MMM" in fields or "MM" in fields):
+        return FormatCode.DAY, ("DD",)
+
+    # Each time field needs the larger time field, if a date is given.
+    checks = (
+        ("hh", ("DDD", "DD"), FormatCode.HOUR),
+        ("mm", ("hh",), FormatCode.MINUTES),
+        ("ss", ("mm",), FormatCode.SECONDS),
+        ("t", ("ss",), FormatCode.TENTHS),
+    )
+    larger = set(date)
+    for field, required, code in checks:
+        if field in fields and larger:
+            if not any(other in fields for other in required):
+                return code, (field,)
+        larger.add(field) if field in fields else None
+
+    return FormatCode.VALID, ()
+
+
+def _get_fields(dformat: str, protected: tuple) -> tuple:
+    """
+        Gets the fields that are in the date format.
+
+        :param dformat: The date format.
+
+        :param protected: The protected characters, i.e., the characters
+         that make the fields.
+
+        :return: The fields that are in the date format.
+    """
 
-        # Validate the fields exist.
-        existing_fields_0()
+    # Auxiliary variables.
+    fields = []
+    length = len(dformat) - 1
+    string = ""
 
-        # Check the am/pm flag.
-        check_ampm_0() if self.ampm else None
+    # Extract each field.
+    for i, char in enumerate(dformat):
 
-        # Check the day.
-        check_day_0()
+        # If the character is not protected.
+        if char not in protected:
+            fields.append(string) if string != "" else None
+            string = ""
+            continue
 
-        # Check the hour.
-        check_hour_0()
+        # Get the field.
+        if i > 0 and char != dformat[i - 1]:
+            fields.append(string) if string != "" else None
+            string = ""
 
-        # Check the minutes.
-        check_minutes_0()
+        # Append the character.
+        string += char
 
-        # Check the seconds.
-        check_seconds_0()
+        # Append the last string.
+        if i == length and string != "":
+            fields.append(string) if string != "" else None
 
-        # Check the tenths of seconds.
-        check_tenths_0()
+    return tuple(fields)
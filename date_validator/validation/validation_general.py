@@ -7,134 +7,369 @@
 # Imports
 # ##############################################################################
 
+# General.
+import enum
+
+from typing import NamedTuple, Optional, Union
+
+# User defined.
+import date_validator.utilities.utilities_calendar as uc
+
+# ##############################################################################
+# Constants
+# ##############################################################################
+
+# The index of each date format field in the tuple of fields taken by
+# parse_fields.
+FIELD_INDEX = {
+    "YYYY": 0, "YY": 0, "MM": 1, "MMM": 2, "DD": 3, "DDD": 4, "hh": 5,
+    "mm": 6, "ss": 7, "t": 8, "ii": 9
+}
+
+# The maximum number of bytes of a character encoded in UTF-8.
+UTF8_WIDTH = 4
+
+# The valid am/pm/m strings.
+_MERIDIEMS = frozenset(("am", "pm", "m"))
+
+# ##############################################################################
+# Classes
+# ##############################################################################
+
+
+class Reason(enum.IntEnum):
+    """
+        Enumeration with the reason a date is rejected; VALID, if the date is
+        valid. The reason is the first check the date fails, in the order the
+        checks are run.
+    """
+
+    # The date is valid.
+    VALID = 0
+
+    # The date doesn't match the layout of the date format; the wrong size,
+    # a separator out of place or missing, the wrong number of segments, or
+    # a segment of the wrong length.
+    SIZE = 1
+    SEPARATOR = 2
+    SEGMENTS = 3
+    LENGTH = 4
+
+    # A field is out of range, or is not a number.
+    YEAR = 5
+    MONTH = 6
+    DAY = 7
+    DAY_OF_YEAR = 8
+    HOUR = 9
+    MERIDIEM = 10
+    MINUTES = 11
+    SECONDS = 12
+    TENTHS = 13
+
+
+class ParsedDate(NamedTuple):
+    """
+        Immutable, tuple-backed, result of parsing a valid date; the fields
+        that are not in the date format are set to None.
+
+        Parameters:
+        __________
+
+        - year: The year.
+
+        - month: The number of the month, from 1 to 12; also given when the
+          month is in three-letter format.
+
+        - day: The day of the month.
+
+        - day_of_year: The day of the year.
+
+        - hour: The hour, as given in the date; 12-hr or 24-hr format.
+
+        - minute: The minutes.
+
+        - second: The seconds.
+
+        - tenths: The tenths of second.
+
+        - meridiem: The am/pm/m string.
+    """
+    year: Optional[int] = None
+    month: Optional[int] = None
+    day: Optional[int] = None
+    day_of_year: Optional[int] = None
+    hour: Optional[int] = None
+    minute: Optional[int] = None
+    second: Optional[int] = None
+    tenths: Optional[int] = None
+    meridiem: Optional[str] = None
+
 
 # ##############################################################################
 # Functions
 # ##############################################################################
 
 # ------------------------------------------------------------------------------
-# Validate Functions
+# Get Functions
 # ------------------------------------------------------------------------------
 
 
-def validate_day(dictionary: dict) -> bool:
+def get_days_in_month(month: int = None, year: int = None) -> int:
     """
-        Validates that the day is given as a day of the month or a day of the
-        year.
+        Gets the number of days in the given month. If no month is given, it
+        can be safely assumed that the value to be returned is 31. If no year
+        is given, the year is assumed to be a leap year.
 
-        :param dictionary: The dictionary that contains the string, or object,
-         that represents the day.
+        :param month: The number of the month, from 1 to 12; None, if no month
+         is given.
 
+        :param year: The year; None, if no year is given.
 
-        :return: True, if the day is valid. False, otherwise.
+        :return: The number of days in the given month.
     """
+    return uc.DAYS_IN_MONTH[uc.is_leap_year(year)][month or 0]
 
-    # //////////////////////////////////////////////////////////////////////////
-    # Auxiliary Functions.
-    # //////////////////////////////////////////////////////////////////////////
 
-    def get_month_days_0() -> int:
-        """
-            Gets the number of days in the given month. If no month is
-            given, it can be safely assumed that the value to be returned is
-            31.
+def get_days_of_year_range(month: int = None, year: int = None) -> tuple:
+    """
+        Gets the range of days of the year that fall in the given month. If no
+        month is given, the range spans the whole year. If no year is given,
+        the year is assumed to be a leap year.
 
-            :return: The number of days in the given month.
-        """
+        :param month: The number of the month, from 1 to 12; None, if no month
+         is given.
 
-        # No month is given.
-        if dictionary["MMM"] == "" and dictionary["MM"] == "":
-            return 31
+        :param year: The year; None, if no year is given.
 
-        # Get the year.
-        year_0 = 0 if dictionary["YYYY"] == "" else int(dictionary["YYYY"])
-        year_0 = year_0 if dictionary["YY"] == "" else int(dictionary["YY"])
+        :return: The first day of the year in the month, and the first day of
+         the year after the month.
+    """
 
-        # Get the number month.
-        if dictionary["MMM"] != "":
-            month_0 = {
-                "JAN": 1, "FEB": 2, "MAR": 3, "APR": 4, "MAY": 5,
-                "JUN": 6, "JUL": 7, "AUG": 8, "SEP": 9, "OCT": 10,
-                "NOV": 11, "DEC": 12
-            }[dictionary["MMM"]]
-        else:
-            month_0 = int(dictionary["MM"])
+    # Auxiliary variables.
+    first_day = uc.FIRST_DAY[uc.is_leap_year(year)]
 
-        # Get the number of days in a month.
-        return {
-            1: 31, 2: 29 if year_0 % 4 == 0 else 28, 3: 31, 4: 30, 5: 31,
-            6: 30, 7: 31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31
-        }[month_0]
+    # No month is given.
+    if month is None:
+        return 1, first_day[13]
 
-    def get_month_days_range_0() -> tuple:
-        """
-            Gets the number of days that have gone by in the given year, up
-            to the given month and the month after.
+    return first_day[month], first_day[month + 1]
 
-            :return: The number of days gone up to given month, plus one.
-        """
 
-        # Get the year.
-        year_0 = 0 if dictionary["YYYY"] == "" else int(dictionary["YYYY"])
-        year_0 = year_0 if dictionary["YY"] == "" else int(dictionary["YY"])
+def get_limits(sizes: frozenset, max_size: Optional[int] = None) -> tuple:
+    """
+        Gets the maximum size of a date that the engines look at, given the
+        sizes of a valid date; the longer dates are rejected before being
+        copied, decoded or tokenized. The maximum size is clamped to the size
+        of the longest valid date, so the valid dates are never rejected.
 
-        # No month is given.
-        if dictionary["MMM"] == "" and dictionary["MM"] == "":
-            return 1, 367 if year_0 % 4 == 0 else 366
+        :param sizes: The set with the number of characters of a valid date.
 
-        # Define the number of days in a month.
-        days_in_month_0 = {
-            0: 1, 1: 30, 2: 29 if year_0 % 4 == 0 else 28, 3: 31, 4: 30,
-            5: 31, 6: 30, 7: 31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31
-        }
+        :param max_size: The maximum number of characters of a date; the
+         size of the longest valid date, if None or smaller.
 
-        # Get the number month.
-        if dictionary["MMM"] != "":
-            month_0 = {
-                "JAN": 1, "FEB": 2, "MAR": 3, "APR": 4, "MAY": 5,
-                "JUN": 6, "JUL": 7, "AUG": 8, "SEP": 9, "OCT": 10,
-                "NOV": 11, "DEC": 12
-            }[dictionary["MMM"]]
+        :return: The tuple with the maximum number of bytes, of the dates
+         given as bytes-like objects, and characters, of the dates given as
+         strings; it can be indexed by the boolean flag that indicates if the
+         date is a string.
+    """
+
+    # Auxiliary variables; the valid dates must not be rejected.
+    limit = max(sizes)
+    if max_size is not None:
+        limit = max(int(max_size), limit)
+
+    return UTF8_WIDTH * limit, limit
+
+
+def get_month_number(month: Union[str, bytes]) -> int:
+    """
+        Gets the number of the month given in three-letter format; the month
+        is NOT case-sensitive.
+
+        :param month: The string, or bytes, with the three-letter month, e.g.,
+         'FEB'.
+
+        :raise ValueError: If the string is not a three-letter month.
+
+        :return: The number of the month, from 1 to 12.
+    """
+
+    # Find the month.
+    try:
+        return uc.MONTH_NUMBER[month]
+    except KeyError:
+        raise ValueError(f"{month!r} is not a valid three-letter month.")
+
+
+def get_reason(fields: tuple, ampm: bool) -> Reason:
+    """
+        Gets the reason the fields extracted from a date are rejected; the
+        first field that is out of range, or is not a number, in the order
+        the validate functions are run. Neither exceptions, other than the one
+        int() raises for the fields that are not numbers, nor strings are
+        created.
+
+        :param fields: The tuple with the fields of the date, strings or
+         bytes, in the order given by FIELD_INDEX, as taken by parse_fields.
+
+        :param ampm: Boolean flag that indicates if the time is given in 12-hr
+         format or 24-hr format. True, if the hour is given in 12-hr format;
+         False, if the hour is given in 24-hr format.
+
+        :return: The reason the date is rejected; Reason.VALID, if the date is
+         valid, i.e., if parse_fields doesn't return None.
+    """
+    return check_values(_get_values(fields), ampm)
+
+
+# ------------------------------------------------------------------------------
+# Check Functions
+# ------------------------------------------------------------------------------
+
+
+def check_values(values: tuple, ampm: bool) -> Reason:
+    """
+        Checks the ranges of the numerical values of a date, in the order the
+        validate functions are run; it is the range check shared by every
+        engine.
+
+        :param values: The sequence with the year, month, day, day of year,
+         hour, minutes, seconds, tenths of second and am/pm/m string, in the
+         order of ParsedDate; None for the fields that are not in the date
+         format, and -1 for the fields that are not numbers.
+
+        :param ampm: Boolean flag that indicates if the time is given in 12-hr
+         format or 24-hr format. True, if the hour is given in 12-hr format;
+         False, if the hour is given in 24-hr format.
+
+        :return: The reason the values are rejected; Reason.VALID, if they are
+         valid.
+    """
+
+    # Auxiliary variables.
+    year, month, day, day_of_year, hour, minute, second, tenths, meridiem = (
+        values
+    )
+
+    # Validate the date.
+    if year is not None and year <= 0:
+        return Reason.YEAR
+
+    if month is not None and not 1 <= month <= 12:
+        return Reason.MONTH
+
+    if day is not None and not 1 <= day <= get_days_in_month(month, year):
+        return Reason.DAY
+
+    if day_of_year is not None:
+        first, last = get_days_of_year_range(month, year)
+        if not first <= day_of_year < last:
+            return Reason.DAY_OF_YEAR
+
+    # Validate the time.
+    if hour is not None:
+        if not ampm:
+            valid = 0 <= hour <= 23
+        elif meridiem not in _MERIDIEMS:
+            return Reason.MERIDIEM
+        elif meridiem == "m":
+            valid = hour == 12
         else:
-            month_0 = int(dictionary["MM"])
+            valid = 1 <= hour <= 12
+
+        if not valid:
+            return Reason.HOUR
+
+    if minute is not None and not 0 <= minute <= 59:
+        return Reason.MINUTES
+
+    if second is not None and not 0 <= second <= 59:
+        return Reason.SECONDS
+
+    if tenths is not None and not 0 <= tenths <= 9:
+        return Reason.TENTHS
+
+    return Reason.VALID
+
+
+# ------------------------------------------------------------------------------
+# Parse Functions
+# ------------------------------------------------------------------------------
+
+
+def parse_fields(fields: tuple, ampm: bool) -> Optional[ParsedDate]:
+    """
+        Converts the fields extracted from a date into numbers and validates
+        their ranges, in the same way the validate functions do.
+
+        :param fields: The tuple with the year, month, three-letter month, day,
+         day of year, hour, minutes, seconds, tenths of second and am/pm/m
+         strings, or bytes, in the order given by FIELD_INDEX; empty strings
+         for the fields that are not in the date format.
+
+        :param ampm: Boolean flag that indicates if the time is given in 12-hr
+         format or 24-hr format. True, if the hour is given in 12-hr format;
+         False, if the hour is given in 24-hr format.
+
+        :return: None, if the date is not valid. Otherwise, the parsed date.
+    """
+
+    # Auxiliary variables.
+    values = _get_values(fields)
+
+    # Validate the values.
+    if check_values(values, ampm):
+        return None
+
+    return ParsedDate(*values)
+
+
+# ------------------------------------------------------------------------------
+# Validate Functions
+# ------------------------------------------------------------------------------
 
-        # Add the relevant months.
-        counter_0_0 = 1 if month_0 > 1 else 0
-        counter_0_1 = 1
-        for i_0, value_0 in enumerate(days_in_month_0.values(), start=1):
-            # Get the days gone.
-            counter_0_0 += days_in_month_0[i_0 - 1]
-            counter_0_1 += days_in_month_0[i_0]
 
-            # Counter reaches the end.
-            if i_0 == month_0:
-                break
+def validate_day(dictionary: dict) -> bool:
+    """
+        Validates that the day is given as a day of the month or a day of the
+        year.
+
+        :param dictionary: The dictionary that contains the string, or object,
+         that represents the day.
 
-        return counter_0_0, counter_0_1 + 1
 
-    # //////////////////////////////////////////////////////////////////////////
-    # Implementation.
-    # //////////////////////////////////////////////////////////////////////////
+        :return: True, if the day is valid. False, otherwise.
+    """
 
     # No day to validate.
     if dictionary["DD"] == "" and dictionary["DDD"] == "":
         return True
 
+    # Get the year and the month; they have been validated already.
+    try:
+        year = dictionary["YYYY"] or dictionary["YY"]
+        year = int(year) if year != "" else None
+
+        month = int(dictionary["MM"]) if dictionary["MM"] != "" else None
+        if dictionary["MMM"] != "":
+            month = get_month_number(dictionary["MMM"])
+
+    except (TypeError, ValueError):
+        return False
+
     # Validate the two-digit day.
     if dictionary["DD"] != "":
         try:
-            days_0 = get_month_days_0() + 1
-            return int(dictionary["DD"]) in range(1, days_0)
-        except (TypeError, ValueError):
+            day = int(dictionary["DD"])
+            return 1 <= day <= get_days_in_month(month, year)
+        except (IndexError, TypeError, ValueError):
             return False
 
-    # Get the number of days gone by in the year.
-    range_0 = get_month_days_range_0()
-
-    # Try to validate the day.
+    # Validate the day of the year.
     try:
-        return int(dictionary["DDD"]) in range(*range_0)
-    except (TypeError, ValueError):
+        first, last = get_days_of_year_range(month, year)
+        return first <= int(dictionary["DDD"]) < last
+    except (IndexError, TypeError, ValueError):
         return False
 
 
@@ -154,7 +389,7 @@ def validate_hour(dictionary: dict, ampm: bool) -> bool:
 
     # No need to check.
     if dictionary["hh"] == "":
-        return False
+        return True
 
     # Convert into numerical format.
     try:
@@ -184,6 +419,27 @@ def validate_hour(dictionary: dict, ampm: bool) -> bool:
     return 0 <= hour_0 < 24
 
 
+def validate_minutes(dictionary: dict) -> bool:
+    """
+        Validates that the minutes are in the proper range, given the format.
+
+        :param dictionary: The dictionary that contains the string, or object,
+         that represents the minutes.
+
+        :return: True, if the minutes are valid. False, otherwise.
+    """
+
+    # No need to validate.
+    if dictionary["mm"] == "":
+        return True
+
+    # Validate the minutes range.
+    try:
+        return 0 <= int(dictionary["mm"]) <= 59
+    except (TypeError, ValueError):
+        return False
+
+
 def validate_month(dictionary: dict) -> bool:
     """
         Validates that the month is given in numerical format or
@@ -202,10 +458,7 @@ def validate_month(dictionary: dict) -> bool:
 
     # Verify three-letter month.
     if dictionary['MMM'] != "":
-        return dictionary['MMM'].upper() in (
-            "JAN", "FEB", "MAR", "APR", "MAY", "JUN",
-            "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"
-        )
+        return dictionary['MMM'] in uc.MONTH_NUMBER
 
     # Verify two-digit month.
     try:
@@ -214,6 +467,49 @@ def validate_month(dictionary: dict) -> bool:
         return False
 
 
+def validate_seconds(dictionary: dict) -> bool:
+    """
+        Validates that the seconds are in the proper range, given the format.
+
+        :param dictionary: The dictionary that contains the string, or object,
+         that represents the seconds.
+
+        :return: True, if the seconds are valid. False, otherwise.
+    """
+
+    # No need to validate.
+    if dictionary["ss"] == "":
+        return True
+
+    # Validate the seconds range.
+    try:
+        return 0 <= int(dictionary["ss"]) <= 59
+    except (TypeError, ValueError):
+        return False
+
+
+def validate_tenths(dictionary: dict) -> bool:
+    """
+        Validates that the tenths of seconds are in the proper range, given
+        the format.
+
+        :param dictionary: The dictionary that contains the string, or object,
+         that represents the tenths of seconds.
+
+        :return: True, if the tenths of seconds are valid. False, otherwise.
+    """
+
+    # No need to validate.
+    if dictionary["t"] == "":
+        return True
+
+    # Validate the tenths of seconds range.
+    try:
+        return 0 <= int(dictionary["t"]) <= 9
+    except (TypeError, ValueError):
+        return False
+
+
 def validate_year(dictionary: dict) -> bool:
     """
         Validates that the year is given in numerical format and it's
@@ -241,3 +537,75 @@ def validate_year(dictionary: dict) -> bool:
         return int(dictionary['YY']) > 0
     except (TypeError, ValueError):
         return False
+
+
+# ------------------------------------------------------------------------------
+# Private Functions
+# ------------------------------------------------------------------------------
+
+
+def _get_number(field: Union[str, bytes]) -> Optional[int]:
+    """
+        Converts the field extracted from a date into a number.
+
+        :param field: The string, or bytes, with the field.
+
+        :return: None, if the field is not given; -1, if it is not a number.
+         Otherwise, the number.
+    """
+    try:
+        return int(field) if field else None
+    except ValueError:
+        return -1
+
+
+def _get_values(fields: tuple) -> list:
+    """
+        Converts the fields extracted from a date into numbers, in the order
+        of ParsedDate.
+
+        :param fields: The tuple with the fields of the date, strings or
+         bytes, in the order given by FIELD_INDEX, as taken by parse_fields.
+
+        :return: The list with the year, month, day, day of year, hour,
+         minutes, seconds, tenths of second and am/pm/m string; None for the
+         fields that are not in the date format, and -1 for the fields that
+         are not numbers, or months, which is out of the range of every field.
+    """
+
+    # Auxiliary variables.
+    year, month, month_name, day, day_of_year = fields[:5]
+    hour, minute, second, tenths, meridiem = fields[5:]
+
+    # The am/pm/m string is given as bytes.
+    if meridiem.__class__ is not str:
+        meridiem = meridiem.decode("latin-1")
+
+    # Get the numerical value of the fields, all at once.
+    try:
+        values = [
+            int(year) if year else None,
+            int(month) if month else None,
+            int(day) if day else None,
+            int(day_of_year) if day_of_year else None,
+            int(hour) if hour else None,
+            int(minute) if minute else None,
+            int(second) if second else None,
+            int(tenths) if tenths else None,
+            meridiem or None,
+        ]
+
+    # Get them one at a time, to find the ones that are not numbers.
+    except ValueError:
+        values = [
+            _get_number(field) for field in (
+                year, month, day, day_of_year, hour, minute, second, tenths
+            )
+        ]
+        values.append(meridiem or None)
+
+    # The month is given in three-letter format.
+    if month_name:
+        values[1] = uc.MONTH_NUMBER.get(month_name, -1)
+
+    return values
@@ -0,0 +1,194 @@
+"""
+    File that contains the opt-in profiling of the stages of DateValidator;
+    the count and cumulative time of each stage, per date format.
+
+    The stages are class attributes of DateValidator. Enabling the profiling
+    replaces them with timed versions, and disabling it puts the original
+    ones back; while disabled, the validation runs exactly as it would
+    without this module.
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+import time
+
+from typing import Callable, NamedTuple
+
+# User defined.
+import date_validator.validation.validation_date as dv
+
+# ##############################################################################
+# Constants
+# ##############################################################################
+
+# The stages of the validation, and the DateValidator attribute of each one.
+# The separator check, the split into fields and the 'ii' extraction are done
+# by the tokenizer, in a single pass, so they are timed as a single stage.
+STAGES = {
+    "compile": "_compile",
+    "tokenize": "_tokenize",
+    "validate_year": "_validate_year",
+    "validate_month": "_validate_month",
+    "validate_day": "_validate_day",
+    "validate_hour": "_validate_hour",
+    "validate_minutes": "_validate_minutes",
+    "validate_seconds": "_validate_seconds",
+    "validate_tenths": "_validate_tenths",
+}
+
+# ##############################################################################
+# Classes
+# ##############################################################################
+
+
+class StageStats(NamedTuple):
+    """
+        Immutable count and cumulative time of a stage.
+
+        Parameters:
+        __________
+
+        - count: The number of times the stage was run.
+
+        - nanoseconds: The cumulative time spent in the stage, in nanoseconds.
+    """
+
+    count: int = 0
+    nanoseconds: int = 0
+
+# ##############################################################################
+# Functions
+# ##############################################################################
+
+# ------------------------------------------------------------------------------
+# Profile Functions
+# ------------------------------------------------------------------------------
+
+
+def disable() -> None:
+    """
+        Disables the profiling, putting the original stages back; the
+        recorded statistics are kept.
+    """
+
+    # Put the original stages back.
+    for attribute, stage in _ORIGINALS.items():
+        setattr(dv.DateValidator, attribute, stage)
+
+    _ORIGINALS.clear()
+
+
+def enable() -> None:
+    """
+        Enables the profiling, replacing the stages of DateValidator with
+        timed versions; enabling it twice has no effect.
+    """
+
+    # Already enabled.
+    if is_enabled():
+        return
+
+    # Replace each stage with its timed version.
+    for stage, attribute in STAGES.items():
+        original = dv.DateValidator.__dict__[attribute]
+        _ORIGINALS[attribute] = original
+
+        timed = _get_timed(stage, original.__func__, stage == "compile")
+        setattr(dv.DateValidator, attribute, timed)
+
+
+def is_enabled() -> bool:
+    """
+        Determines if the profiling is enabled.
+
+        :return: True, if the profiling is enabled. False, otherwise.
+    """
+    return len(_ORIGINALS) > 0
+
+
+def reset() -> None:
+    """
+        Removes all the recorded statistics.
+    """
+    _COUNTS.clear()
+    _TIMES.clear()
+
+
+def snapshot() -> dict:
+    """
+        Gets a copy of the recorded statistics.
+
+        :return: The dictionary with the statistics of each date format; for
+         each date format, the dictionary with the StageStats of each stage
+         that was run, keyed on its name.
+    """
+
+    # Auxiliary variables.
+    stats = {}
+
+    # Copy the statistics.
+    for (dformat, stage), count in list(_COUNTS.items()):
+        stats.setdefault(dformat, {})[stage] = StageStats(
+            count, _TIMES.get((dformat, stage), 0)
+        )
+
+    return stats
+
+# ------------------------------------------------------------------------------
+# Private Functions
+# ------------------------------------------------------------------------------
+
+
+# The recorded statistics, keyed on the date format and the stage, and the
+# original stages, while the profiling is enabled. The counters are not
+# locked, so the statistics of several threads are approximate.
+_COUNTS = {}
+_TIMES = {}
+_ORIGINALS = {}
+
+
+def _get_timed(stage: str, function: Callable, compiles: bool) -> Callable:
+    """
+        Gets the timed version of a stage, as a method of DateValidator.
+
+        :param stage: The name of the stage.
+
+        :param function: The function that runs the stage.
+
+        :param compiles: True, if the stage compiles the date format, whose
+         date format is its first argument, since the validator has no plan
+         yet. False, otherwise.
+
+        :return: The timed version of the stage.
+    """
+
+    # Auxiliary variables.
+    clock = time.perf_counter_ns
+
+    def timed(validator: dv.DateValidator, *args):
+        """
+            Runs the stage, recording its count and time.
+
+            :param validator: The date validator that runs the stage.
+
+            :param args: The arguments of the stage.
+
+            :return: The result of the stage.
+        """
+
+        # Run the stage.
+        start = clock()
+        result = function(*args)
+        elapsed = clock() - start
+
+        # Record the statistics.
+        key = (args[0] if compiles else validator.plan.dformat, stage)
+        _COUNTS[key] = _COUNTS.get(key, 0) + 1
+        _TIMES[key] = _TIMES.get(key, 0) + elapsed
+
+        return result
+
+    return timed
@@ -0,0 +1,297 @@
+"""
+    File that contains the functions to validate dates with a regular
+    expression compiled from the date format.
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+import re
+
+from typing import Any, Optional, Union
+
+# User defined.
+import date_validator.validation.validation_format as vf
+import date_validator.validation.validation_general as vg
+
+# ##############################################################################
+# Classes
+# ##############################################################################
+
+
+class RegexMatcher:
+    """
+        Class that validates, and parses, dates against a single date format,
+        using a regular expression with one named group per field. The regular
+        expression splits the date at the separators; only the ranges of the
+        captured fields are checked in Python.
+
+        Only formats where every field is delimited by exactly one separator
+        are supported, i.e., formats without leading, trailing or consecutive
+        separators. The dates can be given as strings or bytes-like objects;
+        bytes are matched without being decoded, unless the date format has
+        non-ASCII separators.
+    """
+
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+    # Public Interface.
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+    # ##########################################################################
+    # Properties
+    # ##########################################################################
+
+    @property
+    def ampm(self) -> bool:
+        """
+            Returns the boolean flag that indicates if the date is in am or pm
+             format.
+
+            :return: The boolean flag that indicates if the date is in am or pm
+             format.
+        """
+        return self.__plan.ampm
+
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def dformat(self) -> str:
+        """
+            Returns the date format.
+
+            :return: The date format the dates are validated against.
+        """
+        return self.__plan.dformat
+
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def pattern(self) -> re.Pattern:
+        """
+            Returns the compiled regular expression.
+
+            :return: The compiled regular expression.
+        """
+        return self.__pattern
+
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def plan(self) -> vf.FormatPlan:
+        """
+            Returns the compiled plan of the date format.
+
+            :return: The compiled plan of the date format.
+        """
+        return self.__plan
+
+    # ##########################################################################
+    # Constructor
+    # ##########################################################################
+
+    def __init__(
+        self, dformat: Any, ampm: Any, max_size: Optional[int] = None
+    ):
+        """
+            Initializes the variables of the regular expression matcher.
+
+            :param dformat: The string that represents the format in which the
+             dates should be given.
+
+            :param ampm: The boolean flag that indicates if the time is given
+             in 12-hr or 24-hr format. True, if the time is given in 12-hr
+             format; False, otherwise.
+
+            :param max_size: The maximum number of characters of a date that
+             is looked at; the longer dates are rejected before being copied,
+             decoded or tokenized. It is never smaller than the size of the
+             longest valid date, which is used if None.
+
+            :raise ValueError: If a field in the date format is not delimited
+             by exactly one separator.
+        """
+
+        # Compile the date format.
+        self.__plan = vf.FormatValidator.compile(
+            str(dformat).strip(), bool(ampm)
+        )
+
+        # Get the regular expressions, for strings and bytes; the bytes are
+        # decoded if the regular expression is not ASCII.
+        expression = self._get_expression()
+        self.__pattern = re.compile(expression, re.DOTALL)
+        self.__patterns = {str: self.__pattern, bytes: None}
+
+        if expression.isascii():
+            self.__patterns[bytes] = re.compile(expression.encode(), re.DOTALL)
+
+        # The maximum size of the dates.
+        self.__limits = vg.get_limits(self.__plan.sizes, max_size)
+
+        # The names of the groups, in the order taken by vg.parse_fields.
+        names = list(self._NAMES)
+        for field in self.__plan.fields:
+            names[vg.FIELD_INDEX[field]] = field
+
+        self.__names = tuple(names)
+
+    def __call__(self, date: Union[str, bytes]) -> bool:
+        """
+            The boolean value that indicates if the given date is valid, or not.
+
+            :param date: The string, or bytes-like object, that contains the
+             date to be validated.
+
+            :return: True, if the date given is in the date format. False,
+             otherwise.
+        """
+        return self.validate(date)
+
+    # ##########################################################################
+    # Methods
+    # ##########################################################################
+
+    # --------------------------------------------------------------------------
+    # Parse Methods
+    # --------------------------------------------------------------------------
+
+    def parse(self, date: Union[str, bytes]) -> Optional[vg.ParsedDate]:
+        """
+            Parses the date, validating it in the same pass.
+
+            :param date: The string, or bytes-like object, that contains the
+             date to be parsed.
+
+            :return: None, if the date is not valid. Otherwise, the parsed
+             date; the fields that are not in the date format are set to None.
+        """
+
+        # Reject the oversize dates before copying, or decoding, them.
+        if len(date) > self.__limits[isinstance(date, str)]:
+            return None
+
+        # Turn the subclasses of str, and the bytes-like objects, into
+        # strings and bytes.
+        if date.__class__ is not str and date.__class__ is not bytes:
+            date = str(date) if isinstance(date, str) else bytes(date)
+
+        # The bytes cannot be matched without being decoded.
+        if self.__patterns[date.__class__] is None:
+            date = date.decode("utf-8", "replace")
+
+        # Reject the dates with the wrong size before matching them.
+        if len(date) not in self.__plan.sizes:
+            return None
+
+        # Match the date.
+        match = self.__patterns[date.__class__].fullmatch(date)
+
+        # The date doesn't match the date format.
+        if match is None:
+            return None
+
+        return vg.parse_fields(match.group(*self.__names), self.__plan.ampm)
+
+    # --------------------------------------------------------------------------
+    # Validate Methods
+    # --------------------------------------------------------------------------
+
+    def validate(self, date: Union[str, bytes]) -> bool:
+        """
+            Validates the date against the date format.
+
+            :param date: The string, or bytes-like object, that contains the
+             date to be validated.
+
+            :return: True, if the date given is in the date format. False,
+             otherwise.
+        """
+        return self.parse(date) is not None
+
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+    # Private Interface.
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+    # ##########################################################################
+    # Global Variables
+    # ##########################################################################
+
+    # The default name of the group of each field, in the order taken by
+    # vg.parse_fields.
+    _NAMES = ("YYYY", "MM", "MMM", "DD", "DDD", "hh", "mm", "ss", "t", "ii")
+
+    # ##########################################################################
+    # Methods
+    # ##########################################################################
+
+    # --------------------------------------------------------------------------
+    # Get Methods
+    # --------------------------------------------------------------------------
+
+    def _get_expression(self) -> str:
+        """
+            Gets the regular expression that matches the date format.
+
+            DateValidator splits the date at the first occurrence of each
+            separator; hence, the fields before a separator cannot contain
+            that separator, while the fields after the last separator can
+            contain any character.
+
+            :raise ValueError: If a field in the date format is not delimited
+             by exactly one separator.
+
+            :return: The regular expression that matches the date format.
+        """
+
+        # Auxiliary variables.
+        plan = self.__plan
+        expression = []
+
+        # Every field must be delimited by exactly one separator.
+        if len(plan.segments) != len(plan.separators) + 1:
+            raise ValueError(
+                f"The date format, '{plan.dformat}', cannot be turned into a "
+                f"regular expression. Every field must be delimited by exactly "
+                f"one separator."
+            )
+
+        # Add each segment and the separator after it.
+        for i, segment in enumerate(plan.segments):
+
+            # The characters the fields in the segment can contain.
+            separator = plan.separators[i] if i < len(plan.separators) else ""
+            chars = f"[^{re.escape(separator)}]" if separator else "."
+
+            # Add each field.
+            start = 0
+            for j, char in enumerate(segment + " "):
+
+                # The field continues.
+                if j < len(segment) and char == segment[start]:
+                    continue
+
+                field = segment[start:j]
+                start = j
+
+                # The am/pm/m string.
+                if field == "ii":
+                    options = (
+                        option for option in ("am", "pm", "m")
+                        if separator == "" or separator not in option
+                    )
+                    expression.append(f"(?P<ii>{'|'.join(options)})")
+                    continue
+
+                expression.append(f"(?P<{field}>{chars}{{{len(field)}}})")
+
+            # Add the separator.
+            expression.append(re.escape(separator))
+
+        # Add an empty group for the fields that are not in the date format.
+        for name in self._NAMES:
+            if vg.FIELD_INDEX[name] not in map(vg.FIELD_INDEX.get, plan.fields):
+                expression.append(f"(?P<{name}>)")
+
+        return "".join(expression)
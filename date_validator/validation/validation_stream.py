@@ -0,0 +1,423 @@
+"""
+    File that contains the classes to validate streams of dates where
+    consecutive dates usually share a long prefix, e.g., the timestamps of
+    time-ordered logs.
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+from typing import Any, Optional, Union
+
+# User defined.
+import date_validator.utilities.utilities_calendar as uc
+import date_validator.validation.validation_codegen as vc
+import date_validator.validation.validation_format as vf
+import date_validator.validation.validation_general as vg
+
+# ##############################################################################
+# Classes
+# ##############################################################################
+
+
+class StreamMatcher:
+    """
+        Class that validates, and parses, a stream of dates against a single
+        date format, remembering the last valid date and its parsed fields.
+        When a date has the same length as the last valid one, only the
+        fields, and separators, at or after the first one that differs are
+        parsed again; the values of the fields before it are reused, and the
+        ranges of all of them are checked with vg.check_values.
+
+        Only formats where every field is delimited by exactly one separator
+        are supported, so that every field is found at a fixed offset; the
+        dates that cannot reuse the last valid date are parsed with the
+        GeneratedMatcher.
+    """
+
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+    # Public Interface.
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+    # ##########################################################################
+    # Properties
+    # ##########################################################################
+
+    @property
+    def ampm(self) -> bool:
+        """
+            Returns the boolean flag that indicates if the date is in am or pm
+             format.
+
+            :return: The boolean flag that indicates if the date is in am or pm
+             format.
+        """
+        return self.__plan.ampm
+
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def dformat(self) -> str:
+        """
+            Returns the date format.
+
+            :return: The date format the dates are validated against.
+        """
+        return self.__plan.dformat
+
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def plan(self) -> vf.FormatPlan:
+        """
+            Returns the compiled plan of the date format.
+
+            :return: The compiled plan of the date format.
+        """
+        return self.__plan
+
+    # ##########################################################################
+    # Constructor
+    # ##########################################################################
+
+    def __init__(
+        self, dformat: Any, ampm: Any, max_size: Optional[int] = None
+    ):
+        """
+            Initializes the variables of the stream matcher.
+
+            :param dformat: The string that represents the format in which the
+             dates should be given.
+
+            :param ampm: The boolean flag that indicates if the time is given
+             in 12-hr or 24-hr format. True, if the time is given in 12-hr
+             format; False, otherwise.
+
+            :param max_size: The maximum number of characters of a date that
+             is looked at; the longer dates are rejected before being copied,
+             decoded or tokenized. It is never smaller than the size of the
+             longest valid date, which is used if None.
+
+            :raise ValueError: If a field in the date format is not delimited
+             by exactly one separator.
+        """
+
+        # Get the matcher that parses the whole dates.
+        self.__matcher = vc.GeneratedMatcher(dformat, ampm, max_size)
+        self.__plan = self.__matcher.plan
+
+        # The offset of the am/pm/m string in the dates; -1, if not given.
+        self.__ii = self._get_ii()
+
+        # The maximum size of the dates.
+        self.__limits = vg.get_limits(self.__plan.sizes, max_size)
+
+        # The bytes are decoded if a separator is not an ASCII character.
+        self.__binary = all(map(str.isascii, self.__plan.separators))
+
+        # Get the units and their offsets, for each type of date and am/pm/m
+        # string width.
+        self.__tables = {}
+        for kind in ((str, bytes) if self.__binary else (str,)):
+            for width in ((1, 2) if self.__ii >= 0 else (0,)):
+                units = self._get_units(kind, width)
+                self.__tables[kind, width] = (
+                    units, tuple(unit[0] for unit in units)
+                )
+
+        # The last valid date.
+        self.reset()
+
+    def __call__(self, date: Union[str, bytes]) -> bool:
+        """
+            The boolean value that indicates if the given date is valid, or not.
+
+            :param date: The string, or bytes-like object, that contains the
+             date to be validated.
+
+            :return: True, if the date given is in the date format. False,
+             otherwise.
+        """
+        return self.validate(date)
+
+    # ##########################################################################
+    # Methods
+    # ##########################################################################
+
+    # --------------------------------------------------------------------------
+    # Parse Methods
+    # --------------------------------------------------------------------------
+
+    def parse(self, date: Union[str, bytes]) -> Optional[vg.ParsedDate]:
+        """
+            Parses the date, validating it in the same pass, reusing the
+            fields that it shares with the last valid date.
+
+            :param date: The string, or bytes-like object, that contains the
+             date to be parsed.
+
+            :return: None, if the date is not valid. Otherwise, the parsed
+             date; the fields that are not in the date format are set to None.
+        """
+
+        # Reject the oversize dates before copying, or decoding, them.
+        if len(date) > self.__limits[isinstance(date, str)]:
+            return None
+
+        # Turn the bytes-like objects into bytes, or strings.
+        if date.__class__ is not str and date.__class__ is not bytes:
+            date = str(date) if isinstance(date, str) else bytes(date)
+
+        if date.__class__ is bytes and not self.__binary:
+            date = date.decode("utf-8", "replace")
+
+        # The date cannot reuse the last valid date.
+        previous = self.__previous
+        if (
+            previous.__class__ is not date.__class__ or
+            len(previous) != len(date) or
+            self._get_width(date) != self.__width
+        ):
+            return self._parse_whole(date)
+
+        # The date is the last valid date.
+        if date == previous:
+            return self.__parsed
+
+        # Find the first unit that differs from the last valid date; in a
+        # sorted stream, the last units are the ones that usually differ.
+        first = len(self.__cuts) - 1
+        for cut in reversed(self.__cuts):
+            if date[:cut] == previous[:cut]:
+                break
+            first -= 1
+
+        return self._parse_from(date, first)
+
+    def reset(self) -> None:
+        """
+            Forgets the last valid date, e.g., when a new stream starts.
+        """
+        self.__previous = None
+        self.__parsed = None
+        self.__width = -1
+        self.__units = ()
+        self.__cuts = ()
+
+    # --------------------------------------------------------------------------
+    # Validate Methods
+    # --------------------------------------------------------------------------
+
+    def validate(self, date: Union[str, bytes]) -> bool:
+        """
+            Validates the date against the date format.
+
+            :param date: The string, or bytes-like object, that contains the
+             date to be validated.
+
+            :return: True, if the date given is in the date format. False,
+             otherwise.
+        """
+        return self.parse(date) is not None
+
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+    # Private Interface.
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+    # ##########################################################################
+    # Global Variables
+    # ##########################################################################
+
+    # The index of each field in the parsed date.
+    _SLOTS = {
+        "YYYY": 0, "YY": 0, "MM": 1, "MMM": 1, "DD": 2, "DDD": 3, "hh": 4,
+        "mm": 5, "ss": 6, "t": 7, "ii": 8
+    }
+
+    # ##########################################################################
+    # Methods
+    # ##########################################################################
+
+    # --------------------------------------------------------------------------
+    # Get Methods
+    # --------------------------------------------------------------------------
+
+    def _get_ii(self) -> int:
+        """
+            Gets the offset of the am/pm/m string in the dates; the offset is
+            the same whatever the width of the am/pm/m string.
+
+            :return: The offset of the am/pm/m string; -1, if the date format
+             doesn't have one.
+        """
+
+        # Auxiliary variables.
+        plan = self.__plan
+        segment, offset = plan.ii
+
+        # The date format doesn't have an am/pm/m string.
+        if segment < 0:
+            return -1
+
+        return sum(plan.lengths[:segment]) + segment + offset
+
+    def _get_units(self, kind: type, width: int) -> tuple:
+        """
+            Gets the units, i.e., the separators and fields, of the dates of
+            the given type and width of the am/pm/m string, in the order they
+            are found in the dates.
+
+            :param kind: The type of the dates, str or bytes.
+
+            :param width: The width of the am/pm/m string; zero, if the date
+             format doesn't have one.
+
+            :return: The tuple of (start, end, field, forbidden) tuples, where
+             the field is None for the separators, and forbidden is the
+             separator that cannot be found in the field; the separator
+             itself, for the separators.
+        """
+
+        # Auxiliary variables.
+        plan = self.__plan
+        units = []
+        position = 0
+
+        for i, segment in enumerate(plan.segments):
+
+            # The separator after the segment; None for the last segment.
+            separator = None
+            if i < len(plan.separators):
+                separator = plan.separators[i]
+                separator = separator if kind is str else separator.encode()
+
+            # The fields, shifted after the am/pm/m string.
+            index, offset = plan.ii
+            fields = []
+            for field, j, start, end in plan.spans:
+                if j == i:
+                    shift = width if index == i and start >= offset else 0
+                    fields.append((start + shift, end + shift, field))
+
+            if index == i:
+                fields.append((offset, offset + width, "ii"))
+
+            for start, end, field in sorted(fields):
+                units.append(
+                    (position + start, position + end, field, separator)
+                )
+
+            # Add the separator.
+            position += plan.lengths[i] + (width if index == i else 0)
+            if separator is not None:
+                units.append(
+                    (position, position + len(separator), None, separator)
+                )
+                position += len(separator)
+
+        return tuple(units)
+
+    def _get_width(self, date: Union[str, bytes]) -> int:
+        """
+            Gets the width of the am/pm/m string in the date.
+
+            :param date: The string, or bytes, that contains the date.
+
+            :return: The width of the am/pm/m string, 1 or 2; zero, if the date
+             format doesn't have one.
+        """
+
+        # The date format doesn't have an am/pm/m string.
+        if self.__ii < 0:
+            return 0
+
+        noon = "m" if date.__class__ is str else b"m"
+
+        return 1 if date[self.__ii: self.__ii + 1] == noon else 2
+
+    # --------------------------------------------------------------------------
+    # Parse Methods
+    # --------------------------------------------------------------------------
+
+    def _parse_from(
+        self, date: Union[str, bytes], first: int
+    ) -> Optional[vg.ParsedDate]:
+        """
+            Parses the date, reusing the units before the given one from the
+            last valid date, which has the same length and am/pm/m string
+            width.
+
+            :param date: The string, or bytes, that contains the date.
+
+            :param first: The index of the first unit that differs from the
+             last valid date.
+
+            :return: The same value as the parse method.
+        """
+
+        # Auxiliary variables.
+        values = list(self.__parsed)
+        slots = self._SLOTS
+
+        # Check the units again.
+        try:
+            for start, end, field, forbidden in self.__units[first:]:
+                text = date[start:end]
+
+                # The separator must be found at its offset.
+                if field is None:
+                    if text != forbidden:
+                        return None
+                    continue
+
+                # The fields before a separator cannot contain it.
+                if forbidden is not None and forbidden in text:
+                    return None
+
+                if field == "MMM":
+                    values[1] = uc.MONTH_NUMBER[text]
+                elif field == "ii":
+                    values[8] = text if text.__class__ is str else (
+                        text.decode("latin-1")
+                    )
+                else:
+                    values[slots[field]] = int(text)
+
+        except (KeyError, ValueError):
+            return None
+
+        # Check the ranges of the values.
+        if vg.check_values(values, self.__plan.ampm):
+            return None
+
+        # Remember the date.
+        self.__previous = date
+        self.__parsed = vg.ParsedDate(*values)
+
+        return self.__parsed
+
+    def _parse_whole(self, date: Union[str, bytes]) -> Optional[vg.ParsedDate]:
+        """
+            Parses the whole date and, if it is valid, remembers it.
+
+            :param date: The string, or bytes, that contains the date.
+
+            :return: The same value as the parse method.
+        """
+
+        # Parse the date.
+        parsed = self.__matcher.parse(date)
+        if parsed is None:
+            return None
+
+        # Remember the date.
+        self.__previous = date
+        self.__parsed = parsed
+        self.__width = self._get_width(date)
+        self.__units, self.__cuts = self.__tables[
+            date.__class__, self.__width
+        ]
+
+        return parsed
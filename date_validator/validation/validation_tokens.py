@@ -0,0 +1,281 @@
+"""
+    File that contains the tokenizer that splits the dates into the spans of
+    their fields, shared by the engines that validate the dates.
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+import functools
+
+from typing import Optional, Union
+
+# User defined.
+import date_validator.validation.validation_format as vf
+import date_validator.validation.validation_general as vg
+
+# ##############################################################################
+# Classes
+# ##############################################################################
+
+
+class Tokenizer:
+    """
+        Class that splits dates into the spans of their fields, in a single
+        pass, in the same way DateValidator does: the date is split at the
+        first occurrence of each separator of the date format, in order, the
+        empty segments are dropped and the am/pm/m string is located within
+        its segment. The dates with the wrong size, or with a separator out of
+        its fixed place, are rejected before being split; otherwise, the date
+        is rejected as soon as a separator is missing. The reason a date is
+        rejected is given by split.
+
+        The dates can be given as strings or bytes; bytes are split at the
+        UTF-8 encoding of the separators.
+    """
+
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+    # Public Interface.
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+    # ##########################################################################
+    # Properties
+    # ##########################################################################
+
+    @property
+    def plan(self) -> vf.FormatPlan:
+        """
+            Returns the compiled plan of the date format.
+
+            :return: The compiled plan of the date format.
+        """
+        return self.__plan
+
+    # ##########################################################################
+    # Constructor
+    # ##########################################################################
+
+    def __init__(self, plan: vf.FormatPlan):
+        """
+            Initializes the variables of the tokenizer.
+
+            :param plan: The compiled plan of the date format.
+        """
+
+        # Auxiliary variables.
+        self.__plan = plan
+
+        # Locate each field in the segments, in the order given by
+        # vg.FIELD_INDEX; the am/pm/m string is located separately.
+        spans = [None] * vg.FIELD_INDEX["ii"]
+        for field, segment, start, end in plan.spans:
+            spans[vg.FIELD_INDEX[field]] = (segment, start, end)
+
+        self.__spans = tuple(spans)
+
+        # The separators and the noon string, for strings and bytes.
+        self.__separators = {
+            str: plan.separators,
+            bytes: tuple(map(str.encode, plan.separators)),
+        }
+        self.__noon = {str: "m", bytes: b"m"}
+
+        # The sizes of a valid date and the separators at a fixed index, for
+        # strings and bytes; the non-ASCII separators take several bytes.
+        extra = sum(map(len, self.__separators[bytes])) - len(plan.separators)
+        self.__sizes = {
+            str: plan.sizes,
+            bytes: frozenset(size + extra for size in plan.sizes),
+        }
+        self.__positions = {
+            str: plan.positions,
+            bytes: tuple(
+                (position, ord(separator))
+                for position, separator in plan.positions
+            ) if extra == 0 else (),
+        }
+
+    # ##########################################################################
+    # Methods
+    # ##########################################################################
+
+    # --------------------------------------------------------------------------
+    # Tokenize Methods
+    # --------------------------------------------------------------------------
+
+    def split(self, date: Union[str, bytes]) -> Union[tuple, vg.Reason]:
+        """
+            Splits the date into the spans of its fields, or gets the reason
+            the date can't be split.
+
+            :param date: The string, or bytes, that contains the date to be
+             split.
+
+            :return: The reason the date is rejected, if the segments of the
+             date don't match the date format. Otherwise, the tuple with the
+             (start, end) span of each field in the date, in the order given
+             by vg.FIELD_INDEX; (0, 0), for the fields that are not in the
+             date format.
+        """
+
+        # Auxiliary variables; the type of the tables, str or bytes, of the
+        # date, which can be a subclass.
+        kind = str if isinstance(date, str) else bytes
+
+        # Reject the dates with the wrong size, or a separator out of place,
+        # before splitting them.
+        if len(date) not in self.__sizes[kind]:
+            return vg.Reason.SIZE
+
+        for position, separator in self.__positions[kind]:
+            if date[position] != separator:
+                return vg.Reason.SEPARATOR
+
+        # Auxiliary variables; the bounds are the start and end of each
+        # segment, one after the other.
+        plan = self.__plan
+        bounds = []
+        start = 0
+
+        # Find each separator, in order; empty segments are dropped.
+        for separator in self.__separators[kind]:
+            index = date.find(separator, start)
+
+            # The separator is missing.
+            if index < 0:
+                return vg.Reason.SEPARATOR
+
+            # Append the segment.
+            if index > start:
+                bounds.append(start)
+                bounds.append(index)
+
+            start = index + len(separator)
+
+        # Append the last segment.
+        if start < len(date):
+            bounds.append(start)
+            bounds.append(len(date))
+
+        # Check the number of segments match.
+        if len(bounds) != 2 * len(plan.segments):
+            return vg.Reason.SEGMENTS
+
+        # Locate the am/pm/m string.
+        meridiem = (0, 0)
+        size = 0
+        index, offset = plan.ii
+        if index >= 0:
+            position = bounds[2 * index] + offset
+            end = bounds[2 * index + 1]
+
+            if position < end:
+                noon = self.__noon[kind]
+                size = 1 if date[position: position + 1] == noon else 2
+                size = min(size, end - position)
+                meridiem = (position, position + size)
+
+        # Check ALL the segments have the same length, without the am/pm/m
+        # string.
+        for i, length in enumerate(plan.lengths):
+            removed = size if i == index else 0
+            if bounds[2 * i + 1] - bounds[2 * i] - removed != length:
+                return vg.Reason.LENGTH
+
+        # Get the span of each field.
+        spans = []
+        for span in self.__spans:
+
+            # The field is not in the date format.
+            if span is None:
+                spans.append((0, 0))
+                continue
+
+            segment, start, end = span
+            first = bounds[2 * segment]
+            if segment == index and start >= offset:
+                first += size
+
+            spans.append((first + start, first + end))
+
+        spans.append(meridiem)
+
+        return tuple(spans)
+
+    def tokenize(self, date: Union[str, bytes]) -> Optional[tuple]:
+        """
+            Splits the date into the spans of its fields.
+
+            :param date: The string, or bytes, that contains the date to be
+             split.
+
+            :return: None, if the segments of the date don't match the date
+             format. Otherwise, the tuple with the (start, end) span of each
+             field in the date, as given by split.
+        """
+
+        # Split the date.
+        spans = self.split(date)
+
+        return spans if spans.__class__ is tuple else None
+
+# ##############################################################################
+# Functions
+# ##############################################################################
+
+# ------------------------------------------------------------------------------
+# Get Functions
+# ------------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=128)
+def get_tokenizer(plan: vf.FormatPlan) -> Tokenizer:
+    """
+        Gets the tokenizer of the given date format plan; the tokenizers are
+        kept in a bounded least-recently-used cache, keyed on the plan.
+
+        :param plan: The compiled plan of the date format.
+
+        :return: The tokenizer of the date format.
+    """
+    return Tokenizer(plan)
+
+# ------------------------------------------------------------------------------
+# Tokenize Functions
+# ------------------------------------------------------------------------------
+
+
+def split(
+    plan: vf.FormatPlan, date: Union[str, bytes]
+) -> Union[tuple, vg.Reason]:
+    """
+        Splits the date into the spans of its fields, or gets the reason the
+        date can't be split, with the tokenizer of the given date format plan.
+
+        :param plan: The compiled plan of the date format.
+
+        :param date: The string, or bytes, that contains the date to be split.
+
+        :return: The reason the date is rejected, if the segments of the date
+         don't match the date format. Otherwise, the tuple with the (start,
+         end) span of each field in the date, as given by Tokenizer.split.
+    """
+    return get_tokenizer(plan).split(date)
+
+
+def tokenize(plan: vf.FormatPlan, date: Union[str, bytes]) -> Optional[tuple]:
+    """
+        Splits the date into the spans of its fields, with the tokenizer of
+        the given date format plan.
+
+        :param plan: The compiled plan of the date format.
+
+        :param date: The string, or bytes, that contains the date to be split.
+
+        :return: None, if the segments of the date don't match the date
+         format. Otherwise, the tuple with the (start, end) span of each field
+         in the date, as given by Tokenizer.tokenize.
+    """
+    return get_tokenizer(plan).tokenize(date)
@@ -0,0 +1,429 @@
+"""
+    File that contains the functions to validate whole arrays of dates with
+    fixed-width formats, using NumPy.
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+from typing import Any
+
+# Optional.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# User defined.
+import date_validator.utilities.utilities_calendar as uc
+import date_validator.validation.validation_format as vf
+
+# ##############################################################################
+# Classes
+# ##############################################################################
+
+
+class VectorizedMatcher:
+    """
+        Class that validates whole arrays of dates against a single date
+        format, with whole-array operations. Only fixed-width formats are
+        supported, i.e., formats in 24-hr format where every field is
+        delimited by exactly one separator, so that every field is always found
+        at the same offset.
+
+        Unlike FormatMatcher, the numerical fields must be given as ASCII
+        digits; the leading or trailing spaces, signs and underscores that
+        Python's int() accepts are rejected.
+    """
+
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+    # Public Interface.
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+    # ##########################################################################
+    # Properties
+    # ##########################################################################
+
+    @property
+    def dformat(self) -> str:
+        """
+            Returns the date format.
+
+            :return: The date format the dates are validated against.
+        """
+        return self.__plan.dformat
+
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def binary(self) -> bool:
+        """
+            Returns if the dates can be validated as bytes, i.e., if every
+            separator of the date format is a single byte.
+
+            :return: True, if the dates can be validated as bytes. False,
+             otherwise.
+        """
+        return self.__binary
+
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def plan(self) -> vf.FormatPlan:
+        """
+            Returns the compiled plan of the date format.
+
+            :return: The compiled plan of the date format.
+        """
+        return self.__plan
+
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def width(self) -> int:
+        """
+            Returns the number of characters of a valid date.
+
+            :return: The number of characters of a valid date.
+        """
+        return self.__width
+
+    # ##########################################################################
+    # Constructor
+    # ##########################################################################
+
+    def __init__(self, dformat: Any, ampm: Any = False):
+        """
+            Initializes the variables of the vectorized matcher.
+
+            :param dformat: The string that represents the format in which the
+             dates should be given.
+
+            :param ampm: The boolean flag that indicates if the time is given
+             in 12-hr or 24-hr format. Must be False, since dates in 12-hr
+             format don't have a fixed width.
+
+            :raise ImportError: If NumPy is not installed.
+
+            :raise ValueError: If the date format is not a fixed-width format.
+        """
+
+        # NumPy is required.
+        if np is None:
+            raise ImportError(
+                "NumPy must be installed to use the vectorized matcher."
+            )
+
+        # Compile the date format.
+        self.__plan = vf.FormatValidator.compile(
+            str(dformat).strip(), bool(ampm)
+        )
+
+        # Check the date format has a fixed width.
+        plan = self.__plan
+        if plan.ampm or len(plan.segments) != len(plan.separators) + 1:
+            raise ValueError(
+                f"The date format, '{plan.dformat}', doesn't have a fixed "
+                f"width. Only 24-hr formats, where every field is delimited by "
+                f"exactly one separator, are supported."
+            )
+
+        # Get the offset of each segment and separator.
+        offsets = []
+        separators = []
+        position = 0
+        for i, length in enumerate(plan.lengths):
+            offsets.append(position)
+            position += length
+
+            # The separator after the segment.
+            if i < len(plan.separators):
+                separators.append((
+                    ord(plan.separators[i]), offsets[i], position
+                ))
+                position += 1
+
+        self.__separators = tuple(separators)
+
+        # The bytes can only be validated if every separator is a single byte.
+        self.__binary = all(
+            len(separator.encode("utf-8")) == 1
+            for separator in plan.separators
+        )
+        self.__width = position
+
+        # Get the calendar tables.
+        self.__days_in_month = np.array(uc.DAYS_IN_MONTH, dtype=np.int64)
+        self.__first_day = np.array(uc.FIRST_DAY, dtype=np.int64)
+
+        # Get the absolute span of each field.
+        self.__spans = {
+            field: (offsets[segment] + start, offsets[segment] + end)
+            for field, segment, start, end in plan.spans
+        }
+
+    # ##########################################################################
+    # Methods
+    # ##########################################################################
+
+    # --------------------------------------------------------------------------
+    # Validate Methods
+    # --------------------------------------------------------------------------
+
+    def validate(self, dates: Any) -> "np.ndarray":
+        """
+            Validates an array of dates against the date format.
+
+            :param dates: The NumPy array, of 'S' or 'U' type, or the sequence
+             of strings that contains the dates to be validated.
+
+            :raise TypeError: If the dates are not strings.
+
+            :raise ValueError: If the dates are bytes, and a separator of the
+             date format is not a single byte.
+
+            :return: The boolean mask, with the shape of the array, that is
+             True where the date is valid. False, otherwise.
+        """
+
+        # Get the array of dates.
+        dates = np.asarray(dates)
+
+        # Only strings can be validated.
+        if dates.dtype.kind not in "SU":
+            raise TypeError(
+                f"The dates must be given as an array of 'S' or 'U' type, not "
+                f"'{dates.dtype}'."
+            )
+
+        # Get the character codes, one row per date.
+        shape = dates.shape
+        if dates.dtype.kind == "S":
+            self._check_binary()
+            size = dates.dtype.itemsize
+            dates = np.ascontiguousarray(dates.reshape(-1))
+            codes = dates.view(np.uint8).reshape(-1, size)
+        else:
+            size = dates.dtype.itemsize // 4
+            dates = np.ascontiguousarray(dates.reshape(-1), dtype=f"=U{size}")
+            codes = dates.view(np.uint32).reshape(-1, size)
+
+        # The dates are shorter than the date format.
+        if size < self.__width:
+            return np.zeros(shape, dtype=bool)
+
+        # Check the length of each date.
+        valid = codes[:, self.__width - 1] != 0
+        if size > self.__width:
+            valid &= ~codes[:, self.__width:].any(axis=1)
+
+        valid &= self._validate_codes(codes[:, :self.__width])
+
+        return valid.reshape(shape)
+
+    def validate_buffer(
+        self, buffer: Any, stride: int, offset: int = 0
+    ) -> "np.ndarray":
+        """
+            Validates the dates in a buffer of fixed-width records, where each
+            date is found at the same offset of each record.
+
+            :param buffer: The object that exposes the buffer interface, e.g.,
+             bytes, bytearray, memoryview or mmap.mmap, with the records.
+
+            :param stride: The number of bytes of each record.
+
+            :param offset: The offset of the date within each record; zero by
+             default.
+
+            :raise ValueError: If the date doesn't fit in the record, or a
+             separator of the date format is not a single byte.
+
+            :return: The boolean mask, with one entry per record, that is True
+             where the date is valid. False, otherwise.
+        """
+
+        # The separators must be single bytes.
+        self._check_binary()
+
+        # The date must fit in the record.
+        if offset < 0 or offset + self.__width > stride:
+            raise ValueError(
+                f"A date of {self.__width} bytes, at offset {offset}, doesn't "
+                f"fit in a record of {stride} bytes."
+            )
+
+        # Get the bytes, one row per record; incomplete records are ignored.
+        codes = np.frombuffer(buffer, dtype=np.uint8)
+        codes = codes[:len(codes) - len(codes) % stride].reshape(-1, stride)
+
+        return self._validate_codes(codes[:, offset: offset + self.__width])
+
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+    # Private Interface.
+    # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+    # ##########################################################################
+    # Global Variables
+    # ##########################################################################
+
+    # The three-letter months, as the integers of their upper-case codes.
+    _MONTHS = tuple(
+        (ord(name[0]) << 16) | (ord(name[1]) << 8) | ord(name[2])
+        for name in uc.MONTHS
+    )
+
+    # ##########################################################################
+    # Methods
+    # ##########################################################################
+
+    # --------------------------------------------------------------------------
+    # Check Methods
+    # --------------------------------------------------------------------------
+
+    def _check_binary(self) -> None:
+        """
+            Checks that the dates can be validated as bytes.
+
+            :raise ValueError: If a separator of the date format is not a
+             single byte, and could never match a single byte of the dates.
+        """
+        if not self.__binary:
+            raise ValueError(
+                f"The date format, '{self.__plan.dformat}', has separators "
+                f"that are not a single byte; the dates must be given as "
+                f"strings."
+            )
+
+    # --------------------------------------------------------------------------
+    # Get Methods
+    # --------------------------------------------------------------------------
+
+    def _get_number(self, codes: "np.ndarray", field: str) -> tuple:
+        """
+            Gets the numerical value of the given field.
+
+            :param codes: The character codes of the dates, one row per date.
+
+            :param field: The field whose value must be extracted.
+
+            :return: None, if the field is not in the date format. Otherwise,
+             the tuple with the numerical values of the field and the boolean
+             mask that is True where the field only contains digits.
+        """
+
+        # The field is not in the date format.
+        if field not in self.__spans:
+            return None
+
+        start, end = self.__spans[field]
+
+        # Get the digits.
+        digits = codes[:, start:end].astype(np.int64) - 48
+        valid = ((digits >= 0) & (digits <= 9)).all(axis=1)
+
+        # Get the number.
+        number = np.zeros(len(codes), dtype=np.int64)
+        for i in range(end - start):
+            number = number * 10 + digits[:, i]
+
+        return number, valid
+
+    def _get_month_name(self, codes: "np.ndarray") -> tuple:
+        """
+            Gets the number of the month given in three-letter format.
+
+            :param codes: The character codes of the dates, one row per date.
+
+            :return: The tuple with the number of the months and the boolean
+             mask that is True where the month is a valid three-letter month.
+        """
+
+        start, end = self.__spans["MMM"]
+
+        # Turn the lower-case letters into upper-case letters.
+        letters = codes[:, start:end].astype(np.int64)
+        lower = (letters >= ord("a")) & (letters <= ord("z"))
+        letters = np.where(lower, letters - 32, letters)
+
+        # Find the month.
+        name = (letters[:, 0] << 16) | (letters[:, 1] << 8) | letters[:, 2]
+        matches = name[:, None] == np.array(self._MONTHS, dtype=np.int64)
+
+        return matches.argmax(axis=1) + 1, matches.any(axis=1)
+
+    # --------------------------------------------------------------------------
+    # Validate Methods
+    # --------------------------------------------------------------------------
+
+    def _validate_codes(self, codes: "np.ndarray") -> "np.ndarray":
+        """
+            Validates the dates, given as the character codes of the dates
+            with exactly the width of the date format.
+
+            :param codes: The character codes of the dates, one row per date.
+
+            :return: The boolean mask that is True where the date is valid.
+             False, otherwise.
+        """
+
+        # Auxiliary variables.
+        valid = np.ones(len(codes), dtype=bool)
+
+        # Check the separators; the segment before a separator cannot contain
+        # the separator, since DateValidator splits the date at the first
+        # occurrence of each separator.
+        for separator, start, end in self.__separators:
+            valid &= codes[:, end] == separator
+            if end > start:
+                valid &= (codes[:, start:end] != separator).all(axis=1)
+
+        # Get the year; a leap year, if not given.
+        year = self._get_number(codes, "YYYY") or self._get_number(codes, "YY")
+        if year is not None:
+            year, digits = year
+            valid &= digits & (year > 0)
+            leap = uc.is_leap_year(year).astype(np.int64)
+        else:
+            leap = np.full(len(codes), uc.is_leap_year(), dtype=np.int64)
+
+        # Get the month.
+        month = self._get_number(codes, "MM")
+        if "MMM" in self.__spans:
+            month = self._get_month_name(codes)
+
+        if month is not None:
+            month, digits = month
+            valid &= digits & (month >= 1) & (month <= 12)
+            month = np.clip(month, 1, 12)
+
+        # Validate the day of the month.
+        day = self._get_number(codes, "DD")
+        if day is not None:
+            day, digits = day
+            days = self.__days_in_month[leap, 0 if month is None else month]
+            valid &= digits & (day >= 1) & (day <= days)
+
+        # Validate the day of the year.
+        day = self._get_number(codes, "DDD")
+        if day is not None:
+            day, digits = day
+            if month is None:
+                first = self.__first_day[leap, 0]
+                last = self.__first_day[leap, 13]
+            else:
+                first = self.__first_day[leap, month]
+                last = self.__first_day[leap, month + 1]
+            valid &= digits & (day >= first) & (day < last)
+
+        # Validate the time.
+        for field, maximum in (("hh", 23), ("mm", 59), ("ss", 59), ("t", 9)):
+            number = self._get_number(codes, field)
+            if number is not None:
+                number, digits = number
+                valid &= digits & (number >= 0) & (number <= maximum)
+
+        return valid
+
@@ -0,0 +1,53 @@
+"""
+    File that contains the tests of the generator of synthetic dates.
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+import pytest
+
+# User defined.
+import date_validator.testing.testing_corpus as tc
+import date_validator.validation.validation_date as dv
+
+# ##############################################################################
+# Tests
+# ##############################################################################
+
+
+def test_get_dates():
+    """
+        The dates are valid, or not, as requested, and deterministic.
+    """
+
+    # Auxiliary variables.
+    dates = tc.get_dates("YYYY-MM-DD hh:mmii", True, 200)
+
+    assert all(dv.validate_many(dates, "YYYY-MM-DD hh:mmii", True))
+    assert dates == tc.get_dates("YYYY-MM-DD hh:mmii", True, 200)
+    assert not all(dv.validate_many(
+        tc.get_dates("YYYY-MM-DD", False, 200, invalid=1.0), "YYYY-MM-DD",
+        False
+    ))
+
+
+@pytest.mark.parametrize("argv, status", (
+    (["YYYY-MM-DD", "10"], 0),
+    (["YYYY-YY", "10"], 2),
+    (["YYYY-MM-DD", "10", "--rate", "unknown=0.5"], 2),
+    (["YYYY-MM-DD", "10", "--rate", "hour=x"], 2),
+))
+def test_main(tmp_path, argv, status):
+    """
+        The exit status is 2 if the date format, or the rates, are not valid.
+    """
+
+    # Auxiliary variables.
+    path = tmp_path / "dates.txt"
+
+    assert tc.main(argv[:2] + [str(path)] + argv[2:]) == status
+    if status == 0:
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 10
@@ -0,0 +1,75 @@
+"""
+    File that contains the tests of the differential testing harness.
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+import pytest
+
+# User defined.
+import date_validator.testing.testing_differential as tdf
+import date_validator.validation.validation_regex as vr
+
+# ##############################################################################
+# Classes
+# ##############################################################################
+
+
+class BrokenMatcher(vr.RegexMatcher):
+    """
+        Class that accepts every date, to be caught by the harness.
+    """
+
+    def validate(self, date):
+        """
+            Accepts the date.
+
+            :param date: The string, or bytes, that contains the date.
+
+            :return: True, always.
+        """
+        return True
+
+# ##############################################################################
+# Tests
+# ##############################################################################
+
+
+@pytest.mark.parametrize("seed", (0, 1))
+def test_run_all(seed):
+    """
+        Every engine agrees with the reference.
+    """
+
+    # Auxiliary variables.
+    report = tdf.run_all(count=4, seed=seed)
+
+    assert report.formats > 0
+    assert report.comparisons > 0
+    assert not report.disagreements
+
+
+def test_main(capsys):
+    """
+        The exit status is 0, if every engine agrees, and 2, if the date
+        format is not valid.
+    """
+
+    assert tdf.main(["--dformat", "YYYY-MM-DD", "--count", "20"]) == 0
+    assert tdf.main(["--dformat", "YYYY-YY", "--count", "20"]) == 2
+
+
+def test_main_disagreement(monkeypatch, capsys):
+    """
+        The exit status is 1, if an engine disagrees with the reference.
+    """
+
+    # Use the broken matcher.
+    monkeypatch.setitem(tdf.MATCHERS, "regex", BrokenMatcher)
+
+    assert tdf.main([
+        "--dformat", "YYYY-MM-DD", "--count", "20", "--engines", "regex"
+    ]) == 1
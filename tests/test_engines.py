@@ -0,0 +1,149 @@
+"""
+    File that contains the tests of the engines that validate the dates.
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+import pytest
+
+# User defined.
+import date_validator.utilities.utilities_calendar as uc
+import date_validator.validation.validation_cache as vca
+import date_validator.validation.validation_codegen as vc
+import date_validator.validation.validation_date as dv
+import date_validator.validation.validation_regex as vr
+import date_validator.validation.validation_stream as vs
+import date_validator.validation.validation_vectorized as vv
+
+# ##############################################################################
+# Constants
+# ##############################################################################
+
+# The engines that validate a single date.
+ENGINES = (
+    dv.FormatMatcher, vr.RegexMatcher, vc.GeneratedMatcher, vs.StreamMatcher,
+    vca.CachedMatcher,
+)
+
+# The dates, valid and invalid, in the YYYYMMDD format.
+DATES = ("20200229", "20190229", "2020022", "20201301")
+
+# ##############################################################################
+# Classes
+# ##############################################################################
+
+
+class Date(str):
+    """
+        Class that is a subclass of str, as the strings of other packages.
+    """
+
+# ##############################################################################
+# Tests
+# ##############################################################################
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_str_subclass(engine):
+    """
+        The subclasses of str are validated as strings.
+    """
+
+    # Auxiliary variables.
+    matcher = engine("YYYYMMDD", False)
+
+    for date in DATES:
+        assert matcher.validate(Date(date)) == matcher.validate(date)
+
+
+def test_str_subclass_reason():
+    """
+        The subclasses of str are checked as strings.
+    """
+
+    # Auxiliary variables.
+    matcher = dv.FormatMatcher("YYYYMMDD", False)
+
+    for date in DATES:
+        assert matcher.reason(Date(date)) == matcher.reason(date)
+
+
+def test_numpy_array():
+    """
+        The elements of the NumPy arrays of 'U' type are validated as strings.
+    """
+
+    # Auxiliary variables.
+    np = pytest.importorskip("numpy")
+
+    assert list(dv.validate_many(np.array(DATES), "YYYYMMDD", False)) == [
+        1, 0, 0, 0
+    ]
+    assert dv.count_reasons(np.array(DATES), "YYYYMMDD", False)[0] == 1
+
+
+@pytest.mark.parametrize("engine", ENGINES + (vv.VectorizedMatcher,))
+def test_leap_year(engine):
+    """
+        The leap years are the ones of the calendar utilities.
+    """
+
+    # The vectorized matcher requires NumPy.
+    if engine is vv.VectorizedMatcher:
+        pytest.importorskip("numpy")
+
+    # Auxiliary variables.
+    matcher = engine("YYYY-DDD", False)
+
+    for year in (1900, 2019, 2020):
+        expected = uc.is_leap_year(year)
+        assert bool(matcher.validate(f"{year}-366")) == expected
+        assert bool(matcher.validate(f"{year}-365"))
+
+
+def test_parse_matcher():
+    """
+        The date validators share the matcher of their date format.
+    """
+
+    # Auxiliary variables.
+    matcher = dv.get_matcher("YYYYMMDD", False)
+
+    assert dv.get_matcher("YYYYMMDD", False) is matcher
+    assert dv.DateValidator("20200229", "YYYYMMDD", False).parse() == (
+        matcher.parse("20200229")
+    )
+    assert dv.DateValidator("20190229", "YYYYMMDD", False).parse() is None
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_max_size(engine):
+    """
+        The maximum size never rejects the valid dates.
+    """
+
+    # Auxiliary variables.
+    matcher = engine("YYYYMMDD", False, max_size=4)
+
+    assert matcher.validate("20200229")
+    assert not matcher.validate("20200229" * 4)
+
+
+def test_max_size_cached():
+    """
+        The cached matcher gives the maximum size to the matcher it wraps.
+    """
+
+    # Auxiliary variables.
+    sizes = []
+
+    def engine_0(dformat, ampm, max_size=None):
+        sizes.append(max_size)
+        return dv.FormatMatcher(dformat, ampm, max_size)
+
+    vca.CachedMatcher("YYYYMMDD", False, engine_0, max_size=16)
+
+    assert sizes == [16]
@@ -0,0 +1,117 @@
+"""
+    File that contains the tests of the functions that validate the dates in
+    files.
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+import pytest
+
+# User defined.
+import date_validator.errors.errors_general as eg
+import date_validator.validation.validation_files as vf
+
+# ##############################################################################
+# Constants
+# ##############################################################################
+
+# The lines of the file, in the YYYY-MM-DD format.
+LINES = ("2020-02-29", "2019-02-29", "2021-12-31", "2021-13-01")
+
+# ##############################################################################
+# Fixtures
+# ##############################################################################
+
+
+@pytest.fixture
+def path(tmp_path):
+    """
+        The path to a file with one date per line.
+    """
+
+    # Auxiliary variables.
+    path = tmp_path / "dates.txt"
+    path.write_text("\n".join(LINES) + "\n", encoding="utf-8")
+
+    return str(path)
+
+# ##############################################################################
+# Tests
+# ##############################################################################
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_validate_file(path, workers):
+    """
+        The dates are validated in order, in one or several processes.
+    """
+
+    assert vf.validate_file(
+        path, "YYYY-MM-DD", False, workers=workers, chunk_size=1
+    ) == bytearray((1, 0, 1, 0))
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_validate_file_invalid_format(path, workers):
+    """
+        The format errors are raised in the current process.
+    """
+
+    with pytest.raises(eg.LazyMessageError):
+        vf.validate_file(path, "YYYY-YY", False, workers=workers, chunk_size=1)
+
+
+@pytest.mark.parametrize("encoding", ("utf-16", "utf-32-le"))
+def test_validate_file_invalid_encoding(path, encoding):
+    """
+        The encodings that are not compatible with ASCII are rejected.
+    """
+
+    with pytest.raises(ValueError):
+        vf.validate_file(path, "YYYY-MM-DD", False, encoding=encoding)
+
+
+def test_validate_file_encoding(tmp_path):
+    """
+        The lines are decoded with the given encoding.
+    """
+
+    # Auxiliary variables.
+    path = tmp_path / "dates.txt"
+    path.write_text("2020é02é29\n2019é02é29\n", encoding="latin-1")
+
+    assert vf.validate_file(
+        str(path), "YYYYéMMéDD", False, workers=1, encoding="latin-1"
+    ) == bytearray((1, 0))
+
+
+@pytest.mark.parametrize("length", (None, 10, 11))
+def test_scan_records(tmp_path, length):
+    """
+        The records with invalid dates are found, with the requested length.
+    """
+
+    # Auxiliary variables.
+    path = tmp_path / "records.bin"
+    path.write_bytes(b"".join(b"id" + line.encode() + b" " for line in LINES))
+    expected = [1, 3] if length != 11 else [0, 1, 2, 3]
+
+    assert vf.scan_records(
+        str(path), "YYYY-MM-DD", False, 13, offset=2, length=length
+    ) == expected
+
+
+def test_scan_records_misfit(tmp_path):
+    """
+        The dates that don't fit in the record are rejected.
+    """
+
+    # Auxiliary variables.
+    path = tmp_path / "records.bin"
+    path.write_bytes(b"2020-02-29")
+
+    with pytest.raises(ValueError):
+        vf.scan_records(str(path), "YYYY-MM-DD", False, 10, offset=1)
@@ -0,0 +1,93 @@
+"""
+    File that contains the tests of the checks of the date formats, and of
+    their exceptions.
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+import pytest
+
+# User defined.
+import date_validator.errors.errors_format as ef
+import date_validator.errors.errors_general as eg
+import date_validator.validation.validation_format as vf
+
+# ##############################################################################
+# Constants
+# ##############################################################################
+
+# The exception raised for each code of a date format check.
+ERRORS = {
+    vf.FormatCode.EMPTY: ef.EmptyFormatError,
+    vf.FormatCode.REPEATED: ef.RepeatedFieldsError,
+    vf.FormatCode.FIELD: ef.FieldFormatError,
+    vf.FormatCode.AMPM: ef.AmPmFormatError,
+    vf.FormatCode.DAY: ef.DayFormatError,
+    vf.FormatCode.MINUTES: ef.MinutesFormatError,
+    vf.FormatCode.SECONDS: ef.SecondsFormatError,
+    vf.FormatCode.TENTHS: ef.TenthsFormatError,
+}
+
+# ##############################################################################
+# Tests
+# ##############################################################################
+
+
+@pytest.mark.parametrize("dformat, ampm, code", (
+    ("YYYY-MM-DD hh:mm:ss:t", False, vf.FormatCode.VALID),
+    ("YYYY-MMM-DD hh:mmii", True, vf.FormatCode.VALID),
+    ("x", False, vf.FormatCode.EMPTY),
+    ("YYYY-YYYY", False, vf.FormatCode.REPEATED),
+    ("YYYY-MMMM", False, vf.FormatCode.FIELD),
+    ("hh:mm", True, vf.FormatCode.AMPM),
+    ("YYYY-DD", False, vf.FormatCode.DAY),
+    ("YYYY-MM-DD mm", False, vf.FormatCode.MINUTES),
+    ("YYYY-MM-DD hh:ss", False, vf.FormatCode.SECONDS),
+    ("YYYY-MM-DD hh:mm:t", False, vf.FormatCode.TENTHS),
+))
+def test_check_format(dformat, ampm, code):
+    """
+        The format checks agree with the exceptions of the FormatValidator.
+    """
+
+    assert vf.check_format(dformat, ampm).code == code
+
+    # The valid date formats are compiled.
+    if code == vf.FormatCode.VALID:
+        vf.FormatValidator(dformat, ampm)
+        return
+
+    with pytest.raises(ERRORS[code]) as info:
+        vf.FormatValidator(dformat, ampm)
+
+    assert isinstance(info.value, eg.LazyMessageError)
+    assert str(info.value).strip()
+
+
+def test_check_formats():
+    """
+        The date formats are checked in order.
+    """
+
+    assert [check.code for check in vf.check_formats(
+        ("YYYY", "", "YYYY-YYYY"), False
+    )] == [vf.FormatCode.VALID, vf.FormatCode.EMPTY, vf.FormatCode.REPEATED]
+
+
+def test_lazy_message():
+    """
+        The message is rendered once, when it is read, unless it is replaced.
+    """
+
+    # Auxiliary variables.
+    error = ef.RepeatedFieldsError(("YYYY", "YYYY"))
+
+    assert "YYYY" in str(error)
+    assert error.args == (str(error),)
+    assert "YYYY" in repr(error)
+
+    error.args = ("replaced",)
+    assert str(error) == "replaced"
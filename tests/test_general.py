@@ -0,0 +1,62 @@
+"""
+    File that contains the tests of the functions that validate the fields of
+    the dates.
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+import pytest
+
+# User defined.
+import date_validator.validation.validation_date as dv
+import date_validator.validation.validation_general as vg
+
+# ##############################################################################
+# Tests
+# ##############################################################################
+
+
+@pytest.mark.parametrize("date, ampm, reason", (
+    ("2020-02-29 12:00m", True, vg.Reason.VALID),
+    ("0000-xx-29 12:00am", True, vg.Reason.YEAR),
+    ("2021-02-29 12:00am", True, vg.Reason.DAY),
+    ("2021-02-28 xx:00xx", True, vg.Reason.MERIDIEM),
+    ("2021-02-28 11:00m", True, vg.Reason.HOUR),
+    ("2021-02-28 xx:00am", True, vg.Reason.HOUR),
+    ("2021-02-28 11:60am", True, vg.Reason.MINUTES),
+    ("2021-02-28 24:00", False, vg.Reason.HOUR),
+    ("2021-13-28 xx:00", False, vg.Reason.MONTH),
+))
+def test_reason(date, ampm, reason):
+    """
+        The reason is the first check the date fails, as for DateValidator.
+    """
+
+    # Auxiliary variables.
+    dformat = "YYYY-MM-DD hh:mmii" if ampm else "YYYY-MM-DD hh:mm"
+    matcher = dv.FormatMatcher(dformat, ampm)
+
+    assert matcher.reason(date) == reason
+    assert matcher.reason(date.encode()) == reason
+    assert dv.DateValidator(date, dformat, ampm).reason() == reason
+    assert (matcher.parse(date) is None) == (reason != vg.Reason.VALID)
+
+
+def test_check_values():
+    """
+        The values that are not given are not checked.
+    """
+
+    # Auxiliary variables.
+    values = [None] * 9
+
+    assert vg.check_values(values, False) == vg.Reason.VALID
+
+    values[3] = 366
+    assert vg.check_values(values, False) == vg.Reason.VALID
+
+    values[0] = 2021
+    assert vg.check_values(values, False) == vg.Reason.DAY_OF_YEAR
@@ -0,0 +1,90 @@
+"""
+    File that contains the tests of the command line interface.
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+import pytest
+
+# User defined.
+import date_validator.__main__ as dm
+
+# ##############################################################################
+# Fixtures
+# ##############################################################################
+
+
+@pytest.fixture
+def path(tmp_path):
+    """
+        The path to a file with one date per line.
+    """
+
+    # Auxiliary variables.
+    path = tmp_path / "dates.txt"
+    path.write_bytes(b"2020-02-29\n2019-02-29\r\n2021-12-31\n")
+
+    return path
+
+# ##############################################################################
+# Tests
+# ##############################################################################
+
+
+@pytest.mark.parametrize("engine", sorted(dm.ENGINES))
+def test_main(path, engine, capsys):
+    """
+        The valid and invalid lines are written to their files.
+    """
+
+    # Auxiliary variables.
+    valid = path.with_name("valid.txt")
+    invalid = path.with_name("invalid.txt")
+
+    assert dm.main([
+        "YYYY-MM-DD", str(path), "--engine", engine, "--valid", str(valid),
+        "--invalid", str(invalid)
+    ]) == 0
+    assert valid.read_bytes() == b"2020-02-29\n2021-12-31\n"
+    assert invalid.read_bytes() == b"2019-02-29\r\n"
+
+
+def test_main_numbers(path, capsys):
+    """
+        The line numbers are written, to a shared file, with a cache.
+    """
+
+    # Auxiliary variables.
+    output = path.with_name("output.txt")
+
+    assert dm.main([
+        "YYYY-MM-DD", str(path), "--numbers", "--cache", "8", "--valid",
+        str(output), "--invalid", str(output)
+    ]) == 0
+    assert output.read_bytes().split() == [b"1", b"2", b"3"]
+
+
+@pytest.mark.parametrize("argv", (
+    ["YYYY-YY"],
+    ["YYYY-MM-DD", "--encoding", "unknown"],
+    ["YYYY-MM-DD", "--valid", "/nonexistent/valid.txt"],
+))
+def test_main_errors(path, argv, capsys):
+    """
+        The exit status is 2 if the date format, or the encoding, is not
+        valid, or a file cannot be opened.
+    """
+
+    assert dm.main(argv[:1] + [str(path)] + argv[1:]) == 2
+    assert capsys.readouterr().err.strip()
+
+
+def test_main_missing(tmp_path, capsys):
+    """
+        The exit status is 2 if the input file doesn't exist.
+    """
+
+    assert dm.main(["YYYY-MM-DD", str(tmp_path / "missing.txt")]) == 2
@@ -0,0 +1,81 @@
+"""
+    File that contains the tests of the profiling of the validation stages.
+"""
+
+# ##############################################################################
+# Imports
+# ##############################################################################
+
+# General.
+import pytest
+
+# User defined.
+import date_validator.validation.validation_date as dv
+import date_validator.validation.validation_profile as vp
+
+# ##############################################################################
+# Fixtures
+# ##############################################################################
+
+
+@pytest.fixture
+def profile():
+    """
+        Enables the profiling, and disables it once the test is done.
+    """
+
+    vp.reset()
+    vp.enable()
+    yield
+    vp.disable()
+    vp.reset()
+
+# ##############################################################################
+# Tests
+# ##############################################################################
+
+
+def test_snapshot(profile):
+    """
+        Every stage that was run is counted, per date format.
+    """
+
+    # Validate the dates.
+    assert dv.DateValidator("2020-02-29", "YYYY-MM-DD", False)()
+    assert not dv.DateValidator("2019-02-29", "YYYY-MM-DD", False)()
+
+    # Auxiliary variables.
+    stats = vp.snapshot()["YYYY-MM-DD"]
+
+    assert stats["compile"].count == 2
+    assert stats["tokenize"].count == 2
+    assert stats["validate_day"].count == 2
+    assert all(stage in vp.STAGES for stage in stats)
+    assert all(stat.nanoseconds >= 0 for stat in stats.values())
+
+
+def test_disable():
+    """
+        The original stages are put back, and nothing is recorded.
+    """
+
+    # Auxiliary variables.
+    originals = {
+        attribute: dv.DateValidator.__dict__[attribute]
+        for attribute in vp.STAGES.values()
+    }
+
+    vp.reset()
+    vp.enable()
+    vp.enable()
+    assert vp.is_enabled()
+
+    vp.disable()
+    assert not vp.is_enabled()
+    assert all(
+        dv.DateValidator.__dict__[attribute] is original
+        for attribute, original in originals.items()
+    )
+
+    assert dv.DateValidator("2020-02-29", "YYYY-MM-DD", False)()
+    assert vp.snapshot() == {}